@@ -4,50 +4,166 @@ Converts old .doc files to .docx format while preserving structure
 Also supports ODT and RTF files using Python libraries
 """
 
+import codecs
+import hashlib
+import io
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import tempfile
+import zipfile
+from functools import lru_cache
 from pathlib import Path
 
-# Import Python-based converters
-try:
-    from odf import text, teletype
-    from odf.opendocument import load as load_odt
-    HAS_ODFPY = True
-except ImportError:
-    HAS_ODFPY = False
-
-try:
-    from striprtf.striprtf import rtf_to_text
-    HAS_STRIPRTF = True
-except ImportError:
-    HAS_STRIPRTF = False
-
-try:
-    from docx import Document
-    from docx.shared import Pt
-    HAS_PYTHON_DOCX = True
-except ImportError:
-    HAS_PYTHON_DOCX = False
+# Python-based converters are imported lazily on first use, so processes that
+# only convert .doc files through LibreOffice never pay their import cost
+
+@lru_cache(maxsize=None)
+def _import_striprtf():
+    """Return striprtf's rtf_to_text, or None if not installed"""
+    try:
+        from striprtf.striprtf import rtf_to_text
+        return rtf_to_text
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=None)
+def _import_charset_normalizer():
+    """Return charset-normalizer's from_bytes, or None if not installed"""
+    try:
+        from charset_normalizer import from_bytes
+        return from_bytes
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=None)
+def _import_python_docx():
+    """Return python-docx's Document factory, or None if not installed"""
+    try:
+        from docx import Document
+        return Document
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=None)
+def _default_docx_template_bytes():
+    """Raw bytes of python-docx's blank default.docx, read from disk once"""
+    import docx
+    return Path(docx.__path__[0], 'templates', 'default.docx').read_bytes()
+
+def _new_docx_document(Document):
+    """Create a blank document from the in-memory default template"""
+    return Document(io.BytesIO(_default_docx_template_bytes()))
+
+# Common LibreOffice executable locations, tried in order
+_LIBREOFFICE_PATHS = [
+    'libreoffice',
+    '/usr/bin/libreoffice',
+    '/opt/libreoffice/program/soffice',
+    'soffice'
+]
+
+# Content-addressed store of finished conversions (keyed by source sha256)
+_CONVERSION_CACHE_DIR = os.getenv(
+    'DOC_CONVERSION_CACHE_DIR',
+    os.path.join(tempfile.gettempdir(), 'resumeformatter_docx_cache')
+)
+# Size cap for that store; least recently used entries are pruned past either limit
+_CONVERSION_CACHE_MAX_ENTRIES = int(os.getenv('DOC_CONVERSION_CACHE_MAX_ENTRIES', '200'))
+_CONVERSION_CACHE_MAX_BYTES = int(os.getenv('DOC_CONVERSION_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+
+# Non-empty line matcher (covers \n, \r\n and bare \r line endings)
+_LINE_RE = re.compile(r'[^\r\n]+')
+
+# RTF code page declaration, e.g. \ansicpg1252
+_RTF_ANSICPG_RE = re.compile(rb'\\ansicpg(\d+)')
+
+# OpenDocument text namespace tags
+_ODF_TEXT_NS = 'urn:oasis:names:tc:opendocument:xmlns:text:1.0'
+_ODF_P = f'{{{_ODF_TEXT_NS}}}p'
+_ODF_S = f'{{{_ODF_TEXT_NS}}}s'
+_ODF_TAB = f'{{{_ODF_TEXT_NS}}}tab'
+_ODF_LINE_BREAK = f'{{{_ODF_TEXT_NS}}}line-break'
+
+def _extract_odf_text(element):
+    """Flatten an ODF element to text, expanding <text:s>, <text:tab> and <text:line-break>"""
+    parts = [element.text or '']
+    for child in element:
+        tag = child.tag
+        if tag == _ODF_LINE_BREAK:
+            parts.append('\n')
+        elif tag == _ODF_TAB:
+            parts.append('\t')
+        elif tag == _ODF_S:
+            parts.append(' ' * int(child.get(f'{{{_ODF_TEXT_NS}}}c') or 1))
+        elif isinstance(tag, str):
+            parts.append(_extract_odf_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+def _iter_odt_paragraph_texts(odt_path):
+    """Stream the text of every <text:p> in an ODT's content.xml, in document order"""
+    from lxml import etree
+
+    with zipfile.ZipFile(odt_path) as odt_zip, odt_zip.open('content.xml') as content:
+        for _, para in etree.iterparse(content, events=('end',), tag=_ODF_P):
+            yield _extract_odf_text(para)
+
+            # Free finished top-level paragraphs (nested ones are still needed by their parent)
+            if next(para.iterancestors(_ODF_P), None) is None:
+                para.clear(keep_tail=True)
+                while para.getprevious() is not None:
+                    del para.getparent()[0]
+
+def _detect_rtf_encoding(data):
+    """
+    Pick the text encoding for raw RTF bytes
+    Order: the declared \\ansicpgNNNN code page, valid UTF-8 in the first 64 KiB,
+    charset-normalizer on the first 8 KiB, then cp1252 (Word's default)
+    """
+    match = _RTF_ANSICPG_RE.search(data, 0, 8192)
+    if match:
+        try:
+            return codecs.lookup(f"cp{int(match.group(1))}").name
+        except LookupError:
+            pass
+
+    # Bounded probe; final=False tolerates a multi-byte character cut off at the boundary
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(data[:65536], final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    from_bytes = _import_charset_normalizer()
+    if from_bytes:
+        best = from_bytes(bytes(data[:8192])).best()
+        if best and best.encoding != 'ascii':
+            return best.encoding
+
+    return 'cp1252'
+
+def _append_text_paragraph(body, para_text):
+    """Append a single-run paragraph straight onto the <w:body> element"""
+    body.add_p().add_r().text = para_text
 
 def _convert_odt_to_docx_python(odt_path, docx_path):
     """Convert ODT to DOCX using Python libraries"""
     try:
-        if not HAS_ODFPY or not HAS_PYTHON_DOCX:
+        Document = _import_python_docx()
+        if not Document:
             return False
 
-        # Load ODT file
-        odt_doc = load_odt(odt_path)
-
         # Create new DOCX document
-        docx_doc = Document()
+        docx_doc = _new_docx_document(Document)
+        body = docx_doc.element.body
 
-        # Extract text from ODT
-        all_paragraphs = odt_doc.getElementsByType(text.P)
-        for para in all_paragraphs:
-            para_text = teletype.extractText(para)
+        # Stream paragraphs out of the ODT and build the DOCX XML directly
+        for para_text in _iter_odt_paragraph_texts(odt_path):
             if para_text.strip():
-                docx_doc.add_paragraph(para_text)
+                _append_text_paragraph(body, para_text)
 
         # Save DOCX
         docx_doc.save(docx_path)
@@ -59,23 +175,32 @@ def _convert_odt_to_docx_python(odt_path, docx_path):
 def _convert_rtf_to_docx_python(rtf_path, docx_path):
     """Convert RTF to DOCX using Python libraries"""
     try:
-        if not HAS_STRIPRTF or not HAS_PYTHON_DOCX:
+        rtf_to_text = _import_striprtf()
+        Document = _import_python_docx()
+        if not rtf_to_text or not Document:
             return False
 
-        # Read RTF file
-        with open(rtf_path, 'r', encoding='utf-8', errors='ignore') as f:
-            rtf_content = f.read()
+        # Read RTF file through a read-only memory map (no intermediate buffered copy)
+        rtf_content = ''
+        encoding = 'cp1252'
+        with open(rtf_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    encoding = _detect_rtf_encoding(mm)
+                    rtf_content = str(mm, encoding, 'ignore')
 
-        # Convert RTF to plain text
-        plain_text = rtf_to_text(rtf_content)
+        # Convert RTF to plain text (\'xx escapes use the same code page)
+        plain_text = rtf_to_text(rtf_content, encoding=encoding if encoding != 'utf-8' else 'cp1252')
 
         # Create new DOCX document
-        docx_doc = Document()
+        docx_doc = _new_docx_document(Document)
+        body = docx_doc.element.body
 
         # Add paragraphs
-        for line in plain_text.split('\n'):
-            if line.strip():
-                docx_doc.add_paragraph(line.strip())
+        for match in _LINE_RE.finditer(plain_text):
+            line = match.group().strip()
+            if line:
+                _append_text_paragraph(body, line)
 
         # Save DOCX
         docx_doc.save(docx_path)
@@ -110,36 +235,23 @@ def convert_doc_to_docx(doc_file_path):
         doc_path = Path(doc_file_path)
         docx_path = doc_path.with_suffix('.docx')
         
+        # Already converted and up to date? Skip the pipeline entirely
+        if _is_fresh_conversion(doc_path, docx_path):
+            print(f"✅ Up-to-date conversion already exists: {docx_path}")
+            return str(docx_path)
+        
         # Get file extension for display
         file_ext = doc_path.suffix.upper()
         print(f"🔄 Converting {file_ext} to DOCX: {doc_path.name} → {docx_path.name} (preserving structure)...")
 
-        # Special handling for ODT and RTF - try Python libraries first (no external dependencies)
-        if ext.endswith('.odt'):
-            print(f"  Trying Python-based ODT conversion...")
-            if _convert_odt_to_docx_python(doc_file_path, str(docx_path)):
-                print(f"✅ Successfully converted using Python (odfpy): {docx_path}")
-                return str(docx_path)
-
-        if ext.endswith('.rtf'):
-            print(f"  Trying Python-based RTF conversion...")
-            if _convert_rtf_to_docx_python(doc_file_path, str(docx_path)):
-                print(f"✅ Successfully converted using Python (striprtf): {docx_path}")
-                return str(docx_path)
-
-        # Method 1: Try using LibreOffice (best for preserving structure)
-        if _convert_with_libreoffice(doc_file_path, str(docx_path)):
-            print(f"✅ Successfully converted using LibreOffice: {docx_path}")
-            return str(docx_path)
-
-        # Method 2: Try using pandoc (good structure preservation)
-        if _convert_with_pandoc(doc_file_path, str(docx_path)):
-            print(f"✅ Successfully converted using pandoc: {docx_path}")
+        # Same bytes converted before? Reuse the cached result
+        cache_path = _conversion_cache_path(doc_file_path)
+        if _restore_cached_conversion(cache_path, str(docx_path)):
+            print(f"✅ Reused cached conversion: {docx_path}")
             return str(docx_path)
 
-        # Method 3: Try using unoconv (if available)
-        if _convert_with_unoconv(doc_file_path, str(docx_path)):
-            print(f"✅ Successfully converted using unoconv: {docx_path}")
+        if _run_conversion_chain(doc_file_path, str(docx_path)):
+            _store_cached_conversion(cache_path, str(docx_path))
             return str(docx_path)
             
         print(f"❌ All conversion methods failed for: {doc_file_path}")
@@ -150,42 +262,139 @@ def convert_doc_to_docx(doc_file_path):
         print(f"❌ Error converting {doc_file_path}: {str(e)}")
         return None
 
+def _run_conversion_chain(doc_file_path, docx_path):
+    """Try each available converter in order; returns True on the first success"""
+    ext = doc_file_path.lower()
+
+    # Special handling for ODT and RTF - try Python libraries first (no external dependencies)
+    if ext.endswith('.odt'):
+        print(f"  Trying Python-based ODT conversion...")
+        if _convert_odt_to_docx_python(doc_file_path, docx_path):
+            print(f"✅ Successfully converted using Python (lxml): {docx_path}")
+            return True
+
+    if ext.endswith('.rtf'):
+        print(f"  Trying Python-based RTF conversion...")
+        if _convert_rtf_to_docx_python(doc_file_path, docx_path):
+            print(f"✅ Successfully converted using Python (striprtf): {docx_path}")
+            return True
+
+    # Method 1: Try using LibreOffice (best for preserving structure)
+    if _convert_with_libreoffice(doc_file_path, docx_path):
+        print(f"✅ Successfully converted using LibreOffice: {docx_path}")
+        return True
+
+    # Method 2: Try using pandoc (good structure preservation)
+    if _convert_with_pandoc(doc_file_path, docx_path):
+        print(f"✅ Successfully converted using pandoc: {docx_path}")
+        return True
+
+    # Method 3: Try using unoconv (if available)
+    if _convert_with_unoconv(doc_file_path, docx_path):
+        print(f"✅ Successfully converted using unoconv: {docx_path}")
+        return True
+
+    return False
+
+def _is_fresh_conversion(doc_path, docx_path):
+    """True if docx_path exists, is non-empty and is at least as new as doc_path"""
+    try:
+        docx_stat = docx_path.stat()
+    except OSError:
+        return False
+    return docx_stat.st_size > 0 and docx_stat.st_mtime >= doc_path.stat().st_mtime
+
+def _conversion_cache_path(doc_file_path):
+    """Cache location for a source file, keyed by the sha256 of its bytes and its extension"""
+    digest = hashlib.sha256()
+    with open(doc_file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    ext = Path(doc_file_path).suffix.lower().lstrip('.')
+    return os.path.join(_CONVERSION_CACHE_DIR, f"{digest.hexdigest()}_{ext}.docx")
+
+def _restore_cached_conversion(cache_path, docx_path):
+    """Copy a cached conversion to docx_path; returns False on a cache miss"""
+    try:
+        if os.path.getsize(cache_path) == 0:
+            return False
+        shutil.copyfile(cache_path, docx_path)
+        # Mark the entry as recently used for pruning
+        os.utime(cache_path)
+        return True
+    except OSError:
+        return False
+
+def _store_cached_conversion(cache_path, docx_path):
+    """Save a finished conversion into the cache (best effort, atomic publish)"""
+    try:
+        os.makedirs(_CONVERSION_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CONVERSION_CACHE_DIR, suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(docx_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  ⚠️  Could not cache conversion: {e}")
+        return
+    _prune_conversion_cache()
+
+def _prune_conversion_cache():
+    """Delete least recently used cache entries until the store is within its entry and byte caps"""
+    try:
+        entries = []
+        with os.scandir(_CONVERSION_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.docx'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+
+    entries.sort()
+    total_bytes = sum(size for _, size, _ in entries)
+    count = len(entries)
+    for _, size, path in entries:
+        if count <= _CONVERSION_CACHE_MAX_ENTRIES and total_bytes <= _CONVERSION_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        count -= 1
+        total_bytes -= size
+
 def _convert_with_libreoffice(doc_path, docx_path):
     """Try converting using LibreOffice headless mode"""
     try:
+        # LibreOffice can exit 0 without writing anything, so it gets a private, empty --outdir
+        # where an existing <stem>.docx can only be this run's output. The dir sits next to the
+        # destination, so the final move is a same-filesystem rename
+        outdir = str(Path(docx_path).parent)
+
         # Try common LibreOffice paths
-        libreoffice_paths = [
-            'libreoffice',
-            '/usr/bin/libreoffice',
-            '/opt/libreoffice/program/soffice',
-            'soffice'
-        ]
-        
-        for lo_path in libreoffice_paths:
+        for lo_path in _LIBREOFFICE_PATHS:
             try:
-                # Create temp directory for output
-                with tempfile.TemporaryDirectory() as temp_dir:
+                # Each run also gets its own user profile: with a shared one, a second soffice
+                # hands its job to the instance already running (e.g. another upload thread)
+                # and exits 0 without writing to its --outdir
+                with tempfile.TemporaryDirectory(dir=outdir) as temp_dir, \
+                        tempfile.TemporaryDirectory() as profile_dir:
                     # Run LibreOffice conversion
                     cmd = [
                         lo_path,
+                        f'-env:UserInstallation={Path(profile_dir).as_uri()}',
                         '--headless',
                         '--convert-to', 'docx',
                         '--outdir', temp_dir,
                         doc_path
                     ]
                     
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30)
+                    _log_converter_failure(cmd, result.returncode, result.stderr)
+                    
+                    if result.returncode == 0 and _finalize_libreoffice_output(temp_dir, doc_path, docx_path):
+                        return True
                     
-                    if result.returncode == 0:
-                        # Find the converted file
-                        doc_name = Path(doc_path).stem
-                        temp_docx = os.path.join(temp_dir, f"{doc_name}.docx")
-                        
-                        if os.path.exists(temp_docx):
-                            # Move to final location
-                            os.rename(temp_docx, docx_path)
-                            return True
-                            
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
                 continue
                 
@@ -194,11 +403,26 @@ def _convert_with_libreoffice(doc_path, docx_path):
     except Exception:
         return False
 
+def _finalize_libreoffice_output(temp_dir, doc_path, docx_path):
+    """Move LibreOffice's <stem>.docx out of its private temp_dir onto docx_path; True if it was written"""
+    lo_output = os.path.join(temp_dir, f"{Path(doc_path).stem}.docx")
+    if not os.path.exists(lo_output):
+        return False
+    os.replace(lo_output, docx_path)
+    return True
+
+def _log_converter_failure(cmd, returncode, stderr):
+    """Print an external converter's stderr, only when it exited non-zero"""
+    if returncode != 0 and stderr:
+        message = stderr.decode(errors='replace').strip()
+        print(f"  {Path(cmd[0]).name} exited with {returncode}: {message[:500]}")
+
 def _convert_with_unoconv(doc_path, docx_path):
     """Try converting using unoconv (LibreOffice command-line tool)"""
     try:
         cmd = ['unoconv', '-f', 'docx', '-o', docx_path, doc_path]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60)
+        _log_converter_failure(cmd, result.returncode, result.stderr)
         
         if result.returncode == 0 and os.path.exists(docx_path):
             return True
@@ -212,7 +436,8 @@ def _convert_with_pandoc(doc_path, docx_path):
     """Try converting using pandoc"""
     try:
         cmd = ['pandoc', '-f', 'doc', '-t', 'docx', '-o', docx_path, doc_path]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30)
+        _log_converter_failure(cmd, result.returncode, result.stderr)
         
         if result.returncode == 0 and os.path.exists(docx_path):
             return True
@@ -175,6 +175,13 @@ class EnhancedSectionClassifier:
         """Get cached zero-shot classifier"""
         return EnhancedSectionClassifier._zero_shot_classifier
     
+    def warmup(self):
+        """Run one throwaway inference per loaded model so the first real request skips cold-start costs"""
+        if self.sentence_model:
+            self.sentence_model.encode(["hello world"])
+        if self.zero_shot_classifier:
+            self.zero_shot_classifier("hello world", ["Skills"])
+    
     def normalize_section_name(self, section_name: str) -> Optional[str]:
         """
         Normalize a section name using synonym mapping
@@ -124,6 +124,13 @@ class IntelligentResumeParser:
         """Get cached spaCy model"""
         return IntelligentResumeParser._nlp
     
+    def warmup(self):
+        """Run one throwaway inference per loaded model so the first real request skips cold-start costs"""
+        if self.model:
+            self.model.encode(["hello world"])
+        if self.nlp:
+            self.nlp("hello world")
+    
     def parse_resume(self, candidate_docx_path: str, template_docx_path: str) -> Dict[str, str]:
         """
         Main function: Parse candidate resume and map to template structure
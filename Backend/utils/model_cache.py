@@ -4,15 +4,60 @@ This ensures the first request is fast by loading models during server initializ
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 # Global flag to track if models are pre-warmed
 _models_prewarmed = False
 
 
+def _warm_mapper():
+    """Load the optimized section mapper singleton and run a warmup inference"""
+    from utils.optimized_section_mapper import get_optimized_mapper
+    get_optimized_mapper().warmup()
+
+
+def _warm_classifier():
+    """Load the enhanced section classifier models and run a warmup inference"""
+    from utils.enhanced_section_classifier import EnhancedSectionClassifier
+    EnhancedSectionClassifier().warmup()
+
+
+def _warm_parser():
+    """Load the intelligent resume parser models and run a warmup inference"""
+    from utils.intelligent_resume_parser import IntelligentResumeParser
+    IntelligentResumeParser().warmup()
+
+
+def _warm_detector():
+    """Load the ML-backed section detector and run a warmup inference"""
+    from utils.section_detector import SectionDetector
+    SectionDetector(use_ml=True).warmup()
+
+
+# (label, loader) pairs run by prewarm_models
+_WARMERS = [
+    ('Optimized Section Mapper', _warm_mapper),
+    ('Enhanced Section Classifier', _warm_classifier),
+    ('Intelligent Resume Parser', _warm_parser),
+    ('Section Detector', _warm_detector),
+]
+
+
+def _timed_warm(warm):
+    """Run a single warmer, returning (elapsed_seconds, exception or None)"""
+    start = time.time()
+    try:
+        warm()
+        return time.time() - start, None
+    except Exception as e:
+        return time.time() - start, e
+
+
 def prewarm_models():
     """
     Pre-load all ML models at server startup for instant first request
+    Each model also runs one dummy inference so the first real call is warm
     Call this in app.py after imports
     """
     global _models_prewarmed
@@ -27,45 +72,17 @@ def prewarm_models():
     
     total_start = time.time()
     
-    # 1. Pre-warm optimized section mapper
-    try:
-        print("\n1️⃣  Pre-warming Optimized Section Mapper...")
-        start = time.time()
-        from utils.optimized_section_mapper import get_optimized_mapper
-        mapper = get_optimized_mapper()
-        print(f"   ✅ Section mapper ready in {time.time()-start:.2f}s")
-    except Exception as e:
-        print(f"   ⚠️  Failed to pre-warm section mapper: {e}")
-    
-    # 2. Pre-warm enhanced section classifier
-    try:
-        print("\n2️⃣  Pre-warming Enhanced Section Classifier...")
-        start = time.time()
-        from utils.enhanced_section_classifier import EnhancedSectionClassifier
-        classifier = EnhancedSectionClassifier()
-        print(f"   ✅ Section classifier ready in {time.time()-start:.2f}s")
-    except Exception as e:
-        print(f"   ⚠️  Failed to pre-warm classifier: {e}")
-    
-    # 3. Pre-warm intelligent resume parser
-    try:
-        print("\n3️⃣  Pre-warming Intelligent Resume Parser...")
-        start = time.time()
-        from utils.intelligent_resume_parser import IntelligentResumeParser
-        parser = IntelligentResumeParser()
-        print(f"   ✅ Resume parser ready in {time.time()-start:.2f}s")
-    except Exception as e:
-        print(f"   ⚠️  Failed to pre-warm parser: {e}")
-    
-    # 4. Pre-warm section detector
-    try:
-        print("\n4️⃣  Pre-warming Section Detector...")
-        start = time.time()
-        from utils.section_detector import SectionDetector
-        detector = SectionDetector(use_ml=True)
-        print(f"   ✅ Section detector ready in {time.time()-start:.2f}s")
-    except Exception as e:
-        print(f"   ⚠️  Failed to pre-warm detector: {e}")
+    # Model loads are dominated by file I/O and torch init (which release the
+    # GIL), so load them concurrently; each loader keeps its own error handling
+    with ThreadPoolExecutor(max_workers=len(_WARMERS)) as executor:
+        futures = {executor.submit(_timed_warm, warm): label for label, warm in _WARMERS}
+        for future in as_completed(futures):
+            label = futures[future]
+            elapsed, error = future.result()
+            if error is None:
+                print(f"   ✅ {label} ready in {elapsed:.2f}s")
+            else:
+                print(f"   ⚠️  Failed to pre-warm {label}: {error}")
     
     total_time = time.time() - total_start
     
@@ -151,6 +168,7 @@ def clear_model_cache():
         from utils.section_detector import SectionDetector
         if hasattr(SectionDetector, '_cached_model'):
             delattr(SectionDetector, '_cached_model')
+        SectionDetector._section_embeddings.clear()
     except:
         pass
     
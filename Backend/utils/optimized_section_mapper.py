@@ -151,6 +151,15 @@ class OptimizedSectionMapper:
         except Exception as e:
             print(f"⚠️  Failed to pre-compute embeddings: {e}")
     
+    def warmup(self):
+        """Run one throwaway inference so the first real request skips cold-start costs"""
+        if OptimizedSectionMapper._model is not None:
+            OptimizedSectionMapper._model.encode(
+                ["hello world"],
+                show_progress_bar=False,
+                convert_to_numpy=True
+            )
+    
     @lru_cache(maxsize=1000)
     def _get_embedding(self, text: str) -> Optional[np.ndarray]:
         """Get embedding with caching"""
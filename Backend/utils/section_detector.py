@@ -2,9 +2,136 @@
 Multi-Layer Section Detector
 Combines rule-based and ML-based approaches for accurate section detection
 """
+import os
 import re
+import time
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+# 'torch' (sentence-transformers, default) or 'onnx' (quantized ONNX Runtime build)
+SECTION_DETECTOR_BACKEND = os.getenv('SECTION_DETECTOR_BACKEND', 'torch').lower()
+
+# Directory holding an `optimum-cli export onnx --optimize O3 --quantize` export of
+# sentence-transformers/all-MiniLM-L6-v2 (model_quantized.onnx + tokenizer.json)
+SECTION_DETECTOR_ONNX_DIR = os.getenv(
+    'SECTION_DETECTOR_ONNX_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'all-MiniLM-L6-v2-onnx')
+)
+
+
+def _compile_keyword_regex(keywords: List[str]):
+    """Compile a list of literal keywords into one substring-matching alternation"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(kw) for kw in ordered))
+
+
+def _compile_header_regex(section_headers: Dict[str, List[str]]):
+    """
+    Compile all header phrases into a single overlapping-match regex.
+    Alternatives are ordered by section priority, so at any position the
+    highest-priority section wins; the lookahead reports every position.
+    Returns (compiled_regex, pattern -> section priority index)
+    """
+    priority = {}
+    for idx, patterns in enumerate(section_headers.values()):
+        for pattern in patterns:
+            priority.setdefault(pattern, idx)
+    ordered = sorted(priority, key=lambda p: (priority[p], -len(p)))
+    alternation = '|'.join(re.escape(p) for p in ordered)
+    return re.compile(f'(?=({alternation}))'), priority
+
+
+def _best_header_priority(line_lower: str, header_re, header_priority: Dict[str, int]):
+    """Lowest section priority index among header phrases found in line_lower, or None"""
+    best = None
+    for match in header_re.finditer(line_lower):
+        idx = header_priority[match.group(1)]
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    return best
+
+
+def _build_exact_header_map(header_re, header_priority: Dict[str, int], sections: List[str]) -> Dict[str, str]:
+    """
+    Map each header phrase to the section it resolves to when it is the whole line.
+    Resolution uses the full priority scan, e.g. 'project experience' -> 'employment'.
+    """
+    return {
+        pattern: sections[_best_header_priority(pattern, header_re, header_priority)]
+        for pattern in header_priority
+    }
+
+
+def _compile_header_line_regex(section_headers: Dict[str, List[str]]):
+    """
+    Compile a multiline regex matching every line that contains a header phrase.
+    Used as a bulk pre-filter; _detect_section_header makes the final call.
+    """
+    phrases = sorted({p for patterns in section_headers.values() for p in patterns}, key=len, reverse=True)
+    alternation = '|'.join(re.escape(p) for p in phrases)
+    return re.compile(f'^.*?(?:{alternation}).*$', re.MULTILINE | re.IGNORECASE)
+
+
+class _OnnxSentenceEncoder:
+    """
+    Minimal sentence-transformers compatible encoder over an int8 ONNX export
+    Mean-pools token embeddings the same way all-MiniLM-L6-v2 does
+    """
+    
+    MAX_SEQ_LENGTH = 256
+    
+    def __init__(self, model_dir: str):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+        
+        for model_file in ('model_quantized.onnx', 'model.onnx'):
+            model_path = os.path.join(model_dir, model_file)
+            if os.path.exists(model_path):
+                break
+        else:
+            raise FileNotFoundError(f"No ONNX model found in {model_dir}")
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self.session = ort.InferenceSession(model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, 'tokenizer.json'))
+        self.tokenizer.enable_padding()
+        self.tokenizer.enable_truncation(max_length=self.MAX_SEQ_LENGTH)
+    
+    def encode(self, sentences, batch_size=32, normalize_embeddings=False,
+               convert_to_numpy=True, show_progress_bar=False):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(sentences[start:start + batch_size])
+            input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {
+                'input_ids': input_ids,
+                'attention_mask': attention_mask,
+                'token_type_ids': np.zeros_like(input_ids),
+            }
+            hidden = self.session.run(None, {k: v for k, v in feeds.items() if k in self.input_names})[0]
+            
+            # Mean pooling over real (non-padding) tokens
+            weights = attention_mask[..., None].astype(hidden.dtype)
+            batches.append((hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None))
+        
+        embeddings = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        
+        return embeddings[0] if single else embeddings
+
+
 class SectionDetector:
     """
     Multi-layer section detection system
@@ -86,25 +213,59 @@ class SectionDetector:
         ]
     }
     
+    # Quick-check keywords for is_*_content helpers
+    EMPLOYMENT_VERBS = ['managed', 'developed', 'led', 'created', 'implemented', 'designed', 'built']
+    CERT_KEYWORDS = ['certified', 'certification', 'license', 'completed', 'issued']
+    SKILL_KEYWORDS = ['python', 'java', 'sql', 'aws', 'proficient', 'experienced']
+    
+    # Precompiled matchers (built once at class-load time)
+    _HEADER_RE, _HEADER_PRIORITY = _compile_header_regex(SECTION_HEADERS)
+    _HEADER_SECTIONS = list(SECTION_HEADERS.keys())
+    _HEADER_LINE_RE = _compile_header_line_regex(SECTION_HEADERS)
+    _PATTERN_TO_SECTION = _build_exact_header_map(_HEADER_RE, _HEADER_PRIORITY, _HEADER_SECTIONS)
+    _EMPLOYMENT_RE = _compile_keyword_regex(EMPLOYMENT_VERBS)
+    _CERT_RE = _compile_keyword_regex(CERT_KEYWORDS)
+    _SKILL_RE = _compile_keyword_regex(SKILL_KEYWORDS)
+    
+    # L2-normalized section-name embeddings, shared across instances
+    _section_embeddings = {}
+    
     def __init__(self, use_ml=False):
         self.use_ml = use_ml
         # Use singleton cached model for performance
         self.ml_model = None
         if use_ml:
             try:
-                from sentence_transformers import SentenceTransformer
                 # Check if model is already cached
                 if not hasattr(SectionDetector, '_cached_model'):
-                    print("  Loading OPTIMIZED ML section detector (all-MiniLM-L6-v2)...")
-                    import time
+                    print(f"  Loading OPTIMIZED ML section detector (all-MiniLM-L6-v2, {SECTION_DETECTOR_BACKEND})...")
                     start = time.time()
-                    SectionDetector._cached_model = SentenceTransformer('all-MiniLM-L6-v2', device='cpu')
+                    SectionDetector._cached_model = self._load_model()
                     print(f"  ML section detector loaded in {time.time()-start:.2f}s (cached)")
                 self.ml_model = SectionDetector._cached_model
+                # Encode known section names once so refinement only encodes the text
+                self._get_section_embeddings(self._HEADER_SECTIONS)
             except Exception as e:
                 print(f"  WARNING: ML model not available: {e}, using rule-based only")
                 self.use_ml = False
     
+    @staticmethod
+    def _load_model():
+        """Load the sentence encoder for the configured backend"""
+        if SECTION_DETECTOR_BACKEND == 'onnx':
+            try:
+                return _OnnxSentenceEncoder(SECTION_DETECTOR_ONNX_DIR)
+            except Exception as e:
+                print(f"  WARNING: ONNX section detector unavailable ({e}), falling back to PyTorch")
+        
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer('all-MiniLM-L6-v2', device='cpu')
+    
+    def warmup(self):
+        """Run one throwaway inference so the first real request skips cold-start costs"""
+        if self.use_ml and self.ml_model:
+            self.ml_model.encode("hello world", normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False)
+    
     def segment_resume(self, text: str) -> Dict[str, str]:
         """
         Layer 1: Rule-based boundary detection
@@ -112,58 +273,59 @@ class SectionDetector:
         """
         segments = {}
         current_section = None
-        current_lines = []
+        body_start = 0
         
-        lines = text.split('\n')
-        
-        for line in lines:
-            line_clean = line.strip()
-            if not line_clean:
+        # Only lines containing a known header phrase can be headers,
+        # so scan the whole text once instead of testing every line
+        for match in self._HEADER_LINE_RE.finditer(text):
+            detected_section = self._detect_section_header(match.group().strip())
+            if not detected_section:
                 continue
             
-            # Check if this line is a section header
-            detected_section = self._detect_section_header(line_clean)
+            # Save previous section
+            if current_section:
+                self._store_segment(segments, current_section, text[body_start:match.start()])
             
-            if detected_section:
-                # Save previous section
-                if current_section and current_lines:
-                    segments[current_section] = '\n'.join(current_lines).strip()
-                
-                # Start new section
-                current_section = detected_section
-                current_lines = []
-            else:
-                # Add line to current section
-                if current_section:
-                    current_lines.append(line)
+            # Start new section
+            current_section = detected_section
+            body_start = match.end()
         
         # Save last section
-        if current_section and current_lines:
-            segments[current_section] = '\n'.join(current_lines).strip()
+        if current_section:
+            self._store_segment(segments, current_section, text[body_start:])
         
         return segments
     
+    @staticmethod
+    def _store_segment(segments: Dict[str, str], section: str, body: str):
+        """Store a section body with blank lines dropped (skipped if empty)"""
+        lines = [line for line in body.split('\n') if line.strip()]
+        if lines:
+            segments[section] = '\n'.join(lines).strip()
+    
     def _detect_section_header(self, line: str) -> str:
         """
         Detect if a line is a section header
         Returns section name or None
         """
-        line_lower = line.lower().strip()
-        
         # Must be short (headers are typically < 50 chars)
         if len(line) > 50:
             return None
         
-        # Check against known headers
-        for section, patterns in self.SECTION_HEADERS.items():
-            for pattern in patterns:
-                if pattern in line_lower:
-                    # Additional validation: check if it's likely a header
-                    # Headers usually don't have periods or commas
-                    if '.' not in line and ',' not in line:
-                        return section
+        # Headers usually don't have periods or commas
+        if '.' in line or ',' in line:
+            return None
+        
+        line_lower = line.lower().strip()
+        
+        # Common case: the line is exactly a known header ("Education")
+        section = self._PATTERN_TO_SECTION.get(line_lower)
+        if section:
+            return section
         
-        return None
+        # Single C-level scan over all known headers; lowest priority index wins
+        best = _best_header_priority(line_lower, self._HEADER_RE, self._HEADER_PRIORITY)
+        return self._HEADER_SECTIONS[best] if best is not None else None
     
     def validate_section_content(self, section: str, content: str, confidence_threshold=0.6) -> Tuple[bool, float]:
         """
@@ -218,16 +380,15 @@ class SectionDetector:
             return candidate_sections[0] if candidate_sections else 'unknown'
         
         try:
-            # Create embeddings for text and section names
-            text_embedding = self.ml_model.encode(text)
-            section_embeddings = self.ml_model.encode(candidate_sections)
-            
-            # Calculate similarity scores
-            from sklearn.metrics.pairwise import cosine_similarity
-            similarities = cosine_similarity([text_embedding], section_embeddings)[0]
+            # Normalized embeddings: cosine similarity reduces to a dot product
+            text_embedding = self.ml_model.encode(
+                text, normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False
+            )
+            section_embeddings = self._get_section_embeddings(candidate_sections)
+            similarities = section_embeddings @ text_embedding
             
             # Return section with highest similarity
-            best_idx = similarities.argmax()
+            best_idx = int(similarities.argmax())
             confidence = similarities[best_idx]
             
             if confidence > 0.5:
@@ -237,6 +398,21 @@ class SectionDetector:
         
         return candidate_sections[0] if candidate_sections else 'unknown'
     
+    def _get_section_embeddings(self, sections: List[str]) -> np.ndarray:
+        """
+        Get normalized embeddings for section names as a matrix
+        Names not seen before are batch-encoded once and cached
+        """
+        cache = SectionDetector._section_embeddings
+        missing = [s for s in dict.fromkeys(sections) if s not in cache]
+        if missing:
+            embeddings = self.ml_model.encode(
+                missing, batch_size=32, normalize_embeddings=True,
+                convert_to_numpy=True, show_progress_bar=False
+            )
+            cache.update(zip(missing, embeddings))
+        return np.stack([cache[s] for s in sections])
+    
     def detect_and_validate(self, text: str) -> Dict[str, Dict]:
         """
         Complete multi-layer detection and validation
@@ -301,15 +477,11 @@ class SectionDetector:
     
     def is_employment_content(self, text: str) -> bool:
         """Quick check if text looks like employment content"""
-        text_lower = text.lower()
-        employment_verbs = ['managed', 'developed', 'led', 'created', 'implemented', 'designed', 'built']
-        return any(verb in text_lower for verb in employment_verbs)
+        return self._EMPLOYMENT_RE.search(text.lower()) is not None
     
     def is_certification_content(self, text: str) -> bool:
         """Quick check if text looks like certification content"""
-        text_lower = text.lower()
-        cert_keywords = ['certified', 'certification', 'license', 'completed', 'issued']
-        return any(kw in text_lower for kw in cert_keywords)
+        return self._CERT_RE.search(text.lower()) is not None
     
     def is_skills_content(self, text: str) -> bool:
         """Quick check if text looks like skills content"""
@@ -317,9 +489,7 @@ class SectionDetector:
         if ',' in text and len(text) < 200:
             return True
         # Check for common skill keywords
-        text_lower = text.lower()
-        skill_keywords = ['python', 'java', 'sql', 'aws', 'proficient', 'experienced']
-        return any(kw in text_lower for kw in skill_keywords)
+        return self._SKILL_RE.search(text.lower()) is not None
 
 # Global instance - using rule-based only for faster startup
 section_detector = SectionDetector(use_ml=False)
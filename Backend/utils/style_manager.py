@@ -1,68 +1,225 @@
 """
 Style Manager - Preserves and applies Word document formatting
 Ensures alignment, fonts, colors, and styles are maintained during content replacement
+
+Captured styles (ParaStyle/RunStyle) are immutable, interned namedtuples: share them
+by reference, never copy them.
 """
+import re
+from collections import namedtuple
+from copy import deepcopy
 from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-import copy
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING, WD_UNDERLINE
+from docx.oxml import OxmlElement
+from docx.oxml.simpletypes import ST_HexColorAuto
+from docx.text.font import Font
+
+# Captured styles are immutable tuples; identical ones are interned and shared
+ParaStyle = namedtuple('ParaStyle', [
+    'alignment', 'space_before', 'space_after', 'line_spacing',
+    'left_indent', 'right_indent', 'first_line_indent',
+    'keep_together', 'keep_with_next', 'runs'
+])
+RunStyle = namedtuple('RunStyle', [
+    'font_name', 'font_size', 'bold', 'italic', 'underline', 'color',
+    'all_caps', 'small_caps', 'strike', 'superscript', 'subscript'
+])
+
+# Shared styles for elements with no direct formatting (no <w:pPr> and no runs,
+# or a run without <w:rPr>); these are the interned instances for those values
+_EMPTY_STYLE = ParaStyle(*(None,) * 9, runs=())
+_DEFAULT_RUN_STYLE = RunStyle(*(None,) * 11)
+
+_para_intern = {_EMPTY_STYLE: _EMPTY_STYLE}
+_run_intern = {_DEFAULT_RUN_STYLE: _DEFAULT_RUN_STYLE}
+
+# ParaStyle fields written onto paragraph_format (names match ParagraphFormat attributes)
+_PARA_FORMAT_FIELDS = (
+    'alignment', 'space_before', 'space_after', 'line_spacing',
+    'left_indent', 'right_indent', 'first_line_indent',
+    'keep_together', 'keep_with_next'
+)
+
+# (RunStyle field, Font attribute) pairs written onto runs; color is
+# handled separately because it is set through font.color.rgb
+_RUN_FONT_SETTERS = (
+    ('font_name', 'name'),
+    ('font_size', 'size'),
+    ('bold', 'bold'),
+    ('italic', 'italic'),
+    ('underline', 'underline'),
+    ('all_caps', 'all_caps'),
+    ('small_caps', 'small_caps'),
+    ('strike', 'strike'),
+    ('superscript', 'superscript'),
+    ('subscript', 'subscript'),
+)
+
+# Common section keywords to look for (earlier sections take priority)
+SECTION_KEYWORDS = {
+    'name': ['<NAME>', '<CANDIDATE NAME>', 'NAME'],
+    'summary': ['SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE'],
+    'employment': ['EMPLOYMENT HISTORY', 'WORK EXPERIENCE', 'EXPERIENCE'],
+    'education': ['EDUCATION', 'ACADEMIC BACKGROUND'],
+    'skills': ['SKILLS', 'TECHNICAL SKILLS', 'COMPETENCIES'],
+    'certifications': ['CERTIFICATIONS', 'CERTIFICATES', 'LICENSES']
+}
+
+# One named group per section inside a lookahead, so finditer reports a match at
+# every position; at a given position the earlier (higher-priority) group wins
+_SECTION_KEYWORD_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{key}>{'|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))})"
+    for key, keywords in SECTION_KEYWORDS.items()
+) + ')')
+_SECTION_PRIORITY = {key: idx for idx, key in enumerate(SECTION_KEYWORDS)}
+
+# Section headings are short: nothing shorter than the shortest keyword can match,
+# and body-length paragraphs are not headings
+_MIN_HEADING_LEN = min(len(kw) for keywords in SECTION_KEYWORDS.values() for kw in keywords)
+_MAX_HEADING_LEN = 80
+
+# Specialized applier per interned ParaStyle, generated on first use
+_appliers = {}
+
+
+def _compile_applier(style):
+    """
+    Generate a straight-line function that writes only the non-None fields of style
+    Values are bound as globals of the generated code, so there are no per-call lookups
+    """
+    namespace = {'_deepcopy': deepcopy, '_Font': Font}
+    lines = ['def _apply(paragraph, runs=None):', '    pass']
+    para_fields = [field for field in _PARA_FORMAT_FIELDS if getattr(style, field) is not None]
+    if para_fields:
+        lines.append('    pf = paragraph.paragraph_format')
+    for field in para_fields:
+        namespace[f'_p_{field}'] = getattr(style, field)
+        lines.append(f'    pf.{field} = _p_{field}')
+    
+    # First run style is the default for all runs
+    run_style = style.runs[0] if style.runs else None
+    run_lines = []
+    if run_style is not None:
+        for field, attr in _RUN_FONT_SETTERS:
+            value = getattr(run_style, field)
+            if value is not None:
+                namespace[f'_r_{field}'] = value
+                run_lines.append(f'            font.{attr} = _r_{field}')
+        if run_style.color is not None:
+            namespace['_r_color'] = run_style.color
+            run_lines.append('            font.color.rgb = _r_color')
+    if run_lines:
+        # Runs without direct formatting get a clone of a prebuilt <w:rPr>;
+        # runs that already have one are updated field by field
+        namespace['_rpr'] = _build_rpr(run_style)
+        lines.append('    for r in (paragraph._p.r_lst if runs is None else runs):')
+        lines.append('        if r.rPr is None:')
+        lines.append('            r._insert_rPr(_deepcopy(_rpr))')
+        lines.append('        else:')
+        lines.append('            font = _Font(r)')
+        lines.extend(run_lines)
+    
+    exec('\n'.join(lines), namespace)
+    return namespace['_apply']
+
+
+def _build_rpr(run_style):
+    """Build a detached <w:rPr> carrying run_style's non-None fields"""
+    r = OxmlElement('w:r')
+    font = Font(r)
+    for field, attr in _RUN_FONT_SETTERS:
+        value = getattr(run_style, field)
+        if value is not None:
+            setattr(font, attr, value)
+    if run_style.color is not None:
+        font.color.rgb = run_style.color
+    return r.get_or_add_rPr()
+
+
+def _applier_for(style):
+    """Return the compiled applier for an interned ParaStyle"""
+    applier = _appliers.get(style)
+    if applier is None:
+        applier = _appliers[style] = _compile_applier(style)
+    return applier
+
+
+def _line_spacing(spacing_line, spacing_line_rule):
+    """Line spacing as ParagraphFormat reports it: a float for multiples, else a Length"""
+    if spacing_line is None:
+        return None
+    if spacing_line_rule == WD_LINE_SPACING.MULTIPLE:
+        return spacing_line / Pt(12)
+    return spacing_line
+
+
+def _capture_run(r):
+    """
+    Read a <w:r>'s direct formatting into an interned RunStyle
+    Reads <w:rPr> children directly, giving the same values Run.font would
+    """
+    rPr = r.rPr
+    if rPr is None:
+        return _DEFAULT_RUN_STYLE
+    
+    underline = rPr.u_val
+    if underline == WD_UNDERLINE.INHERITED:
+        underline = None
+    elif underline == WD_UNDERLINE.SINGLE:
+        underline = True
+    elif underline == WD_UNDERLINE.NONE:
+        underline = False
+    color = rPr.color
+    color = color.val if color is not None and color.val != ST_HexColorAuto.AUTO else None
+    run_style = RunStyle(
+        font_name=rPr.rFonts_ascii or None,
+        font_size=rPr.sz_val or None,
+        bold=rPr._get_bool_val('b'),
+        italic=rPr._get_bool_val('i'),
+        underline=underline,
+        color=color,
+        all_caps=rPr._get_bool_val('caps'),
+        small_caps=rPr._get_bool_val('smallCaps'),
+        strike=rPr._get_bool_val('strike'),
+        superscript=rPr.superscript,
+        subscript=rPr.subscript,
+    )
+    return _run_intern.setdefault(run_style, run_style)
+
+
+def _match_section_keyword(text_upper):
+    """Return the highest-priority section whose keyword occurs in text_upper, or None"""
+    best = None
+    for match in _SECTION_KEYWORD_RE.finditer(text_upper):
+        key = match.lastgroup
+        if best is None or _SECTION_PRIORITY[key] < _SECTION_PRIORITY[best]:
+            best = key
+            if _SECTION_PRIORITY[best] == 0:
+                break
+    return best
+
 
 class StyleManager:
     """Manages and preserves paragraph and run formatting in Word documents"""
     
     def __init__(self):
         self.style_cache = {}
+        # Captured styles keyed by the paragraph's <w:p> element; entries are
+        # dropped whenever this manager rewrites that paragraph
+        self._para_capture_cache = {}
+        # (paragraph, exception) pairs from failed style applications; reported
+        # in one summary by flush_errors() instead of printing per paragraph
+        self._errors = []
     
     def capture_paragraph_style(self, paragraph, style_key=None):
         """
         Capture all formatting properties of a paragraph
-        Returns a dictionary with all style properties
+        Returns an interned ParaStyle (shared by identically formatted paragraphs)
         """
-        if not paragraph.runs:
-            # If no runs, create default style
-            style = {
-                'alignment': paragraph.alignment,
-                'space_before': paragraph.paragraph_format.space_before,
-                'space_after': paragraph.paragraph_format.space_after,
-                'line_spacing': paragraph.paragraph_format.line_spacing,
-                'left_indent': paragraph.paragraph_format.left_indent,
-                'right_indent': paragraph.paragraph_format.right_indent,
-                'first_line_indent': paragraph.paragraph_format.first_line_indent,
-                'keep_together': paragraph.paragraph_format.keep_together,
-                'keep_with_next': paragraph.paragraph_format.keep_with_next,
-                'runs': []
-            }
-        else:
-            # Capture first run's font properties as default
-            first_run = paragraph.runs[0]
-            style = {
-                'alignment': paragraph.alignment,
-                'space_before': paragraph.paragraph_format.space_before,
-                'space_after': paragraph.paragraph_format.space_after,
-                'line_spacing': paragraph.paragraph_format.line_spacing,
-                'left_indent': paragraph.paragraph_format.left_indent,
-                'right_indent': paragraph.paragraph_format.right_indent,
-                'first_line_indent': paragraph.paragraph_format.first_line_indent,
-                'keep_together': paragraph.paragraph_format.keep_together,
-                'keep_with_next': paragraph.paragraph_format.keep_with_next,
-                'runs': []
-            }
-            
-            # Capture each run's formatting
-            for run in paragraph.runs:
-                run_style = {
-                    'font_name': run.font.name,
-                    'font_size': run.font.size,
-                    'bold': run.font.bold,
-                    'italic': run.font.italic,
-                    'underline': run.font.underline,
-                    'color': run.font.color.rgb if run.font.color and run.font.color.rgb else None,
-                    'all_caps': run.font.all_caps,
-                    'small_caps': run.font.small_caps,
-                    'strike': run.font.strike,
-                    'superscript': run.font.superscript,
-                    'subscript': run.font.subscript,
-                }
-                style['runs'].append(run_style)
+        p = paragraph._p
+        style = self._para_capture_cache.get(p)
+        if style is None:
+            style = self._para_capture_cache[p] = self._capture(paragraph)
         
         # Cache if key provided
         if style_key:
@@ -70,72 +227,55 @@ class StyleManager:
         
         return style
     
+    def clear_capture_cache(self):
+        """Forget all per-paragraph captures (call after editing paragraphs externally)"""
+        self._para_capture_cache.clear()
+    
+    def _capture(self, paragraph):
+        """Read a paragraph's formatting into an interned ParaStyle"""
+        p = paragraph._p
+        pPr = p.pPr
+        r_lst = p.r_lst
+        if pPr is None and not r_lst:
+            return _EMPTY_STYLE
+        runs = tuple(_capture_run(r) for r in r_lst)
+        
+        if pPr is None:
+            style = ParaStyle(*(None,) * 9, runs=runs)
+        else:
+            style = ParaStyle(
+                alignment=pPr.jc_val,
+                space_before=pPr.spacing_before,
+                space_after=pPr.spacing_after,
+                line_spacing=_line_spacing(pPr.spacing_line, pPr.spacing_lineRule),
+                left_indent=pPr.ind_left,
+                right_indent=pPr.ind_right,
+                first_line_indent=pPr.first_line_indent,
+                keep_together=pPr.keepLines_val,
+                keep_with_next=pPr.keepNext_val,
+                runs=runs,
+            )
+        return _para_intern.setdefault(style, style)
+    
     def apply_paragraph_style(self, paragraph, style):
         """
         Apply captured style to a paragraph
         Preserves all formatting properties
         """
         try:
-            # Apply paragraph-level formatting
-            if style.get('alignment') is not None:
-                paragraph.alignment = style['alignment']
-            
-            pf = paragraph.paragraph_format
-            if style.get('space_before') is not None:
-                pf.space_before = style['space_before']
-            if style.get('space_after') is not None:
-                pf.space_after = style['space_after']
-            if style.get('line_spacing') is not None:
-                pf.line_spacing = style['line_spacing']
-            if style.get('left_indent') is not None:
-                pf.left_indent = style['left_indent']
-            if style.get('right_indent') is not None:
-                pf.right_indent = style['right_indent']
-            if style.get('first_line_indent') is not None:
-                pf.first_line_indent = style['first_line_indent']
-            if style.get('keep_together') is not None:
-                pf.keep_together = style['keep_together']
-            if style.get('keep_with_next') is not None:
-                pf.keep_with_next = style['keep_with_next']
-            
-            # Apply run-level formatting to all runs
-            if style.get('runs') and len(style['runs']) > 0:
-                # Use first run style as default for all runs
-                default_run_style = style['runs'][0]
-                
-                for run in paragraph.runs:
-                    self._apply_run_style(run, default_run_style)
-        
+            self._apply_style(paragraph, style)
         except Exception as e:
-            print(f"  ⚠️  Error applying style: {e}")
+            self._errors.append((paragraph, e))
     
-    def _apply_run_style(self, run, run_style):
-        """Apply formatting to a single run"""
-        try:
-            if run_style.get('font_name'):
-                run.font.name = run_style['font_name']
-            if run_style.get('font_size'):
-                run.font.size = run_style['font_size']
-            if run_style.get('bold') is not None:
-                run.font.bold = run_style['bold']
-            if run_style.get('italic') is not None:
-                run.font.italic = run_style['italic']
-            if run_style.get('underline') is not None:
-                run.font.underline = run_style['underline']
-            if run_style.get('color'):
-                run.font.color.rgb = run_style['color']
-            if run_style.get('all_caps') is not None:
-                run.font.all_caps = run_style['all_caps']
-            if run_style.get('small_caps') is not None:
-                run.font.small_caps = run_style['small_caps']
-            if run_style.get('strike') is not None:
-                run.font.strike = run_style['strike']
-            if run_style.get('superscript') is not None:
-                run.font.superscript = run_style['superscript']
-            if run_style.get('subscript') is not None:
-                run.font.subscript = run_style['subscript']
-        except Exception as e:
-            print(f"    ⚠️  Error applying run style: {e}")
+    def _apply_style(self, paragraph, style, runs=None):
+        """
+        Write a ParaStyle onto a paragraph (no error handling; callers guard)
+        runs optionally limits run formatting to these <w:r> elements
+        """
+        self._para_capture_cache.pop(paragraph._p, None)
+        if style is _EMPTY_STYLE:
+            return
+        _applier_for(style)(paragraph, runs)
     
     def replace_text_preserve_style(self, paragraph, new_text):
         """
@@ -149,8 +289,11 @@ class StyleManager:
         paragraph.clear()
         run = paragraph.add_run(new_text)
         
-        # Reapply style
-        self.apply_paragraph_style(paragraph, style)
+        # Reapply style; the new run is the only one, so skip re-walking paragraph.runs
+        try:
+            self._apply_style(paragraph, style, runs=(run._r,))
+        except Exception as e:
+            self._errors.append((paragraph, e))
         
         return paragraph
     
@@ -165,26 +308,19 @@ class StyleManager:
         """
         section_styles = {}
         
-        # Common section keywords to look for
-        section_keywords = {
-            'name': ['<NAME>', '<CANDIDATE NAME>', 'NAME'],
-            'summary': ['SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE'],
-            'employment': ['EMPLOYMENT HISTORY', 'WORK EXPERIENCE', 'EXPERIENCE'],
-            'education': ['EDUCATION', 'ACADEMIC BACKGROUND'],
-            'skills': ['SKILLS', 'TECHNICAL SKILLS', 'COMPETENCIES'],
-            'certifications': ['CERTIFICATIONS', 'CERTIFICATES', 'LICENSES']
-        }
-        
         for para_idx, paragraph in enumerate(doc.paragraphs):
-            text_upper = paragraph.text.strip().upper()
+            text = paragraph.text.strip()
+            if not _MIN_HEADING_LEN <= len(text) <= _MAX_HEADING_LEN:
+                continue
+            text_upper = text.upper()
             
             # Check if this paragraph matches any section keyword
-            for section_key, keywords in section_keywords.items():
-                if any(kw in text_upper for kw in keywords):
-                    style = self.capture_paragraph_style(paragraph)
-                    section_styles[section_key] = style
-                    print(f"  📋 Cached style for '{section_key}' from paragraph {para_idx}: {text_upper[:50]}")
-                    break
+            section_key = _match_section_keyword(text_upper)
+            if section_key:
+                style = self.capture_paragraph_style(paragraph)
+                _applier_for(style)
+                section_styles[section_key] = style
+                print(f"  📋 Cached style for '{section_key}' from paragraph {para_idx}: {text_upper[:50]}")
         
         return section_styles
     
@@ -195,6 +331,32 @@ class StyleManager:
             self.apply_paragraph_style(paragraph, style)
             return True
         return False
+    
+    def apply_section_style_batch(self, paragraphs, section_key):
+        """
+        Apply one cached section style to many paragraphs (e.g. a section's bullets)
+        Looks the style up once; returns the number of paragraphs styled
+        """
+        style = self.get_cached_style(section_key)
+        if not style:
+            return 0
+        
+        applied = 0
+        for paragraph in paragraphs:
+            try:
+                self._apply_style(paragraph, style)
+                applied += 1
+            except Exception as e:
+                self._errors.append((paragraph, e))
+        
+        return applied
+    
+    def flush_errors(self):
+        """Print one summary of accumulated style errors and reset; returns the error count"""
+        errors, self._errors = self._errors, []
+        if errors:
+            print(f"  ⚠️  Style could not be applied to {len(errors)} paragraph(s); first error: {errors[0][1]}")
+        return len(errors)
 
 # Global instance
 style_manager = StyleManager()
@@ -10,11 +10,21 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.text.paragraph import Paragraph
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from functools import cached_property, lru_cache
 import os
 import re
 import shutil
+import sys
+import threading
 import traceback
 import json
+import logging
+
+# Per-paragraph diagnostics go through this logger at DEBUG level; progress output stays on print
+logger = logging.getLogger(__name__)
 
 # Import style manager and section detector
 try:
@@ -26,6 +36,21 @@ except ImportError:
     STYLE_PRESERVATION_ENABLED = False
     print("⚠️  Style preservation not available")
 
+# Optional Aho-Corasick automaton for matching all replacement placeholders in one pass
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional RE2 engine (google-re2) for the placeholder scans: linear-time matching,
+# no backtracking over long unmatched "<..." runs
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
 # Try to import win32com for .doc support
 try:
     import win32com.client
@@ -34,10 +59,329 @@ except ImportError:
     HAS_WIN32 = False
     print("WARNING: win32com not available - .doc files will have limited support")
 
+# Placeholder and cleanup patterns used while formatting .docx templates, compiled once.
+# Atomic groups and possessive quantifiers need the Python 3.11+ re module; older
+# interpreters fall back to the plain (backtracking) forms, which match the same text
+_HAS_ATOMIC_RE = sys.version_info >= (3, 11)
+_TAG_TAIL = r'[^>]*+>' if _HAS_ATOMIC_RE else r'[^>]*>'
+_NAME_ROLE_SPLIT_RE = re.compile(r'\s{2,}|\n')
+_NAME_PLACEHOLDER_RE = re.compile(
+    r'<\s*[Cc]andidate[^>]*[Nn]ame' + _TAG_TAIL +
+    r'|<\s*[Nn]ame\s*>'
+    r'|<\s*[Ff]ull\s*[Nn]ame\s*>'
+    r'|<\s*YOUR\s*NAME\s*>'
+)
+# Fallback anchor search also accepts the sample-name placeholders of the stock template
+_NAME_PLACEHOLDER_FALLBACK_RE = re.compile(
+    _NAME_PLACEHOLDER_RE.pattern + r'|<[^>]*LAWSON' + _TAG_TAIL + r'|<[^>]*PAULA' + _TAG_TAIL
+)
+_NAME_ALT_RE = re.compile(
+    r"<\s*(?:candidate'?s?\s+(?:full\s+)?name|name|full\s+name|your\s+name)\s*>",
+    re.IGNORECASE
+)
+# Atomic groups commit to the first "candidate"/"name" inside the tag, so a long
+# unmatched "<..." costs one linear scan instead of nested [^>]* backtracking
+_GENERIC_NAME_RE = re.compile(
+    r"<(?>(?>[^>]*?candidate)[^>]*?name|(?>[^>]*?name)[^>]*?candidate)[^>]*+>" if _HAS_ATOMIC_RE
+    else r"<[^>]*(?:candidate[^>]*name|name[^>]*candidate)[^>]*>",
+    re.IGNORECASE
+)
+_SAMPLE_NAME_RE = re.compile(r'^[A-Z][A-Z\s]{5,30}$')
+_PHONE_RE = re.compile(r'\d{3}[-.]?\d{3}[-.]?\d{4}')
+_SENTENCE_SPLIT_RE = re.compile(r'\.\s+(?=[A-Z])')
+# Any of these in a short uppercased paragraph marks an EMPLOYMENT heading
+# ('EMPLOYMENT' also covers 'EMPLOYMENT HISTORY')
+_EMP_HEADING_RE = re.compile(r'EMPLOYMENT|WORK HISTORY|PROFESSIONAL EXPERIENCE|WORK EXPERIENCE|CAREER HISTORY')
+_SUMMARY_HEADING_RE = re.compile(r'SUMMARY|PROFESSIONAL SUMMARY|PROFILE|OBJECTIVE|CAREER SUMMARY|EXECUTIVE SUMMARY')
+_EDU_HEADING_RE = re.compile('|'.join(re.escape(h) for h in (
+    'EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND',
+    'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS', 'EDUCATION BACKGROUND',
+    'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'ACADEMICS',
+    'EDUCATION/CERTIFICATES', 'EDUCATION / CERTIFICATES'
+)))
+# Template instructions ("Please list...", "Use this table...") scrubbed before a table
+_INSTRUCTION_TEXT_RE = re.compile(
+    r'\bplease\b|use this table|add or delete rows|respond with the years|list the candidate|required/desired',
+    re.IGNORECASE
+)
+_NUMBERED_ITEM_RE = re.compile(r'^\d+[\).\-\s]')
+# Wording normalizations _optimize_details applies to each bullet, in order
+_WORDING_NORMALIZATIONS = tuple((re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in (
+    (r'\bas well as\b', 'and'),
+    (r'\bin order to\b', 'to'),
+    (r'\bkey performance indicators\s*\(([^\)]+)\)', r'\1'),
+    (r'\bkey performance indicators\b', 'KPIs'),
+    (r'\bquickbooks\b', 'QuickBooks'),
+    (r'\bums?\s*worldship\b', 'UPS WorldShip'),
+))
+
+def _atomic_tag_pattern(pattern):
+    """Rewrite '<[^>]*a[^>]*b[^>]*>' as '<(?>[^>]*?a)(?>[^>]*?b)[^>]*+>' for the backtracking engine.
+    Committing to the first occurrence of each keyword matches the same tags, but a tag that
+    fails costs one scan per '<' instead of nested [^>]* backtracking; other patterns (and every
+    pattern before Python 3.11, which lacks atomic groups) pass through"""
+    if not _HAS_ATOMIC_RE:
+        return pattern
+    parts = pattern.split('[^>]*')
+    if len(parts) < 3 or parts[0] != '<' or parts[-1] != '>':
+        return pattern
+    return '<' + ''.join(f'(?>[^>]*?{kw})' for kw in parts[1:-1]) + '[^>]*+>'
+
+def _placeholder_re(pattern):
+    """Case-insensitive placeholder pattern, compiled with RE2 (linear time) when it is installed"""
+    if HAS_RE2:
+        options = re2.Options()
+        options.case_sensitive = False
+        return re2.compile(pattern, options)
+    return re.compile(_atomic_tag_pattern(pattern), re.IGNORECASE)
+
+_EMP_PLACEHOLDER_PATTERNS = tuple(_placeholder_re(p) for p in (
+    r"<[^>]*list[^>]*candidate'?s?[^>]*employment[^>]*history[^>]*>",
+    r"<[^>]*employment[^>]*history[^>]*>",
+    r"<[^>]*work[^>]*history[^>]*>",
+    r"<[^>]*professional[^>]*experience[^>]*>",
+    r"<[^>]*career[^>]*(history|experience)[^>]*>",
+    r"<[^>]*history[^>]*(employ|employer|work|career)[^>]*>",
+    r"<[^>]*list[^>]*employment[^>]*history[^>]*>",
+))
+_SUMMARY_PLACEHOLDER_PATTERNS = tuple(_placeholder_re(p) for p in (
+    r"<[^>]*summary[^>]*>",
+    r"<[^>]*professional[^>]*summary[^>]*>",
+    r"<[^>]*profile[^>]*>",
+))
+_SKILLS_PLACEHOLDER_PATTERNS = tuple(_placeholder_re(p) for p in (
+    r"<[^>]*skills[^>]*>",
+    r"<[^>]*technical[^>]*skills[^>]*>",
+    r"<[^>]*list[^>]*skills[^>]*>",
+))
+# The last (bare-text) education pattern is only used outside tables
+_EDU_PLACEHOLDER_PATTERNS = tuple(_placeholder_re(p) for p in (
+    r"<[^>]*list[^>]*candidate['’]?s?[^>]*education[^>]*background[^>]*>",
+    r"<[^>]*education[^>]*background[^>]*>",
+    r"<[^>]*education[^>]*history[^>]*>",
+    r"<[^>]*candidate['’]?s?[^>]*education[^>]*>",
+    r"<[^>]*educational[^>]*background[^>]*>",
+    r"<[^>]*academic[^>]*background[^>]*>",
+    r"<[^>]*academic[^>]*qualifications[^>]*>",
+    r"<[^>]*qualifications[^>]*>",
+    r"<[^>]*(education|academic)[^>]*>",
+    r"\blist\s*candidate(?:['’]s)?\s*education\s*background\b",
+))
+
+class _PlaceholderFamily:
+    """Token matcher for one placeholder family: ``search`` is true when some ``<...>`` tag contains
+    one of the keyword sequences in order (case-insensitive), which is exactly when one of the
+    family's ``<[^>]*kw1[^>]*kw2[^>]*>`` patterns matches, without running a regex."""
+
+    __slots__ = ('_sequences',)
+
+    def __init__(self, *sequences):
+        self._sequences = tuple(tuple(kw.split()) for kw in sequences)
+
+    def search(self, text):
+        # Every chunk before a '>' closes a tag that opens at its first '<'
+        for chunk in text.lower().split('>')[:-1]:
+            start = chunk.find('<')
+            if start < 0:
+                continue
+            for keywords in self._sequences:
+                pos = start
+                for kw in keywords:
+                    pos = chunk.find(kw, pos)
+                    if pos < 0:
+                        break
+                    pos += len(kw)
+                else:
+                    return True
+        return False
+
+
+# One matcher per family: a single scan tells whether any of its patterns can match.
+# Only then are the patterns tried one by one, since the first that matches is the one
+# used for the replacement. Longer patterns are implied by the shorter sequences here
+# (e.g. "professional summary" by "summary"); keep both lists in step
+_EMP_PLACEHOLDER_RE = _PlaceholderFamily(
+    'employment history', 'work history', 'professional experience',
+    'career history', 'career experience',
+    'history employ', 'history work', 'history career',
+)
+_SUMMARY_PLACEHOLDER_RE = _PlaceholderFamily('summary', 'profile')
+_SKILLS_PLACEHOLDER_RE = _PlaceholderFamily('skills')
+# The bare-text education pattern has no literal "<" to anchor on, so it is checked on its own
+_EDU_TAG_PLACEHOLDER_RE = _PlaceholderFamily('education', 'academic', 'qualifications')
+
+
+@lru_cache(maxsize=256)
+def _ci_literal_pattern(term):
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+
+def _replace_literal_ci(text, term, replacement):
+    """Case-insensitive literal replace; plain str.replace when every hit already has term's case"""
+    if term in text and text.count(term) == text.lower().count(term.lower()):
+        return text.replace(term, replacement)
+    return _ci_literal_pattern(term).sub(lambda m: replacement, text)
+
+
+class _HeadingAutomaton:
+    """Aho-Corasick keyword set exposing the ``search`` of the regex alternation it replaces."""
+
+    __slots__ = ('_automaton',)
+
+    def __init__(self, headings):
+        self._automaton = ahocorasick.Automaton()
+        for heading in headings:
+            self._automaton.add_word(heading, heading)
+        self._automaton.make_automaton()
+
+    def search(self, text):
+        # First (end_index, heading) hit or None; only truthiness is used by callers
+        return next(self._automaton.iter(text), None)
+
+
+# Section headings that end a cleared block when they appear in a short paragraph
+# (substring match on the uppercased text, like the old any(h in text ...) checks).
+# With pyahocorasick each probe is one automaton pass, however many headings the list has
+def _stop_heading_re(*headings):
+    if HAS_AHOCORASICK:
+        return _HeadingAutomaton(headings)
+    return re.compile('|'.join(re.escape(h) for h in headings))
+
+_EMP_STOP_HEADINGS_RE = _stop_heading_re(
+    'EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND',
+    'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS',
+    'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'ACADEMICS',
+    'SKILLS', 'TECHNICAL SKILLS',
+    'SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE',
+    'PROJECTS', 'AWARDS', 'REFERENCES'
+)
+_EDU_STOP_TERMS_RE = _stop_heading_re(
+    'EDUCATION', 'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS',
+    'ACADEMIC', 'QUALIFICATIONS', 'ACADEMICS'
+)
+_SUMMARY_STOP_HEADINGS_RE = _stop_heading_re(
+    'EMPLOYMENT', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE',
+    'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'CERTIFICATIONS'
+)
+_SKILLS_STOP_HEADINGS_RE = _stop_heading_re(
+    'EMPLOYMENT', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'CAREER HISTORY',
+    'EDUCATION', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS'
+)
+_BLOCK_STOP_HEADINGS_RE = _stop_heading_re(
+    'EMPLOYMENT', 'WORK HISTORY', 'SKILLS', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS'
+)
+_BLOCK_STOP_HEADINGS_WITH_EDU_RE = _stop_heading_re(
+    'EMPLOYMENT', 'WORK HISTORY', 'EDUCATION', 'SKILLS', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS'
+)
+_CAI_SKILLS_STOP_HEADINGS_RE = _stop_heading_re(
+    'EMPLOYMENT', 'WORK HISTORY', 'EDUCATION', 'SUMMARY', 'CAI CONTACT', 'CERTIFICATIONS'
+)
+_CAI_SECTION_HEADINGS_RE = _stop_heading_re('EMPLOYMENT', 'EDUCATION', 'SUMMARY', 'SKILLS')
+_CAI_SECTION_HEADINGS_WITH_EXP_RE = _stop_heading_re(
+    'EMPLOYMENT', 'EDUCATION', 'SUMMARY', 'SKILLS', 'EXPERIENCE'
+)
+_TRACKED_SECTION_HEADINGS = ('EMPLOYMENT HISTORY', 'EDUCATION', 'SKILLS', 'SUMMARY')
+_TRACKED_SECTION_HEADINGS_RE = _stop_heading_re(*_TRACKED_SECTION_HEADINGS)
+_EMP_END_HEADINGS_RE = _stop_heading_re('SKILLS', 'SUMMARY', 'PROJECTS', 'CERTIFICATIONS')
+_EDU_END_HEADINGS_RE = _stop_heading_re('SKILLS', 'CERTIFICATES', 'PROJECTS', 'LANGUAGES', 'REFERENCES')
+
+# Leading bullet/dash characters stripped from content lines before re-bulleting them
+_BULLET_LEAD_CHARS = '•–—-*● '
+
+# Section heading aliases for the primary-anchor scan; a short paragraph starting with
+# an alias is an anchor, and earlier keys win when several match
+_ANCHOR_KEYS = {
+    'EMPLOYMENT': ['EMPLOYMENT HISTORY', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'CAREER HISTORY', 'EMPLOYMENT', 'EXPERIENCE'],
+    'EDUCATION': ['EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND', 'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS', 'EDUCATION BACKGROUND', 'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'TRAINING', 'ACADEMICS', 'EDUCATION/CERTIFICATES', 'EDUCATION / CERTIFICATES'],
+    'SKILLS': ['SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'EXPERTISE', 'ABILITIES'],
+    'SUMMARY': ['SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE', 'CAREER SUMMARY', 'EXECUTIVE SUMMARY', 'OVERVIEW'],
+    'PROJECTS': ['PROJECTS', 'PORTFOLIO', 'PERSONAL PROJECTS', 'KEY PROJECTS'],
+    'AWARDS': ['AWARDS', 'ACHIEVEMENTS', 'HONORS', 'RECOGNITION', 'ACCOMPLISHMENTS'],
+    'PUBLICATIONS': ['PUBLICATIONS', 'PAPERS', 'ARTICLES', 'RESEARCH'],
+    'LANGUAGES': ['LANGUAGES', 'LANGUAGE SKILLS'],
+    'REFERENCES': ['REFERENCES', 'RECOMMENDATIONS']
+}
+_ANCHOR_RE = re.compile('^(?:' + '|'.join(
+    f"(?P<{key}>{'|'.join(re.escape(alias) for alias in aliases)})"
+    for key, aliases in _ANCHOR_KEYS.items()
+) + ')', re.MULTILINE)
+
+
+class _BodyParagraphs:
+    """Top-level body paragraphs from one XPath pass, wrapped in a Paragraph only when indexed.
+    A slice yields its paragraphs lazily, so a forward scan that stops early wraps only what it visited."""
+
+    __slots__ = ('_elems', '_parent')
+
+    def __init__(self, doc):
+        self._elems = doc.element.body.xpath('./w:p')
+        self._parent = doc._body
+
+    def __len__(self):
+        return len(self._elems)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return (Paragraph(p, self._parent) for p in self._elems[idx])
+        return Paragraph(self._elems[idx], self._parent)
+
+
+def _upper_paragraph_texts(paragraphs):
+    """Stripped, uppercased text of each paragraph, the form every heading scan compares against"""
+    return [(p.text or '').strip().upper() for p in paragraphs]
+
+
+def _clear_paragraph_runs(paragraphs):
+    """Empty every run of *paragraphs* like ``run.text = ''``, in one removal pass (run properties are kept).
+    Best effort: one guard covers the whole batch, as clearing leftover template text is never fatal."""
+    try:
+        for child in [c for p in paragraphs for c in p._p.xpath('./w:r/*[not(self::w:rPr)]')]:
+            child.getparent().remove(child)
+    except Exception:
+        pass
+
+
+def _rewrite_heading_runs(paragraph, text, size=None):
+    """Clear *paragraph* and write *text* as a bold heading into its first run, keeping that run's properties"""
+    _clear_paragraph_runs([paragraph])
+    runs = paragraph.runs
+    if runs:
+        runs[0].text = text
+        runs[0].bold = True
+        if size is not None:
+            runs[0].font.size = size
+
+
+# Parsed CAI contact store per path, with the (mtime_ns, size) it was read at
+_CAI_CONTACT_CACHE = {}
+
+
+@lru_cache(maxsize=8)
+def _right_tab_proto(pos_twips):
+    """Detached <w:tabs> with one right tab stop at *pos_twips*, deep-copied into paragraphs"""
+    tabs = OxmlElement('w:tabs')
+    tab = OxmlElement('w:tab')
+    tab.set(qn('w:val'), 'right')
+    tab.set(qn('w:pos'), str(pos_twips))
+    tabs.append(tab)
+    return tabs
+
+
 class WordFormatter:
     """Enhanced Word document formatting"""
     
-    def __init__(self, resume_data, template_analysis, output_path):
+    # Candidate sections handled by the standard insertion paths (skipped by dynamic sections)
+    _STANDARD_SECTIONS = frozenset({
+        'summary', 'profile', 'objective', 'professional_summary',
+        'employment', 'experience', 'work_history', 'work_experience', 'professional_experience',
+        'education', 'academic_background', 'certificates', 'certifications',
+        'skills', 'technical_skills', 'core_competencies'
+    })
+    
+    # Per-thread shared Word.Application (see _acquire_word)
+    _word_local = threading.local()
+    
+    def __init__(self, resume_data, template_analysis, output_path, use_ml=True):
         self.resume_data = resume_data
         self.template_analysis = template_analysis
         self.output_path = output_path
@@ -47,11 +391,82 @@ class WordFormatter:
         # Initialize style manager and section detector
         if STYLE_PRESERVATION_ENABLED:
             self.style_manager = StyleManager()
-            self.section_detector = SectionDetector(use_ml=True)
+            self.section_detector = SectionDetector(use_ml=use_ml)
         else:
             self.style_manager = None
             self.section_detector = None
         
+    @classmethod
+    def format_many(cls, jobs, max_workers=None):
+        """
+        Format a batch of (resume_data, template_analysis, output_path) jobs.
+        The python-docx phase of .docx templates runs in a process pool; everything that
+        needs Word (.doc templates, PDF export) runs here, on this thread's single Word instance.
+        Returns one success flag per job, in job order.
+        """
+        jobs = list(jobs)
+        results = [False] * len(jobs)
+        
+        # Word work is serialized on this thread; hold one instance for the whole batch
+        needs_word = HAS_WIN32 and any(
+            (template_analysis.get('template_path') or '').lower().endswith('.doc') or output_path.endswith('.pdf')
+            for _, template_analysis, output_path in jobs
+        )
+        if needs_word:
+            try:
+                cls._acquire_word()
+            except Exception as e:
+                print(f"⚠️  Could not start Word for batch: {e}")
+                needs_word = False
+        
+        # A pool only pays off with two or more workers; with one, process start-up and
+        # pickling are pure overhead, so format everything in-process instead
+        docx_count = sum(
+            not (template_analysis.get('template_path') or '').lower().endswith('.doc')
+            for _, template_analysis, _ in jobs
+        )
+        workers = min(max_workers or os.cpu_count() or 1, docx_count)
+        
+        try:
+            if workers <= 1:
+                for idx, job in enumerate(jobs):
+                    results[idx] = cls(*job).format()
+                return results
+            
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = {}
+                com_jobs = []
+                for idx, (resume_data, template_analysis, output_path) in enumerate(jobs):
+                    if (template_analysis.get('template_path') or '').lower().endswith('.doc'):
+                        com_jobs.append(idx)
+                        continue
+                    # Workers stop at the .docx; PDF export happens below, on the Word thread
+                    docx_path = output_path.replace('.pdf', '.docx')
+                    future = pool.submit(_format_docx_job, resume_data, template_analysis, docx_path)
+                    pending[future] = idx
+                
+                # .doc templates need Word from start to finish; run them while the pool works
+                for idx in com_jobs:
+                    results[idx] = cls(*jobs[idx]).format()
+                
+                for future in as_completed(pending):
+                    idx = pending[future]
+                    output_path = jobs[idx][2]
+                    try:
+                        ok = future.result()
+                    except Exception as e:
+                        print(f"❌ Error formatting Word document {os.path.basename(output_path)}: {e}")
+                        ok = False
+                    if ok and output_path.endswith('.pdf'):
+                        print(f"📄 Converting to PDF: {os.path.basename(output_path)}")
+                        if not cls._convert_to_pdf(output_path.replace('.pdf', '.docx'), output_path):
+                            print("⚠️  PDF conversion failed, keeping .docx file")
+                    results[idx] = ok
+        finally:
+            if needs_word:
+                cls._release_word()
+        return results
+    
     def format(self):
         """Main formatting method"""
         print(f"\n{'='*70}")
@@ -79,43 +494,94 @@ class WordFormatter:
         print("📋 Processing .doc file (old Word format)...")
         
         if HAS_WIN32:
-            # Convert .doc to .docx first
-            print("✓ Converting .doc to .docx...")
-            docx_path = self._convert_doc_to_docx(self.template_path)
-            
-            if docx_path:
-                # Update template path temporarily
-                original_path = self.template_path
-                self.template_path = docx_path
-                
-                # Format the docx
-                result = self._format_docx_file()
-                
-                # Cleanup
-                try:
-                    os.remove(docx_path)
-                except:
-                    pass
-                
-                self.template_path = original_path
-                return result
-            else:
-                print("❌ Failed to convert .doc to .docx")
+            # Hold one Word instance for the conversion and any COM work while formatting
+            try:
+                self._acquire_word()
+            except Exception as e:
+                print(f"❌ Could not start Word: {e}")
                 return False
+            try:
+                # Convert .doc to .docx first
+                print("✓ Converting .doc to .docx...")
+                docx_path = self._convert_doc_to_docx(self.template_path)
+                
+                if docx_path:
+                    # Update template path temporarily
+                    original_path = self.template_path
+                    self.template_path = docx_path
+                    
+                    # Format the docx
+                    result = self._format_docx_file()
+                    
+                    # Cleanup
+                    try:
+                        os.remove(docx_path)
+                    except:
+                        pass
+                    
+                    self.template_path = original_path
+                    return result
+                else:
+                    print("❌ Failed to convert .doc to .docx")
+                    return False
+            finally:
+                self._release_word()
         else:
             print("⚠️  Cannot process .doc files without win32com")
             print("💡 Please convert template to .docx format or install pywin32")
             return False
     
+    @classmethod
+    def _acquire_word(cls):
+        """
+        Return this thread's shared Word.Application, starting it on first acquire.
+        Every acquire must be paired with _release_word(); Word quits on the last release.
+        COM objects are apartment-bound, so the instance is per thread.
+        """
+        state = cls._word_local
+        if not getattr(state, 'refcount', 0):
+            import pythoncom
+            pythoncom.CoInitialize()  # Initialize COM for this thread
+            try:
+                word = win32com.client.Dispatch("Word.Application")
+                word.Visible = False
+                # Skip screen redraws and background repagination during bulk edits
+                try:
+                    word.ScreenUpdating = False
+                    word.Options.Pagination = False
+                except Exception:
+                    pass
+            except Exception:
+                pythoncom.CoUninitialize()
+                raise
+            state.app = word
+            state.refcount = 0
+        state.refcount += 1
+        return state.app
+    
+    @classmethod
+    def _release_word(cls):
+        """Drop one hold on the shared Word.Application; quits Word after the last one"""
+        state = cls._word_local
+        state.refcount -= 1
+        if state.refcount:
+            return
+        word, state.app = state.app, None
+        try:
+            word.Quit()
+        except Exception:
+            pass
+        import pythoncom
+        pythoncom.CoUninitialize()  # Clean up COM
+    
     def _convert_doc_to_docx(self, doc_path):
         """Convert .doc to .docx using Word COM"""
         try:
-            import pythoncom
-            pythoncom.CoInitialize()  # Initialize COM for this thread
-            
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False
-            
+            word = self._acquire_word()
+        except Exception as e:
+            print(f"❌ Conversion error: {e}")
+            return None
+        try:
             # Open .doc file
             doc = word.Documents.Open(os.path.abspath(doc_path))
             
@@ -124,21 +590,15 @@ class WordFormatter:
             doc.SaveAs2(os.path.abspath(docx_path), FileFormat=16)  # 16 = docx format
             
             doc.Close()
-            word.Quit()
-            
-            pythoncom.CoUninitialize()  # Clean up COM
             
             print(f"✓ Converted to: {docx_path}")
             return docx_path
             
         except Exception as e:
             print(f"❌ Conversion error: {e}")
-            try:
-                import pythoncom
-                pythoncom.CoUninitialize()
-            except:
-                pass
             return None
+        finally:
+            self._release_word()
 
     def _postprocess_with_word_com(self, docx_path):
         """Final pass using Word COM to replace placeholders that may live in shapes/text boxes.
@@ -147,86 +607,35 @@ class WordFormatter:
         if not HAS_WIN32:
             return
         try:
-            import pythoncom
-            pythoncom.CoInitialize()  # Initialize COM for this thread
-            
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False
+            word = self._acquire_word()
+        except Exception as e:
+            print(f"⚠️  COM post-processing error: {e}")
+            return
+        try:
             doc = word.Documents.Open(os.path.abspath(docx_path))
 
-            def find_replace_in_range(rng, find_text, replace_text, wildcard=False):
+            def find_replace_in_range(rng, ops):
+                """Run every (find, replace, wildcard) op on rng, setting shared Find options once"""
                 find = rng.Find
                 find.ClearFormatting()
                 find.Replacement.ClearFormatting()
-                find.Text = find_text
-                find.Replacement.Text = replace_text
                 find.Forward = True
                 find.Wrap = 1  # wdFindContinue
                 find.MatchCase = False
                 find.MatchWholeWord = False
-                find.MatchWildcards = bool(wildcard)
-                find.Execute(Replace=2)  # wdReplaceAll
-
-            # Build replacement strings from resume_data
-            # SUMMARY
-            summary_lines = self._find_matching_resume_section('summary', self.resume_data.get('sections', {})) or []
-            summary_text = (self.resume_data.get('summary') or '').strip()
-            summary_replace = ''
-            if summary_lines:
-                summary_replace = '\r'.join(['• ' + s.strip().lstrip('•–—-*● ') for s in summary_lines if s.strip()])
-            elif summary_text:
-                summary_replace = summary_text
-
-            # SKILLS - COM replacement (Note: COM has 255 char limit per field)
-            skills_list = self.resume_data.get('skills', []) or []
-            skill_lines = []
-            for s in skills_list:  # Include all skills (will truncate if exceeds COM limit)
-                skill_name = (s if isinstance(s, str) else s.get('name', '')).strip()
-                if skill_name and len(skill_name) < 50:  # Skip very long skill names
-                    skill_lines.append('• ' + skill_name)
-            skills_replace = '\r'.join(skill_lines)
-            # Limit to 255 chars
-            if len(skills_replace) > 255:
-                skills_replace = skills_replace[:252] + '...'
-
-            # EDUCATION
-            education = self.resume_data.get('education', []) or []
-            if not education:
-                sect = self._find_matching_resume_section('education', self.resume_data.get('sections', {})) or []
-                if sect:
-                    education = self._build_education_from_bullets(sect)
-            edu_lines = []
-            for edu in education:  # Include all entries (will truncate if exceeds COM limit)
-                deg = (edu.get('degree') or '').strip()
-                inst = (edu.get('institution') or '').strip()
-                yr = self._clean_duration((edu.get('year') or '').strip())
-                
-                # Keep it short for COM
-                if deg and len(deg) > 50:
-                    deg = deg[:47] + '...'
-                if inst and len(inst) > 40:
-                    inst = inst[:37] + '...'
-                
-                parts = []
-                if deg:
-                    parts.append(deg)
-                if inst:
-                    parts.append(inst)
-                if yr:
-                    parts.append(yr)
-                line = ' - '.join(parts[:-1]) if len(parts) > 1 else (parts[0] if parts else '')
-                if yr and line:
-                    line = f"{line} {yr}"
-                if line and len(line) < 200:  # Safety check
-                    edu_lines.append('• ' + line)
-            education_replace = '\r'.join(edu_lines)
-            
-            # Limit total length to 255 chars (Word COM limit)
-            if len(education_replace) > 255:
-                education_replace = education_replace[:252] + '...'
+                for find_text, replace_text, wildcard in ops:
+                    find.Text = find_text
+                    find.Replacement.Text = replace_text
+                    find.MatchWildcards = wildcard
+                    find.Execute(Replace=2)  # wdReplaceAll
+
+            # Replacement payloads are built on first access and reused by every pass
+            summary_replace = self._com_summary_replace
+            skills_replace = self._com_skills_replace
+            education_replace = self._com_education_replace
             
             print(f"  📝 COM replacement strings prepared:")
-            print(f"     - Education: {len(education_replace)} chars, {len(edu_lines)} lines")
+            print(f"     - Education: {len(education_replace)} chars, {len(education_replace.split(chr(13))) if education_replace else 0} lines")
             print(f"     - Skills: {len(skills_replace)} chars")
             print(f"     - Summary: {len(summary_replace)} chars")
 
@@ -234,37 +643,40 @@ class WordFormatter:
             candidate_name = (self.resume_data.get('name') or '').strip()
             bracket_name = f"<{candidate_name}>" if candidate_name else ''
 
+            # Flat (find, replace, wildcard) op lists, built once for every story and shape
+            story_ops = []
+            shape_ops = []
+            if bracket_name:
+                # Candidate name → bracketed name (exact case and uppercase variants)
+                for name in (candidate_name, candidate_name.upper()):
+                    story_ops.append((name, bracket_name, False))
+                    shape_ops.append((name, bracket_name, False))
+            if summary_replace:
+                for pat in ["<summary>", "<professional summary>", "<profile>", "professional summary", "<summary*>"]:
+                    story_ops.append((pat, summary_replace, '*' in pat))
+                for pat in ["<summary>", "<professional summary>", "<profile>"]:
+                    shape_ops.append((pat, summary_replace, False))
+            if skills_replace:
+                for pat in ["<skills>", "<technical skills>", "<list skills>", "<skills*>"]:
+                    story_ops.append((pat, skills_replace, '*' in pat))
+                for pat in ["<skills>", "<technical skills>", "<list skills>"]:
+                    shape_ops.append((pat, skills_replace, False))
+            if education_replace:
+                edu_pats = [
+                    "<List candidate’s education background>",
+                    "<list candidate’s education background>",
+                    "list candidate’s education background",
+                    "education background",
+                ]
+                for pat in edu_pats + ["<education background>", "<education>", "<academic background>", "<academic qualifications>"]:
+                    story_ops.append((pat, education_replace, False))
+                for pat in edu_pats:
+                    shape_ops.append((pat, education_replace, False))
+
             # Story ranges include shapes/text frames and headers/footers
             story = doc.StoryRanges(1)  # wdMainTextStory = 1
             while story is not None:
-                # Candidate name → bracketed name
-                if bracket_name:
-                    # Exact case and uppercase variants
-                    find_replace_in_range(story, candidate_name, bracket_name, wildcard=False)
-                    find_replace_in_range(story, candidate_name.upper(), bracket_name, wildcard=False)
-
-                if summary_replace:
-                    for pat in ["<summary>", "<professional summary>", "<profile>", "professional summary", "<summary*>"]:
-                        find_replace_in_range(story, pat, summary_replace, wildcard='*' in pat)
-                if skills_replace:
-                    for pat in ["<skills>", "<technical skills>", "<list skills>", "<skills*>"]:
-                        find_replace_in_range(story, pat, skills_replace, wildcard='*' in pat)
-                if education_replace:
-                    edu_pats = [
-                        "<List candidate’s education background>",
-                        "<List candidate’s education background>",
-                        "<list candidate’s education background>",
-                        "<list candidate’s education background>",
-                        "list candidate’s education background",
-                        "list candidate’s education background",
-                        "education background",
-                        "<education background>",
-                        "<education>",
-                        "<academic background>",
-                        "<academic qualifications>",
-                    ]
-                    for pat in edu_pats:
-                        find_replace_in_range(story, pat, education_replace, wildcard=False)
+                find_replace_in_range(story, story_ops)
                 story = story.NextStoryRange
 
             # Also traverse shapes explicitly (in case some shapes are not part of StoryRanges loop)
@@ -272,85 +684,123 @@ class WordFormatter:
                 for shp in shapes:
                     try:
                         if shp.TextFrame.HasText:
-                            rng = shp.TextFrame.TextRange
-                            # Candidate name
-                            if bracket_name:
-                                find_replace_in_range(rng, candidate_name, bracket_name)
-                                find_replace_in_range(rng, candidate_name.upper(), bracket_name)
-                            if summary_replace:
-                                for pat in ["<summary>", "<professional summary>", "<profile>"]:
-                                    find_replace_in_range(rng, pat, summary_replace)
-                            if skills_replace:
-                                for pat in ["<skills>", "<technical skills>", "<list skills>"]:
-                                    find_replace_in_range(rng, pat, skills_replace)
-                            if education_replace:
-                                for pat in [
-                                    "<List candidate’s education background>",
-                                    "<List candidate’s education background>",
-                                    "<list candidate’s education background>",
-                                    "<list candidate’s education background>",
-                                    "list candidate’s education background",
-                                    "list candidate’s education background",
-                                    "education background",
-                                ]:
-                                    find_replace_in_range(rng, pat, education_replace)
+                            find_replace_in_range(shp.TextFrame.TextRange, shape_ops)
                     except Exception:
                         continue
 
             replace_in_shapes(doc.Shapes)
+            # Primary/first-page/even headers and footers; most sections only define the
+            # primary ones, so skip the rest before touching their Shapes collection
             for sec in doc.Sections:
-                replace_in_shapes(sec.Headers(1).Shapes)
-                replace_in_shapes(sec.Headers(2).Shapes)
-                replace_in_shapes(sec.Headers(3).Shapes)
-                replace_in_shapes(sec.Footers(1).Shapes)
-                replace_in_shapes(sec.Footers(2).Shapes)
-                replace_in_shapes(sec.Footers(3).Shapes)
+                for hf_collection in (sec.Headers, sec.Footers):
+                    for hf_index in (1, 2, 3):
+                        hf = hf_collection(hf_index)
+                        if not hf.Exists:
+                            continue
+                        shapes = hf.Shapes
+                        if shapes.Count:
+                            replace_in_shapes(shapes)
 
             doc.Save()
             doc.Close(False)
-            word.Quit()
-            pythoncom.CoUninitialize()  # Clean up COM
             print("✓ COM post-processing complete (shapes/text boxes handled)")
         except Exception as e:
             print(f"⚠️  COM post-processing error: {e}")
-            try:
-                import pythoncom
-                pythoncom.CoUninitialize()
-            except:
-                pass
+        finally:
+            # _release_word uninitializes COM itself once the last hold is dropped
+            self._release_word()
 
-    def _scan_primary_anchors(self, doc):
+    @cached_property
+    def _com_summary_replace(self):
+        """SUMMARY payload for Word COM replacement (built on first use)"""
+        summary_lines = self._find_matching_resume_section('summary', self.resume_data.get('sections', {})) or []
+        summary_text = (self.resume_data.get('summary') or '').strip()
+        summary_replace = ''
+        if summary_lines:
+            summary_replace = '\r'.join(
+                '• ' + stripped.lstrip(_BULLET_LEAD_CHARS)
+                for stripped in (s.strip() for s in summary_lines) if stripped
+            )
+        elif summary_text:
+            summary_replace = summary_text
+        return summary_replace
+    
+    @cached_property
+    def _com_skills_replace(self):
+        """SKILLS payload for Word COM replacement (built on first use; COM has a 255 char limit per field)"""
+        skill_lines = []
+        total = -1  # running length of the '\r'-joined payload
+        for s in self.resume_data.get('skills', []) or []:  # Include all skills (will truncate if exceeds COM limit)
+            skill_name = (s if isinstance(s, str) else s.get('name', '')).strip()
+            if skill_name and len(skill_name) < 50:  # Skip very long skill names
+                entry = '• ' + skill_name
+                skill_lines.append(entry)
+                total += len(entry) + 1
+                if total > 255:
+                    # Over the limit already; later skills would be cut off anyway
+                    return '\r'.join(skill_lines)[:252] + '...'
+        return '\r'.join(skill_lines)
+    
+    @cached_property
+    def _com_education_replace(self):
+        """EDUCATION payload for Word COM replacement (built on first use; COM has a 255 char limit per field)"""
+        education = self.resume_data.get('education', []) or []
+        if not education:
+            sect = self._find_matching_resume_section('education', self.resume_data.get('sections', {})) or []
+            if sect:
+                education = self._build_education_from_bullets(sect)
+        edu_lines = []
+        for edu in education:  # Include all entries (will truncate if exceeds COM limit)
+            deg = (edu.get('degree') or '').strip()
+            inst = (edu.get('institution') or '').strip()
+            yr = self._clean_duration((edu.get('year') or '').strip())
+            
+            # Keep it short for COM
+            if deg and len(deg) > 50:
+                deg = deg[:47] + '...'
+            if inst and len(inst) > 40:
+                inst = inst[:37] + '...'
+            
+            parts = []
+            if deg:
+                parts.append(deg)
+            if inst:
+                parts.append(inst)
+            if yr:
+                parts.append(yr)
+            line = ' - '.join(parts[:-1]) if len(parts) > 1 else (parts[0] if parts else '')
+            if yr and line:
+                line = f"{line} {yr}"
+            if line and len(line) < 200:  # Safety check
+                edu_lines.append('• ' + line)
+        education_replace = '\r'.join(edu_lines)
+        
+        # Limit total length to 255 chars (Word COM limit)
+        if len(education_replace) > 255:
+            education_replace = education_replace[:252] + '...'
+        return education_replace
+    
+    def _scan_primary_anchors(self, doc, upper_texts=None):
         """Scan the template once to locate primary anchors for SUMMARY, SKILLS, EMPLOYMENT, EDUCATION.
         If multiple EDUCATION headings exist and one is embedded immediately after EMPLOYMENT
         (likely sample content), pick the later EDUCATION heading as the primary.
+        upper_texts, when given, holds each paragraph's stripped uppercase text.
         Returns (primary_anchors, all_anchors).
         """
-        def is_heading_text(t):
-            if not t:
-                return False
-            t = t.strip()
-            return len(t) < 50
-
-        keys = {
-            'EMPLOYMENT': ['EMPLOYMENT HISTORY', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'CAREER HISTORY', 'EMPLOYMENT', 'EXPERIENCE'],
-            'EDUCATION': ['EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND', 'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS', 'EDUCATION BACKGROUND', 'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'TRAINING', 'ACADEMICS', 'EDUCATION/CERTIFICATES', 'EDUCATION / CERTIFICATES'],
-            'SKILLS': ['SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'EXPERTISE', 'ABILITIES'],
-            'SUMMARY': ['SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE', 'CAREER SUMMARY', 'EXECUTIVE SUMMARY', 'OVERVIEW'],
-            'PROJECTS': ['PROJECTS', 'PORTFOLIO', 'PERSONAL PROJECTS', 'KEY PROJECTS'],
-            'AWARDS': ['AWARDS', 'ACHIEVEMENTS', 'HONORS', 'RECOGNITION', 'ACCOMPLISHMENTS'],
-            'PUBLICATIONS': ['PUBLICATIONS', 'PAPERS', 'ARTICLES', 'RESEARCH'],
-            'LANGUAGES': ['LANGUAGES', 'LANGUAGE SKILLS'],
-            'REFERENCES': ['REFERENCES', 'RECOMMENDATIONS']
-        }
-        all_anchors = {k: [] for k in keys}
-        for idx, p in enumerate(doc.paragraphs):
-            txt = (p.text or '').strip().upper()
-            if not is_heading_text(txt):
-                continue
-            for k, aliases in keys.items():
-                if any(a == txt or txt.startswith(a) for a in aliases):
-                    all_anchors[k].append(idx)
-                    break
+        all_anchors = {k: [] for k in _ANCHOR_KEYS}
+        
+        # One line per paragraph (non-headings blanked so line numbers stay paragraph indices);
+        # the anchor regex then finds every heading in a single pass over the joined buffer
+        if upper_texts is None:
+            upper_texts = _upper_paragraph_texts(doc.paragraphs)
+        lines = [txt.replace('\n', '\r') if len(txt) < 50 else '' for txt in upper_texts]
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        for m in _ANCHOR_RE.finditer('\n'.join(lines)):
+            all_anchors[m.lastgroup].append(bisect_right(line_starts, m.start()) - 1)
 
         primary = {k: (v[0] if v else None) for k, v in all_anchors.items()}
 
@@ -372,7 +822,7 @@ class WordFormatter:
 
         return primary, all_anchors
     
-    def _build_template_order_map(self, doc):
+    def _build_template_order_map(self, doc, upper_texts=None):
         """Build a map of template section order to respect original template structure"""
         print("\n📋 Building template section order map...")
         
@@ -393,8 +843,9 @@ class WordFormatter:
             'REFERENCES': ['REFERENCES']
         }
         
-        for para_idx, para in enumerate(doc.paragraphs):
-            text = para.text.strip().upper()
+        if upper_texts is None:
+            upper_texts = _upper_paragraph_texts(doc.paragraphs)
+        for para_idx, text in enumerate(upper_texts):
             if len(text) < 50 and len(text) > 0:  # Likely a heading
                 for section_name, keywords in section_keywords.items():
                     if any(kw in text for kw in keywords):
@@ -409,31 +860,28 @@ class WordFormatter:
         print(f"  📊 Template order: {' → '.join(self._template_section_order)}")
         print(f"  📍 Last section position: {self._last_known_section_position}")
     
-    def _add_dynamic_candidate_sections(self, doc):
-        """
-        Dynamically detect and add any sections from candidate resume that don't exist in template.
-        This handles custom sections like hobbies, volunteer work, publications, etc.
-        Sections are added AFTER all template sections in template's formatting style.
-        """
-        added_count = 0
-        
+    def _template_section_names_lower(self):
+        """Lowercased template headings, rebuilt only when the headings change"""
+        key = tuple(self._existing_template_sections.values())
+        cached = getattr(self, '_template_names_cache', None)
+        if cached is None or cached[0] != key:
+            cached = (key, [heading.lower() for heading in key])
+            self._template_names_cache = cached
+        return cached[1]
+    
+    def _iter_dynamic_sections(self):
+        """Yield (name, content) for non-empty candidate sections the template doesn't already have"""
         # Get all section names from candidate resume
         candidate_sections = self.resume_data.get('sections', {})
         
-        # Standard sections that we already handle
-        standard_sections = {
-            'summary', 'profile', 'objective', 'professional_summary',
-            'employment', 'experience', 'work_history', 'work_experience', 'professional_experience',
-            'education', 'academic_background', 'certificates', 'certifications',
-            'skills', 'technical_skills', 'core_competencies'
-        }
+        standard_sections = self._STANDARD_SECTIONS
+        template_names = self._template_section_names_lower()
         
-        # Find sections in candidate resume that aren't in template
-        dynamic_sections = {}
         for section_name, section_content in candidate_sections.items():
             section_lower = section_name.lower().replace('_', ' ').replace('-', ' ')
             
             # Skip if it's a standard section we already processed
+            # (substring test: 'skillset' and 'work experiences' count as standard too)
             if any(std in section_lower for std in standard_sections):
                 continue
             
@@ -441,63 +889,72 @@ class WordFormatter:
             if not section_content or (isinstance(section_content, list) and len(section_content) == 0):
                 continue
             
-            # Check if this section already exists in template
-            section_exists = False
-            for template_section in self._existing_template_sections.values():
-                if section_lower in template_section.lower() or template_section.lower() in section_lower:
-                    section_exists = True
-                    break
+            # Check if this section already exists in template (substring containment either way)
+            section_exists = any(
+                section_lower in template_name or template_name in section_lower
+                for template_name in template_names
+            )
             
             if not section_exists:
-                dynamic_sections[section_name] = section_content
                 print(f"  🔍 Found dynamic section: {section_name} ({len(section_content) if isinstance(section_content, list) else 1} items)")
-        
-        if not dynamic_sections:
-            return 0
-        
-        # Find insertion point: after last template section
-        insertion_point = self._last_known_section_position + 10
-        if insertion_point >= len(doc.paragraphs):
-            insertion_point = len(doc.paragraphs) - 1
-        
-        print(f"  📍 Will insert dynamic sections after paragraph {insertion_point}")
-        
-        # Add each dynamic section
-        for section_name, content in dynamic_sections.items():
+                yield section_name, section_content
+    
+    def _add_dynamic_candidate_sections(self, doc):
+        """
+        Dynamically detect and add any sections from candidate resume that don't exist in template.
+        This handles custom sections like hobbies, volunteer work, publications, etc.
+        Sections are added AFTER all template sections in template's formatting style.
+        """
+        added_count = 0
+        tail_p = None
+        heading_proto = None
+        
+        for section_name, content in self._iter_dynamic_sections():
+            if heading_proto is None:
+                # First dynamic section: resolve the insertion point and formatting once.
+                # doc.paragraphs is materialized only here; later sections chain off tail_p
+                paragraphs = doc.paragraphs
+                insertion_point = min(self._last_known_section_position + 10, len(paragraphs) - 1)
+                print(f"  📍 Will insert dynamic sections after paragraph {insertion_point}")
+                if insertion_point >= 0:
+                    tail_p = paragraphs[insertion_point]._p
+                
+                # Heading/bullet paragraphs are built once and deep-copied per insert,
+                # so each item is a single lxml addnext with no Paragraph/Run wrappers
+                heading_proto = self._make_paragraph_proto(
+                    Pt(11), bold=True, space_before=Pt(6), space_after=Pt(3)
+                )
+                bullet_proto = self._make_paragraph_proto(
+                    Pt(10), left_indent=Inches(0.25), space_after=Pt(2)
+                )
+            
             try:
                 # Format section name
                 display_name = section_name.replace('_', ' ').replace('-', ' ').title()
                 
                 # Insert section heading
-                if insertion_point < len(doc.paragraphs):
-                    anchor_para = doc.paragraphs[insertion_point]
-                    heading_para = self._insert_paragraph_after(anchor_para, display_name.upper())
+                heading_p = deepcopy(heading_proto)
+                heading_p.r_lst[0].text = display_name.upper()
+                if tail_p is not None:
+                    tail_p.addnext(heading_p)
                 else:
-                    heading_para = doc.add_paragraph(display_name.upper())
-                
-                # Format heading
-                for run in heading_para.runs:
-                    run.bold = True
-                    run.font.size = Pt(11)
-                heading_para.paragraph_format.space_before = Pt(6)
-                heading_para.paragraph_format.space_after = Pt(3)
+                    doc.element.body._insert_p(heading_p)
                 
                 # Insert content
-                last_para = heading_para
+                last_p = heading_p
                 content_list = content if isinstance(content, list) else [content]
                 
                 for item in content_list:
                     item_text = str(item).strip()
                     if item_text:
-                        content_para = self._insert_paragraph_after(last_para, f"• {item_text}")
-                        content_para.paragraph_format.left_indent = Inches(0.25)
-                        for run in content_para.runs:
-                            run.font.size = Pt(10)
-                        content_para.paragraph_format.space_after = Pt(2)
-                        last_para = content_para
+                        bullet_p = deepcopy(bullet_proto)
+                        bullet_p.r_lst[0].text = f"• {item_text}"
+                        last_p.addnext(bullet_p)
+                        last_p = bullet_p
                 
+                # Next section goes straight after this one
+                tail_p = last_p
                 added_count += 1
-                insertion_point += len(content_list) + 2
                 print(f"  ✅ Added {display_name} section with {len(content_list)} items")
                 
             except Exception as e:
@@ -513,13 +970,16 @@ class WordFormatter:
         # Open template
         doc = Document(self.template_path)
         
-        print(f"✓ Template loaded: {len(doc.paragraphs)} paragraphs, {len(doc.tables)} tables")
+        # Read every paragraph's text once: the anchor scan, the section order map and the
+        # CAI CONTACT lookup below all run on it before the template is modified
+        upper_texts = _upper_paragraph_texts(doc.paragraphs)
+        print(f"✓ Template loaded: {len(upper_texts)} paragraphs, {len(doc.tables)} tables")
         
         # Pre-scan anchors so we always insert into the correct template sections
-        self._primary_anchors, self._all_anchors = self._scan_primary_anchors(doc)
+        self._primary_anchors, self._all_anchors = self._scan_primary_anchors(doc, upper_texts)
         
         # Build template section order map
-        self._build_template_order_map(doc)
+        self._build_template_order_map(doc, upper_texts)
         
         # Initialize section tracking flags
         self._summary_inserted = False
@@ -538,15 +998,11 @@ class WordFormatter:
         # Ensure CAI CONTACT section is inserted with persistent data ONLY if template has it
         try:
             # Check if template has CAI CONTACT section
-            has_cai_contact = False
-            for p in doc.paragraphs[:20]:  # Check first 20 paragraphs
-                if 'CAI CONTACT' in (p.text or '').upper():
-                    has_cai_contact = True
-                    break
+            has_cai_contact = any('CAI CONTACT' in t for t in upper_texts[:20])  # Check first 20 paragraphs
             
             if has_cai_contact:
                 print(f"  ✓ Template has CAI CONTACT section, will process it")
-                self._ensure_cai_contact(doc)
+                self._ensure_cai_contact(doc, upper_texts)
             else:
                 print(f"  ⏭️  Template does not have CAI CONTACT section, skipping")
         except Exception as e:
@@ -591,10 +1047,6 @@ class WordFormatter:
             self.resume_data['education'] = enhanced_education
             print(f"  🎓 Enhanced education extraction: {len(enhanced_education)} comprehensive entries")
         
-        # Create comprehensive replacement map
-        replacements = self._create_replacement_map()
-        print(f"\n📝 Created {len(replacements)} replacement mappings")
-        
         # CRITICAL: Process skills tables in-place based on table headers (respect template order)
         # DO NOT MOVE OR RECREATE TABLES - FILL IN ORIGINAL POSITION ONLY
         table_replaced = 0
@@ -647,7 +1099,7 @@ class WordFormatter:
         # Role usually appears after multiple spaces or on same line
         if candidate_name:
             # Split by multiple spaces or newlines
-            name_parts = re.split(r'\s{2,}|\n', candidate_name)
+            name_parts = _NAME_ROLE_SPLIT_RE.split(candidate_name)
             if len(name_parts) > 1:
                 # First part is usually the actual name
                 candidate_name = name_parts[0].strip()
@@ -669,12 +1121,6 @@ class WordFormatter:
         self._name_anchor_idx = None
         try:
             # Look for name or name placeholder in main content area (skip early CAI CONTACT section)
-            name_placeholder_patterns = [
-                r'<\s*[Cc]andidate[^>]*[Nn]ame[^>]*>',
-                r'<\s*[Nn]ame\s*>',
-                r'<\s*[Ff]ull\s*[Nn]ame\s*>',
-                r'<\s*YOUR\s*NAME\s*>',
-            ]
             for idx, p in enumerate(doc.paragraphs[:40]):
                 t = (p.text or '').strip()
                 # Skip very early paragraphs (likely CAI CONTACT) - increased from 5 to 10
@@ -689,12 +1135,9 @@ class WordFormatter:
                     print(f"  📍 Name anchor found at paragraph {idx}: '{t}'")
                     break
                 # Check for name placeholder patterns
-                for pat in name_placeholder_patterns:
-                    if re.search(pat, t):
-                        self._name_anchor_idx = idx
-                        print(f"  📍 Name placeholder anchor found at paragraph {idx}: '{t[:50]}'")
-                        break
-                if self._name_anchor_idx is not None:
+                if _NAME_PLACEHOLDER_RE.search(t):
+                    self._name_anchor_idx = idx
+                    print(f"  📍 Name placeholder anchor found at paragraph {idx}: '{t[:50]}'")
                     break
         except Exception as e:
             print(f"  ⚠️  Name anchor detection error: {e}")
@@ -712,12 +1155,18 @@ class WordFormatter:
             scan_limit = min(emp_idx, left_boundary) if emp_idx is not None else left_boundary
             
             if scan_limit and scan_limit > 0:
+                # One snapshot of the paragraph list; headings are collected and removed
+                # together after the scan instead of re-walking the body per deletion
+                paragraphs = doc.paragraphs
+                victims = []
+                # Uppercased text per index, read once unless the paragraph is cleared
+                upper_texts = {}
                 # Only scan the early CAI CONTACT area, not the entire document
-                for idx in range(scan_limit - 1, -1, -1):  # Reverse order to avoid index issues
-                    if idx >= len(doc.paragraphs):
-                        continue
-                    para = doc.paragraphs[idx]
-                    t = (para.text or '').strip().upper()
+                for idx in range(min(scan_limit, len(paragraphs)) - 1, -1, -1):
+                    para = paragraphs[idx]
+                    t = upper_texts.get(idx)
+                    if t is None:
+                        t = upper_texts[idx] = (para.text or '').strip().upper()
                     
                     # Check if this is a SKILLS heading in the CAI CONTACT area
                     if t in ('SKILLS', 'TECHNICAL SKILLS') or ('SKILLS' in t and len(t) < 30):
@@ -725,84 +1174,111 @@ class WordFormatter:
                         # Clear content after this heading until next section or for ~20 lines
                         j = idx + 1
                         cleared = 0
-                        while j < len(doc.paragraphs) and cleared < 20:
-                            para_j = doc.paragraphs[j]
-                            txt = (para_j.text or '').strip().upper()
+                        while j < len(paragraphs) and cleared < 20:
+                            para_j = paragraphs[j]
+                            p_j = para_j._p
+                            if p_j in victims:
+                                # Already queued for removal (as if deleted earlier in the scan)
+                                j += 1
+                                continue
+                            txt = upper_texts.get(j)
+                            if txt is None:
+                                txt = upper_texts[j] = (para_j.text or '').strip().upper()
                             # Stop at next major section
-                            if len(txt) < 50 and any(h in txt for h in ['EMPLOYMENT', 'WORK HISTORY', 'EDUCATION', 'SUMMARY', 'CAI CONTACT', 'CERTIFICATIONS']):
+                            if len(txt) < 50 and _CAI_SKILLS_STOP_HEADINGS_RE.search(txt):
                                 break
-                            try:
-                                for r in para_j.runs:
-                                    r.text = ''
-                            except Exception:
-                                pass
+                            # Empty the runs but keep their properties, like run.text = ''
+                            _clear_paragraph_runs([para_j])
+                            # Hyperlink text survives the clearing, so re-read it if visited again
+                            upper_texts.pop(j, None)
                             j += 1
                             cleared += 1
-                        # Delete the SKILLS heading itself
-                        try:
-                            self._delete_paragraph(para)
-                            skills_removed += 1
-                        except Exception:
-                            pass
+                        victims.append(para._p)
+                
+                # Delete the SKILLS headings themselves
+                for p_el in victims:
+                    parent = p_el.getparent()
+                    if parent is not None:
+                        parent.remove(p_el)
+                        skills_removed += 1
             print(f"  ✅ Removed {skills_removed} SKILLS section(s) from CAI CONTACT area")
         except Exception as e:
             print(f"  ⚠️  Pre-pass error: {e}")
         
+        # Body paragraphs with a "<" in any text node, found by one libxml2 XPath pass
+        angle_paras = set(doc.element.body.xpath("./w:p[.//w:t[contains(., '<')]]"))
+        # Paragraphs inside any table, so the in-table checks are a set lookup instead of an ancestor walk
+        table_paras = set(doc.element.body.xpath('.//w:tbl//w:p'))
+        # Primary anchors are only rewritten by the dynamic-section pass after this loop
+        emp_anchor_idx = self._primary_anchors.get('EMPLOYMENT')
+        edu_anchor_idx = self._primary_anchors.get('EDUCATION')
+        
         for para_idx, paragraph in enumerate(doc.paragraphs):
-            if not paragraph.text.strip():
+            # paragraph.text walks every run, so it is read once here and re-read only
+            # after a step that may have rewritten this paragraph
+            para_text = paragraph.text
+            if not para_text.strip():
                 continue
                 
-            # Check each replacement
-            for key, value in replacements.items():
-                if self._text_contains(paragraph.text, key):
-                    print(f"  📍 Found '{key}' in paragraph {para_idx}: '{paragraph.text[:50]}...'")
-                    count = self._replace_in_paragraph(paragraph, key, value)
-                    if count > 0:
-                        print(f"  ✅ Replaced with: '{value[:50]}...'")
-                    else:
-                        print(f"  ⚠️  Found but couldn't replace (might be in multiple runs)")
-
-            # Regex-driven fallback for angle bracket placeholders with variations
-            # Candidate name generic patterns - very flexible to catch all variations
-            name_patterns = [
-                r"<\s*Candidate['']?s?\s+full\s+name\s*>",
-                r"<\s*Candidate['']?s?\s+name\s*>",
-                r"<\s*Name\s*>",
-                r"<\s*Full\s+Name\s*>",
-                r"<\s*YOUR\s+NAME\s*>",
-            ]
-            for pat in name_patterns:
-                if re.search(pat, paragraph.text, re.IGNORECASE):
-                    before = paragraph.text
+            # Check each replacement found in this paragraph; once one is replaced the
+            # text has changed, so every later key is checked again as before
+            # (the replacement map and matcher are only built once a non-blank paragraph shows up)
+            matched_keys = self._placeholder_matcher(para_text.lower())
+            if matched_keys:
+                # Replacement values (e.g. "<Name>") can bring a "<" into the paragraph
+                angle_paras.add(paragraph._p)
+                replacements = self._replacement_map
+                for key, value in replacements.items():
+                    if key not in matched_keys:
+                        continue
+                    if self._text_contains(paragraph.text, key):
+                        matched_keys = replacements
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"📍 Found '{key}' in paragraph {para_idx}: '{paragraph.text[:50]}...'")
+                        count = self._replace_in_paragraph(paragraph, key, value)
+                        if count > 0:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"✅ Replaced with: '{value[:50]}...'")
+                        else:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"⚠️  Found but couldn't replace (might be in multiple runs)")
+                para_text = paragraph.text
+
+            # Every name and <...> placeholder pattern needs a "<", so paragraphs outside
+            # angle_paras skip those scans (and the paragraph.text reads behind them) entirely
+            has_angle = paragraph._p in angle_paras
+            if has_angle and '<' in para_text:
+                # Regex-driven fallback for angle bracket placeholders with variations
+                # Candidate name generic patterns - very flexible to catch all variations
+                if _NAME_ALT_RE.search(para_text):
+                    before = para_text
                     # Replace with actual candidate name while preserving formatting
-                    new_text = re.sub(pat, candidate_name, paragraph.text, flags=re.IGNORECASE)
+                    new_text = _NAME_ALT_RE.sub(candidate_name, before)
                     if new_text != before:
                         self._replace_text_preserve_style(paragraph, new_text)
                         print(f"  ✅ Replaced name placeholder with '{candidate_name}' (formatting preserved)")
                         replaced_count += 1
 
-            # Generic catch-all: any <...> containing both 'candidate' and 'name' (any order)
-            generic_name_pat = r"<[^>]*(?:candidate[^>]*name|name[^>]*candidate)[^>]*>"
-            if re.search(generic_name_pat, paragraph.text, re.IGNORECASE):
-                before = paragraph.text
-                # Replace with actual candidate name while preserving formatting
-                new_text = re.sub(generic_name_pat, candidate_name, paragraph.text, flags=re.IGNORECASE)
-                if new_text != before:
-                    self._replace_text_preserve_style(paragraph, new_text)
-                    print(f"  ✅ Replaced name placeholder with '{candidate_name}' (formatting preserved)")
-                    replaced_count += 1
+                # Generic catch-all: any <...> containing both 'candidate' and 'name' (any order)
+                if _GENERIC_NAME_RE.search(paragraph.text):
+                    before = paragraph.text
+                    # Replace with actual candidate name while preserving formatting
+                    new_text = _GENERIC_NAME_RE.sub(candidate_name, before)
+                    if new_text != before:
+                        self._replace_text_preserve_style(paragraph, new_text)
+                        print(f"  ✅ Replaced name placeholder with '{candidate_name}' (formatting preserved)")
+                        replaced_count += 1
+                para_text = paragraph.text
 
             # CRITICAL: Check if this is an EMPLOYMENT HISTORY section heading
             if not self._experience_inserted:
-                para_upper = paragraph.text.strip().upper()
-                is_emp_heading = any(h in para_upper for h in [
-                    'EMPLOYMENT HISTORY', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE',
-                    'WORK EXPERIENCE', 'CAREER HISTORY', 'EMPLOYMENT'
-                ])
+                # Headings are short: check length before uppercasing and scanning
+                para_stripped = para_text.strip()
+                is_emp_heading = len(para_stripped) < 50 and _EMP_HEADING_RE.search(para_stripped.upper()) is not None
                 
                 # NOTE: We don't gate by primary anchor here because paragraph indices shift after insertions
                 # Instead, we rely on the _experience_inserted flag to prevent duplicates
-                if is_emp_heading and len(paragraph.text.strip()) < 50:
+                if is_emp_heading:
                     print(f"  💼 Found EMPLOYMENT HISTORY heading at paragraph {para_idx}: '{paragraph.text[:60]}'")
                     
                     # CRITICAL: Preserve and format the heading text
@@ -832,69 +1308,64 @@ class WordFormatter:
                         # CRITICAL: Clear ALL content between EMPLOYMENT heading and next section
                         # This prevents old template content, sample names, and placeholders from remaining
                         paras_to_clear = []
-                        stop_headings = [
-                            'EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND',
-                            'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS',
-                            'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'ACADEMICS',
-                            'SKILLS', 'TECHNICAL SKILLS',
-                            'SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE',
-                            'PROJECTS', 'AWARDS', 'REFERENCES'
-                        ]
                         
                         # Scan ahead and collect paragraphs to clear
-                        for check_idx in range(para_idx + 1, min(para_idx + 150, len(doc.paragraphs))):
-                            check_para = doc.paragraphs[check_idx]
-                            check_text = check_para.text.strip().upper()
+                        paragraphs = _BodyParagraphs(doc)
+                        for check_idx, check_para in enumerate(paragraphs[para_idx + 1:para_idx + 150], start=para_idx + 1):
                             check_text_full = check_para.text.strip()
+                            check_text = check_text_full.upper()
                             
                             # CRITICAL: Skip if this looks like the heading itself being re-checked
                             if check_idx == para_idx:
                                 continue
                             
                             # Stop at next major section heading
-                            if any(h in check_text for h in stop_headings) and len(check_text) < 50:
+                            if len(check_text) < 50 and _EMP_STOP_HEADINGS_RE.search(check_text):
                                 # Check if this is an education-related heading (EDUCATION, CERTIFICATES, etc.)
-                                is_edu_related = any(edu_term in check_text for edu_term in [
-                                    'EDUCATION', 'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS',
-                                    'ACADEMIC', 'QUALIFICATIONS', 'ACADEMICS'
-                                ])
+                                is_edu_related = _EDU_STOP_TERMS_RE.search(check_text) is not None
                                 
                                 if is_edu_related:
-                                    primary_edu = self._primary_anchors.get('EDUCATION')
+                                    primary_edu = edu_anchor_idx
                                     # Only stop at education section, don't clear it
                                     if primary_edu is not None and check_idx == primary_edu:
-                                        print(f"     → Stopped at primary EDUCATION section at {check_idx}")
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug(f"→ Stopped at primary EDUCATION section at {check_idx}")
                                         break
                                     else:
                                         # Could be the actual education section even if not marked as primary
                                         # Stop here to be safe, don't clear it
-                                        print(f"     → Stopped at EDUCATION-related section at {check_idx}: {check_text[:40]}")
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug(f"→ Stopped at EDUCATION-related section at {check_idx}: {check_text[:40]}")
                                         break
                                 else:
-                                    print(f"     → Stopped at section: {check_text[:30]}")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"→ Stopped at section: {check_text[:30]}")
                                     break
                             
                             # AGGRESSIVE: Clear paragraphs that look like sample data
                             # Check for sample names (like "ADIKA MAUL")
-                            if re.search(r'^[A-Z][A-Z\s]{5,30}$', check_text_full.strip()):
-                                print(f"     → Clearing sample name: {check_text_full[:40]}")
+                            if _SAMPLE_NAME_RE.search(check_text_full):
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"→ Clearing sample name: {check_text_full[:40]}")
                                 paras_to_clear.append(check_para)
                                 continue
                             
                             # Check for contact info patterns
-                            if re.search(r'\d{3}[-.]?\d{3}[-.]?\d{4}', check_text_full) and '@' in check_text_full:
-                                print(f"     → Clearing contact info: {check_text_full[:40]}")
+                            if _PHONE_RE.search(check_text_full) and '@' in check_text_full:
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"→ Clearing contact info: {check_text_full[:40]}")
                                 paras_to_clear.append(check_para)
                                 continue
                             
                             # Check for "EXPERIENCE" heading (not same as EMPLOYMENT HISTORY)
-                            if check_text.strip() == 'EXPERIENCE' and len(check_text) < 15:
-                                print(f"     → Clearing duplicate EXPERIENCE heading at {check_idx}")
+                            if check_text == 'EXPERIENCE':
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"→ Clearing duplicate EXPERIENCE heading at {check_idx}")
                                 paras_to_clear.append(check_para)
                                 continue
                             
                             # Skip empty paragraphs (don't clear them, they're spacing)
-                            if not check_text_full.strip():
+                            if not check_text_full:
                                 continue
                             
                             # Clear this paragraph
@@ -915,8 +1386,9 @@ class WordFormatter:
                         next_para = None
                         is_instruction = False
                         
-                        if para_idx + 1 < len(doc.paragraphs):
-                            next_para = doc.paragraphs[para_idx + 1]
+                        paragraphs = _BodyParagraphs(doc)
+                        if para_idx + 1 < len(paragraphs):
+                            next_para = paragraphs[para_idx + 1]
                             next_text = next_para.text.strip().lower()
                             
                             # Check if next paragraph is instructional text
@@ -933,41 +1405,38 @@ class WordFormatter:
                                 print(f"     → Will insert {len(experience_data)} experience entries after heading")
                                 
                                 # Clear the instructional paragraph
-                                for run in next_para.runs:
-                                    run.text = ''
+                                _clear_paragraph_runs([next_para])
                                 
                                 # CRITICAL: Clear any existing employment content after instructional text
                                 paras_to_clear = []
-                                for check_idx in range(para_idx + 2, min(para_idx + 50, len(doc.paragraphs))):
-                                    check_para = doc.paragraphs[check_idx]
+                                paragraphs = _BodyParagraphs(doc)
+                                for check_idx, check_para in enumerate(paragraphs[para_idx + 2:para_idx + 50], start=para_idx + 2):
                                     check_text = check_para.text.strip().upper()
                                     
                                     # Stop if we hit another section heading
-                                    if any(h in check_text for h in ['EMPLOYMENT', 'WORK HISTORY', 'SKILLS', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']) and len(check_text) < 50:
-                                        print(f"     → Stopped clearing at section: {check_text[:30]}")
+                                    if len(check_text) < 50 and _BLOCK_STOP_HEADINGS_RE.search(check_text):
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug(f"→ Stopped clearing at section: {check_text[:30]}")
                                         break
                                     
                                     # Clear this paragraph (it's old employment content)
                                     paras_to_clear.append(check_para)
                                 
                                 print(f"     → Clearing {len(paras_to_clear)} old content paragraphs")
-                                for p in paras_to_clear:
-                                    try:
-                                        for run in p.runs:
-                                            run.text = ''
-                                    except:
-                                        pass
+                                _clear_paragraph_runs(paras_to_clear)
                                 
                                 # Insert employment blocks after the cleared paragraph
                                 last_element = next_para
                                 inserted_count = 0
                                 for idx, exp in enumerate(experience_data):  # Insert ALL employment entries
-                                    print(f"        → Inserting job {idx+1}/{len(experience_data)}: {exp.get('company', 'N/A')[:25]} | {exp.get('role', 'N/A')[:25]}")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"→ Inserting job {idx+1}/{len(experience_data)}: {exp.get('company', 'N/A')[:25]} | {exp.get('role', 'N/A')[:25]}")
                                     block = self._insert_experience_block(doc, last_element, exp)
                                     if block:
                                         last_element = block
                                         inserted_count += 1
-                                        print(f"           ✓ Inserted successfully (total: {inserted_count})")
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug(f"✓ Inserted successfully (total: {inserted_count})")
                                     else:
                                         print(f"           ✗ Failed to insert")
                                 print(f"     ✅ Successfully inserted {inserted_count} employment entries")
@@ -983,37 +1452,35 @@ class WordFormatter:
                             print(f"     → No instructional text found, clearing existing employment content")
                             
                             paras_to_clear = []
-                            for check_idx in range(para_idx + 1, min(para_idx + 50, len(doc.paragraphs))):
-                                check_para = doc.paragraphs[check_idx]
+                            paragraphs = _BodyParagraphs(doc)
+                            for check_idx, check_para in enumerate(paragraphs[para_idx + 1:para_idx + 50], start=para_idx + 1):
                                 check_text = check_para.text.strip().upper()
                                 
                                 # Stop if we hit another section heading or end of document
                                 # CRITICAL: Include EDUCATION to prevent deleting it!
-                                if any(h in check_text for h in ['EMPLOYMENT', 'WORK HISTORY', 'EDUCATION', 'SKILLS', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']) and len(check_text) < 50:
-                                    print(f"     → Stopped clearing at section: {check_text[:30]}")
+                                if len(check_text) < 50 and _BLOCK_STOP_HEADINGS_WITH_EDU_RE.search(check_text):
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"→ Stopped clearing at section: {check_text[:30]}")
                                     break
                                 
                                 # Clear this paragraph (it's old employment content)
                                 paras_to_clear.append(check_para)
                             
                             print(f"     → Clearing {len(paras_to_clear)} old employment paragraphs")
-                            for p in paras_to_clear:
-                                try:
-                                    for run in p.runs:
-                                        run.text = ''
-                                except:
-                                    pass
+                            _clear_paragraph_runs(paras_to_clear)
                             
                             # Insert employment blocks after the heading
                             last_element = paragraph
                             inserted_count = 0
                             for idx, exp in enumerate(experience_data):  # Insert ALL employment entries
-                                print(f"        → Inserting job {idx+1}/{len(experience_data)}: {exp.get('company', 'N/A')[:25]} | {exp.get('role', 'N/A')[:25]}")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"→ Inserting job {idx+1}/{len(experience_data)}: {exp.get('company', 'N/A')[:25]} | {exp.get('role', 'N/A')[:25]}")
                                 block = self._insert_experience_block(doc, last_element, exp)
                                 if block:
                                     last_element = block
                                     inserted_count += 1
-                                    print(f"           ✓ Inserted successfully (total: {inserted_count})")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"✓ Inserted successfully (total: {inserted_count})")
                                 else:
                                     print(f"           ✗ Failed to insert")
                             print(f"     ✅ Successfully inserted {inserted_count} employment entries")
@@ -1022,25 +1489,20 @@ class WordFormatter:
                             self._employment_tail_para = last_element
                             print(f"  ✅ Inserted employment data after EMPLOYMENT HISTORY heading (no instruction text)")
                             replaced_count += 1
+                    para_text = paragraph.text
             
             # Employment placeholder generic patterns (very flexible)
             if not self._experience_inserted:
                 # Avoid inserting EXP content inside table cells (e.g., SKILLS table headers/columns)
                 try:
-                    if self._paragraph_in_table(paragraph):
+                    if paragraph._p in table_paras:
                         pass
                     else:
-                        emp_patterns = [
-                            r"<[^>]*list[^>]*candidate['']?s?[^>]*employment[^>]*history[^>]*>",
-                            r"<[^>]*employment[^>]*history[^>]*>",
-                            r"<[^>]*work[^>]*history[^>]*>",
-                            r"<[^>]*professional[^>]*experience[^>]*>",
-                            r"<[^>]*career[^>]*(history|experience)[^>]*>",
-                            r"<[^>]*history[^>]*(employ|employer|work|career)[^>]*>",
-                            r"<[^>]*list[^>]*employment[^>]*history[^>]*>",
-                        ]
-                        for emp_pat in emp_patterns:
-                            if re.search(emp_pat, paragraph.text, re.IGNORECASE):
+                        # The paragraph only changes on a match that then breaks out,
+                        # so one text read serves every pattern (same for the loops below)
+                        scan_text = para_text if has_angle else ''
+                        for emp_pat in (_EMP_PLACEHOLDER_PATTERNS if _EMP_PLACEHOLDER_RE.search(scan_text) else ()):
+                            if emp_pat.search(scan_text):
                                 print(f"  💼 Found employment placeholder in paragraph {para_idx}: '{paragraph.text[:60]}'")
                                 
                                 # Use structured experience data (not sections)
@@ -1074,11 +1536,9 @@ class WordFormatter:
                                     # Fallback: try to use sections data
                                     content = self._find_matching_resume_section('experience', self.resume_data.get('sections', {}))
                                     if content:
-                                        bullets = []
-                                        for item in content:  # Insert ALL items
-                                            if item.strip():
-                                                bullets.append('• ' + item.strip().lstrip('•').strip())
-                                        self._regex_replace_paragraph(paragraph, emp_pat, '\n'.join(bullets))
+                                        # Insert ALL items
+                                        bullet_text = '\n'.join(f"• {item.strip().lstrip('•').strip()}" for item in content if item.strip())
+                                        self._regex_replace_paragraph(paragraph, emp_pat, bullet_text)
                                         # Set flag even in fallback to prevent duplication
                                         self._experience_inserted = True
                                         print(f"  ✅ Regex replaced experience placeholder (fallback)")
@@ -1086,16 +1546,14 @@ class WordFormatter:
                                         break
                 except Exception:
                     pass
+                if has_angle:
+                    para_text = paragraph.text
 
             # CRITICAL: Check if this is a SUMMARY section heading (only before EMPLOYMENT)
             if not self._summary_inserted:
-                para_upper = paragraph.text.strip().upper()
-                is_summary_heading = any(h in para_upper for h in [
-                    'SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE',
-                    'CAREER SUMMARY', 'EXECUTIVE SUMMARY'
-                ])
+                para_upper = para_text.strip().upper()
+                is_summary_heading = _SUMMARY_HEADING_RE.search(para_upper) is not None
                 
-                emp_anchor_idx = self._primary_anchors.get('EMPLOYMENT')
                 name_idx = getattr(self, '_name_anchor_idx', None)
                 # Accept summary headings only if they are near the name (within 10 paras after name) and before employment
                 is_position_ok = False
@@ -1108,7 +1566,7 @@ class WordFormatter:
                     # Fallback: very early paragraphs only (before employment)
                     is_position_ok = (emp_anchor_idx is None and para_idx < 15) or (emp_anchor_idx is not None and para_idx < min(emp_anchor_idx, 15))
                 
-                if is_summary_heading and len(paragraph.text.strip()) < 50 and is_position_ok:
+                if is_summary_heading and len(para_text.strip()) < 50 and is_position_ok:
                     print(f"  📝 Found SUMMARY heading at paragraph {para_idx}: '{paragraph.text[:60]}'")
                     
                     summary_text = (self.resume_data.get('summary') or '').strip()
@@ -1119,34 +1577,28 @@ class WordFormatter:
                         
                         # CRITICAL: Clear ALL content between SUMMARY heading and next section
                         paras_to_clear = []
-                        stop_headings = ['EMPLOYMENT', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 
-                                        'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'CERTIFICATIONS']
                         
-                        for check_idx in range(para_idx + 1, min(para_idx + 30, len(doc.paragraphs))):
-                            check_para = doc.paragraphs[check_idx]
+                        paragraphs = _BodyParagraphs(doc)
+                        for check_idx, check_para in enumerate(paragraphs[para_idx + 1:para_idx + 30], start=para_idx + 1):
                             check_text = check_para.text.strip().upper()
                             
                             # Stop at next major section
-                            if any(h in check_text for h in stop_headings) and len(check_text) < 50:
-                                print(f"     → Stopped clearing at section: {check_text[:30]}")
+                            if len(check_text) < 50 and _SUMMARY_STOP_HEADINGS_RE.search(check_text):
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"→ Stopped clearing at section: {check_text[:30]}")
                                 break
                             
                             paras_to_clear.append(check_para)
                         
                         print(f"     → Clearing {len(paras_to_clear)} paragraphs in SUMMARY section")
-                        for p in paras_to_clear:
-                            try:
-                                for run in p.runs:
-                                    run.text = ''
-                            except:
-                                pass
+                        _clear_paragraph_runs(paras_to_clear)
                         
                         # Insert summary content
                         # Convert summary_text to lines if needed
                         if not summary_lines and summary_text:
                             lines = [line.strip() for line in summary_text.split('\n') if line.strip()]
                             if len(lines) == 1:
-                                sentences = re.split(r'\.\s+(?=[A-Z])', summary_text)
+                                sentences = _SENTENCE_SPLIT_RE.split(summary_text)
                                 lines = [s.strip() + ('.' if not s.strip().endswith('.') else '') for s in sentences if s.strip()]
                             summary_lines = lines
                         
@@ -1161,13 +1613,14 @@ class WordFormatter:
                                 # CRITICAL: Skip section headings (don't add bullets to headings)
                                 txt_upper = txt.upper()
                                 if any(heading in txt_upper for heading in ['PROFESSIONAL SUMMARY', 'SUMMARY', 'PROFILE', 'OBJECTIVE']):
-                                    print(f"      ⏭️  Skipping section heading: '{txt}'")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"⏭️  Skipping section heading: '{txt}'")
                                     continue
                                 
                                 bullet_para = self._insert_paragraph_after(last_para, '')
                                 if bullet_para:
                                     # No left indent for summary bullets
-                                    run = bullet_para.add_run('• ' + txt.lstrip('•–—-*● '))
+                                    run = bullet_para.add_run('• ' + txt.lstrip(_BULLET_LEAD_CHARS))
                                     run.font.size = Pt(10)
                                     bullet_para.paragraph_format.space_after = Pt(2)
                                     last_para = bullet_para
@@ -1175,29 +1628,23 @@ class WordFormatter:
                         self._summary_inserted = True
                         print(f"  ✅ Inserted summary after SUMMARY heading")
                         replaced_count += 1
+                    para_text = paragraph.text
             
             # Summary placeholder patterns - flexible (we clear them and insert after name later)
-            if not self._summary_inserted:
-                summary_patterns = [
-                r"<[^>]*summary[^>]*>",
-                r"<[^>]*professional[^>]*summary[^>]*>",
-                r"<[^>]*profile[^>]*>",
-            ]
-            for sum_pat in summary_patterns:
-                if re.search(sum_pat, paragraph.text, re.IGNORECASE):
+            scan_text = para_text if has_angle else ''
+            for sum_pat in (_SUMMARY_PLACEHOLDER_PATTERNS if _SUMMARY_PLACEHOLDER_RE.search(scan_text) else ()):
+                if sum_pat.search(scan_text):
                     print(f"  📝 Found summary placeholder in paragraph {para_idx} — clearing and deferring insertion after name")
                     self._regex_replace_paragraph(paragraph, sum_pat, '')
                     replaced_count += 1
                     break
+            if has_angle:
+                para_text = paragraph.text
 
             # Skills placeholder patterns - flexible
-            skills_patterns = [
-                r"<[^>]*skills[^>]*>",
-                r"<[^>]*technical[^>]*skills[^>]*>",
-                r"<[^>]*list[^>]*skills[^>]*>",
-            ]
-            for skl_pat in skills_patterns:
-                if re.search(skl_pat, paragraph.text, re.IGNORECASE):
+            scan_text = para_text if has_angle else ''
+            for skl_pat in (_SKILLS_PLACEHOLDER_PATTERNS if _SKILLS_PLACEHOLDER_RE.search(scan_text) else ()):
+                if skl_pat.search(scan_text):
                     skills_list = self.resume_data.get('skills', [])
                     # Always clear the placeholder, but only insert content AFTER employment is inserted
                     print(f"  🧰 Found skills placeholder in paragraph {para_idx} — clearing; will insert after EMPLOYMENT")
@@ -1207,46 +1654,36 @@ class WordFormatter:
                         self._skills_inserted = True
                     replaced_count += 1
                     break
+            if has_angle:
+                para_text = paragraph.text
 
             # SKILLS section heading (respect template order; do not force after EMPLOYMENT)
             if not self._skills_inserted:
-                para_upper = paragraph.text.strip().upper()
-                is_skills_heading = any(h in para_upper for h in [
-                    'SKILLS', 'TECHNICAL SKILLS'
-                ])
+                para_stripped = para_text.strip()
+                is_skills_heading = len(para_stripped) < 50 and 'SKILLS' in para_stripped.upper()
                 # NOTE: We don't gate by primary anchor here because paragraph indices shift after insertions
                 # Instead, we rely on the _skills_inserted flag to prevent duplicates
-                if is_skills_heading and len(paragraph.text.strip()) < 50:
+                if is_skills_heading:
                     print(f"  🧰 Found SKILLS heading at paragraph {para_idx}: '{paragraph.text[:60]}'")
                     skills_list = self.resume_data.get('skills', [])
                     if skills_list:
                         paras_to_clear = []
-                        stop_headings = ['EMPLOYMENT', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'CAREER HISTORY', 'EDUCATION', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']
-                        for check_idx in range(para_idx + 1, min(para_idx + 30, len(doc.paragraphs))):
-                            check_para = doc.paragraphs[check_idx]
+                        paragraphs = _BodyParagraphs(doc)
+                        for check_idx, check_para in enumerate(paragraphs[para_idx + 1:para_idx + 30], start=para_idx + 1):
                             check_text = check_para.text.strip().upper()
-                            if any(h in check_text for h in stop_headings) and len(check_text) < 50:
+                            if len(check_text) < 50 and _SKILLS_STOP_HEADINGS_RE.search(check_text):
                                 break
                             paras_to_clear.append(check_para)
-                        for p in paras_to_clear:
-                            try:
-                                for r in p.runs:
-                                    r.text = ''
-                            except:
-                                pass
+                        _clear_paragraph_runs(paras_to_clear)
                         self._insert_skills_bullets(doc, paragraph, skills_list)
                         self._skills_inserted = True
                         replaced_count += 1
+                    para_text = paragraph.text
 
             # CRITICAL: Check if this is an EDUCATION section heading
             if not self._education_inserted:
-                para_upper = paragraph.text.strip().upper()
-                is_edu_heading = any(h in para_upper for h in [
-                    'EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND',
-                    'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS', 'EDUCATION BACKGROUND',
-                    'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'ACADEMICS',
-                    'EDUCATION/CERTIFICATES', 'EDUCATION / CERTIFICATES'
-                ])
+                para_upper = para_text.strip().upper()
+                is_edu_heading = _EDU_HEADING_RE.search(para_upper) is not None
                 # NOTE: We don't gate by primary anchor here because paragraph indices shift after insertions
                 # Instead, we rely on the _education_inserted flag to prevent duplicates
                 
@@ -1255,10 +1692,11 @@ class WordFormatter:
                 
                 # Process EDUCATION headings (skip only if in first 3 paragraphs AND very short)
                 # This allows education in various template layouts
-                skip_cai = para_idx < 3 and len(paragraph.text.strip()) < 15
+                skip_cai = para_idx < 3 and len(para_text.strip()) < 15
                 if is_edu_heading and not is_placeholder and not skip_cai and not self._education_inserted:
                     print(f"  🎓 Found EDUCATION heading at paragraph {para_idx}: '{paragraph.text[:60]}'")
-                    print(f"     _education_inserted flag: {self._education_inserted}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"_education_inserted flag: {self._education_inserted}")
                     
                     # CRITICAL: Preserve and format the heading text  
                     original_heading = paragraph.text.strip().upper()
@@ -1273,7 +1711,8 @@ class WordFormatter:
                         run.font.size = Pt(11)
                     
                     education_data = self.resume_data.get('education', [])
-                    print(f"     Initial education_data from resume_data: {len(education_data) if education_data else 0} entries")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Initial education_data from resume_data: {len(education_data) if education_data else 0} entries")
                     
                     # ALWAYS get education data from sections if not in structured format
                     if not education_data:
@@ -1292,7 +1731,8 @@ class WordFormatter:
                                 education_data = self._build_education_from_bullets(lines)
                                 print(f"     🔄 Built {len(education_data)} education entries from sections.education text")
                     
-                    print(f"     📊 Final education_data count: {len(education_data) if education_data else 0}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"📊 Final education_data count: {len(education_data) if education_data else 0}")
                     
                     if not education_data or len(education_data) == 0:
                         print(f"     ⚠️  No education data available - WILL STILL INSERT HEADING and mark as processed")
@@ -1307,8 +1747,9 @@ class WordFormatter:
                         next_para = None
                         is_instruction = False
                         
-                        if para_idx + 1 < len(doc.paragraphs):
-                            next_para = doc.paragraphs[para_idx + 1]
+                        paragraphs = _BodyParagraphs(doc)
+                        if para_idx + 1 < len(paragraphs):
+                            next_para = paragraphs[para_idx + 1]
                             next_text = next_para.text.strip().lower()
                             
                             # Check if next paragraph is instructional text
@@ -1326,30 +1767,25 @@ class WordFormatter:
                                 print(f"     → Will insert {len(education_data)} education entries after heading")
                                 
                                 # Clear the instructional paragraph
-                                for run in next_para.runs:
-                                    run.text = ''
+                                _clear_paragraph_runs([next_para])
                                 
                                 # CRITICAL: Clear any existing education content after instructional text
                                 paras_to_clear = []
-                                for check_idx in range(para_idx + 2, min(para_idx + 50, len(doc.paragraphs))):
-                                    check_para = doc.paragraphs[check_idx]
+                                paragraphs = _BodyParagraphs(doc)
+                                for check_idx, check_para in enumerate(paragraphs[para_idx + 2:para_idx + 50], start=para_idx + 2):
                                     check_text = check_para.text.strip().upper()
                                     
                                     # Stop if we hit another section heading
-                                    if any(h in check_text for h in ['EMPLOYMENT', 'WORK HISTORY', 'SKILLS', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']) and len(check_text) < 50:
-                                        print(f"     → Stopped clearing at section: {check_text[:30]}")
+                                    if len(check_text) < 50 and _BLOCK_STOP_HEADINGS_RE.search(check_text):
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug(f"→ Stopped clearing at section: {check_text[:30]}")
                                         break
                                     
                                     # Clear this paragraph (it's old education content)
                                     paras_to_clear.append(check_para)
                                 
                                 print(f"     → Clearing {len(paras_to_clear)} old content paragraphs")
-                                for p in paras_to_clear:
-                                    try:
-                                        for run in p.runs:
-                                            run.text = ''
-                                    except:
-                                        pass
+                                _clear_paragraph_runs(paras_to_clear)
                                 
                                 # Insert education blocks after the cleared paragraph
                                 last_element = next_para
@@ -1373,14 +1809,15 @@ class WordFormatter:
                             paras_to_clear = []
                             # CRITICAL: Only clear template placeholder text, not actual content
                             # Limit scan range to max 10 paragraphs to prevent clearing employment entries
-                            for check_idx in range(para_idx + 1, min(para_idx + 10, len(doc.paragraphs))):
-                                check_para = doc.paragraphs[check_idx]
+                            paragraphs = _BodyParagraphs(doc)
+                            for check_idx, check_para in enumerate(paragraphs[para_idx + 1:para_idx + 10], start=para_idx + 1):
                                 check_text = check_para.text.strip()
                                 check_text_upper = check_text.upper()
                                 
                                 # CRITICAL: Stop immediately if we hit SKILLS or any other section
-                                if any(h in check_text_upper for h in ['SKILLS', 'EMPLOYMENT', 'WORK HISTORY', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']) and len(check_text) < 50:
-                                    print(f"     → Stopped clearing at section: {check_text[:30]}")
+                                if len(check_text) < 50 and _BLOCK_STOP_HEADINGS_RE.search(check_text_upper):
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"→ Stopped clearing at section: {check_text[:30]}")
                                     break
                                 
                                 # CRITICAL: Only clear if it looks like template placeholder text
@@ -1397,16 +1834,12 @@ class WordFormatter:
                                     paras_to_clear.append(check_para)
                                 else:
                                     # This looks like real content - stop clearing
-                                    print(f"     → Stopped clearing at content: {check_text[:40]}")
+                                    if logger.isEnabledFor(logging.DEBUG):
+                                        logger.debug(f"→ Stopped clearing at content: {check_text[:40]}")
                                     break
                             
                             print(f"     → Clearing {len(paras_to_clear)} old education paragraphs")
-                            for p in paras_to_clear:
-                                try:
-                                    for run in p.runs:
-                                        run.text = ''
-                                except:
-                                    pass
+                            _clear_paragraph_runs(paras_to_clear)
                             
                             # Insert education blocks after the heading
                             last_element = paragraph
@@ -1422,30 +1855,22 @@ class WordFormatter:
                             self._education_inserted = True
                             print(f"  ✅ Inserted education data after EDUCATION heading (no instruction text)")
                             replaced_count += 1
+                    para_text = paragraph.text
             
             # Education placeholder generic patterns - very flexible matching
             if not self._education_inserted:
-                edu_patterns = [
-                r"<[^>]*list[^>]*candidate['’]?s?[^>]*education[^>]*background[^>]*>",
-                r"<[^>]*education[^>]*background[^>]*>",
-                r"<[^>]*education[^>]*history[^>]*>",
-                r"<[^>]*candidate['’]?s?[^>]*education[^>]*>",
-                r"<[^>]*educational[^>]*background[^>]*>",
-                r"<[^>]*academic[^>]*background[^>]*>",
-                r"<[^>]*academic[^>]*qualifications[^>]*>",
-                r"<[^>]*qualifications[^>]*>",
-                r"<[^>]*(education|academic)[^>]*>",
-                r"\blist\s*candidate(?:['’]s)?\s*education\s*background\b",
-                ]
-                for edu_pat in edu_patterns:
-                    if re.search(edu_pat, paragraph.text, re.IGNORECASE):
+                scan_text = para_text
+                edu_hit = (has_angle and _EDU_TAG_PLACEHOLDER_RE.search(scan_text)) or _EDU_PLACEHOLDER_PATTERNS[-1].search(scan_text)
+                for edu_pat in (_EDU_PLACEHOLDER_PATTERNS if edu_hit else ()):
+                    if edu_pat.search(scan_text):
                         # If we detected a primary EDUCATION anchor, avoid replacing placeholders that
                         # are far away from the anchor (prevents inserting inside EMPLOYMENT region).
-                        if self._primary_anchors.get('EDUCATION') is not None:
-                            anchor_idx = self._primary_anchors.get('EDUCATION')
+                        if edu_anchor_idx is not None:
+                            anchor_idx = edu_anchor_idx
                             # Only allow placeholder replacement near or after the anchor
                             if para_idx < anchor_idx - 2:
-                                print(f"  ⏭️  Skipping education placeholder at {para_idx} (before primary anchor {anchor_idx})")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"⏭️  Skipping education placeholder at {para_idx} (before primary anchor {anchor_idx})")
                                 continue
                         print(f"  🎓 Found education placeholder in paragraph {para_idx}: '{paragraph.text[:60]}'")
                         
@@ -1488,11 +1913,9 @@ class WordFormatter:
                             # Fallback: try to use sections data
                             content = self._find_matching_resume_section('education', self.resume_data.get('sections', {}))
                             if content:
-                                bullets = []
-                                for item in content:  # Insert ALL items
-                                    if item.strip():
-                                        bullets.append('• ' + item.strip().lstrip('•').strip())
-                                self._regex_replace_paragraph(paragraph, edu_pat, '\n'.join(bullets))
+                                # Insert ALL items
+                                bullet_text = '\n'.join(f"• {item.strip().lstrip('•').strip()}" for item in content if item.strip())
+                                self._regex_replace_paragraph(paragraph, edu_pat, bullet_text)
                                 # Set flag even in fallback to prevent duplication
                                 self._education_inserted = True
                                 print(f"  ✅ Regex replaced education placeholder (fallback)")
@@ -1517,14 +1940,6 @@ class WordFormatter:
                     # Fallback: search for name placeholder patterns if anchor wasn't found
                     if anchor_idx is None:
                         print(f"  Name anchor not found, searching for placeholder...")
-                        name_placeholder_patterns = [
-                            r'<\s*[Cc]andidate[^>]*[Nn]ame[^>]*>',
-                            r'<\s*[Nn]ame\s*>',
-                            r'<\s*[Ff]ull\s*[Nn]ame\s*>',
-                            r'<\s*YOUR\s*NAME\s*>',
-                            r'<[^>]*LAWSON[^>]*>',
-                            r'<[^>]*PAULA[^>]*>',
-                        ]
                         for idx, p in enumerate(doc.paragraphs):
                             if idx < 10:  # Skip CAI CONTACT area - increased from 5 to 10
                                 continue
@@ -1532,18 +1947,16 @@ class WordFormatter:
                             if idx < 20 and 'CAI CONTACT' in (p.text or '').upper():
                                 continue
                             t = (p.text or '').strip()
-                            for pat in name_placeholder_patterns:
-                                if re.search(pat, t):
-                                    anchor_idx = idx
-                                    print(f"  Found name placeholder at paragraph {idx}: '{t}'")
-                                    break
-                            if anchor_idx is not None:
+                            if _NAME_PLACEHOLDER_FALLBACK_RE.search(t):
+                                anchor_idx = idx
+                                print(f"  Found name placeholder at paragraph {idx}: '{t}'")
                                 break
                 
                     # Strategy: Place SUMMARY right after the candidate name placeholder
-                    if anchor_idx is not None and anchor_idx >= 8 and anchor_idx < len(doc.paragraphs):
+                    paragraphs = doc.paragraphs
+                    if anchor_idx is not None and anchor_idx >= 8 and anchor_idx < len(paragraphs):
                         # Name anchor found in main content area (not CAI CONTACT) - reduced from 10 to 8
-                        anchor_para = doc.paragraphs[anchor_idx]
+                        anchor_para = paragraphs[anchor_idx]
                         print(f"  ✅ Inserting SUMMARY after candidate name at paragraph {anchor_idx}")
                         
                         # Insert blank line first
@@ -1568,7 +1981,7 @@ class WordFormatter:
                             if summary_lines:
                                 for line in summary_lines:
                                     if line.strip():
-                                        bullet_para = self._insert_paragraph_after(summary_heading, f"• {line.strip().lstrip('•–—-*● ')}")
+                                        bullet_para = self._insert_paragraph_after(summary_heading, f"• {line.strip().lstrip(_BULLET_LEAD_CHARS)}")
                                         if bullet_para:
                                             bullet_para.paragraph_format.space_after = Pt(2)
                                             summary_heading = bullet_para
@@ -1583,7 +1996,7 @@ class WordFormatter:
                         # Fallback: use paragraph before EMPLOYMENT if name not found
                         emp_idx = self._primary_anchors.get('EMPLOYMENT')
                         if emp_idx is not None and emp_idx > 0:
-                            anchor_para = doc.paragraphs[emp_idx - 1]
+                            anchor_para = paragraphs[emp_idx - 1]
                             print(f"  Fallback: Inserting SUMMARY before EMPLOYMENT at paragraph {emp_idx - 1}")
                         else:
                             # Skip SUMMARY insertion if no safe anchor found
@@ -1614,7 +2027,7 @@ class WordFormatter:
                         if not summary_lines and summary_text:
                             lines = [line.strip() for line in summary_text.split('\n') if line.strip()]
                             if len(lines) == 1:
-                                sentences = re.split(r'\.\s+(?=[A-Z])', summary_text)
+                                sentences = _SENTENCE_SPLIT_RE.split(summary_text)
                                 lines = [s.strip() + ('.' if not s.strip().endswith('.') else '') for s in sentences if s.strip()]
                             summary_lines = lines
                         
@@ -1635,7 +2048,7 @@ class WordFormatter:
                                 bullet_para = self._insert_paragraph_after(last_para, '')
                                 if bullet_para:
                                     # No left indent for summary bullets
-                                    run = bullet_para.add_run('• ' + txt.lstrip('•–—-*● '))
+                                    run = bullet_para.add_run('• ' + txt.lstrip(_BULLET_LEAD_CHARS))
                                     run.font.size = Pt(10)
                                     bullet_para.paragraph_format.space_after = Pt(2)
                                     last_para = bullet_para
@@ -1648,26 +2061,16 @@ class WordFormatter:
             skills_list = self.resume_data.get('skills', []) or []
             if skills_list:
                 # Anchor: after the last EMPLOYMENT paragraph if available; else after EMPLOYMENT heading; else end
+                paragraphs = doc.paragraphs
                 if hasattr(self, '_employment_tail_para') and self._employment_tail_para is not None:
                     anchor_para = self._employment_tail_para
                 elif self._primary_anchors.get('EMPLOYMENT') is not None:
-                    anchor_para = doc.paragraphs[self._primary_anchors.get('EMPLOYMENT')]
+                    anchor_para = paragraphs[self._primary_anchors.get('EMPLOYMENT')]
                 else:
-                    anchor_para = doc.paragraphs[-1] if doc.paragraphs else doc.add_paragraph('')
-                # Clean up any stray SKILLS headings that occur before anchor
-                try:
-                    anchor_idx = None
-                    for idx, p in enumerate(doc.paragraphs):
-                        if p is anchor_para:
-                            anchor_idx = idx
-                            break
-                    if anchor_idx is not None:
-                        for idx in range(anchor_idx - 1, -1, -1):
-                            t = (doc.paragraphs[idx].text or '').strip().upper()
-                            if t in ('SKILLS', 'TECHNICAL SKILLS'):
-                                self._delete_paragraph(doc.paragraphs[idx])
-                except Exception:
-                    pass
+                    anchor_para = paragraphs[-1] if paragraphs else doc.add_paragraph('')
+                # No stray SKILLS heading cleanup before the anchor: the identity scan that used to
+                # sit here compared wrappers from two separate doc.paragraphs lists and never matched,
+                # and the EMPLOYMENT anchor index is stale after the summary inserts
                 heading = self._insert_paragraph_after(anchor_para, 'SKILLS')
                 if heading is None:
                     heading = anchor_para
@@ -1681,16 +2084,17 @@ class WordFormatter:
         # CRITICAL: Final cleanup - remove any orphaned bullets that appear after section headings
         # This handles cases where resume parsing left stray content
         print(f"\n🧹 Final cleanup: Removing orphaned content...")
+        # Track section positions, keyed by canonical heading name
         sections_found = {}
-        for para_idx, paragraph in enumerate(doc.paragraphs):
-            para_text = paragraph.text.strip().upper()
-            
-            # Track section positions
-            if any(h in para_text for h in ['EMPLOYMENT HISTORY', 'EDUCATION', 'SKILLS', 'SUMMARY']) and len(para_text) < 50:
-                sections_found[para_text[:20]] = para_idx
+        for para_idx, para_text in enumerate(_upper_paragraph_texts(doc.paragraphs)):
+            if len(para_text) < 50 and _TRACKED_SECTION_HEADINGS_RE.search(para_text):
+                for heading in _TRACKED_SECTION_HEADINGS:
+                    if heading in para_text:
+                        sections_found[heading] = para_idx
+                        break
         
         # If we inserted employment and education, clear any bullets that appear after education
-        if self._experience_inserted and self._education_inserted and 'EDUCATION' in str(sections_found):
+        if self._experience_inserted and self._education_inserted and 'EDUCATION' in sections_found:
             print(f"     → Checking for orphaned bullets after EDUCATION section...")
             # This is handled by the section clearing logic above
         
@@ -1709,9 +2113,11 @@ class WordFormatter:
                     for cell in row.cells:
                         for paragraph in cell.paragraphs:
                             # 1) Simple replacements
-                            for key, value in replacements.items():
-                                if self._text_contains(paragraph.text, key):
-                                    other_table_replaced += self._replace_in_paragraph(paragraph, key, value)
+                            other_table_replaced += self._replace_matched_placeholders(paragraph)
+
+                            # Once every section is in, only the simple replacements above still apply
+                            if self._summary_inserted and self._skills_inserted and self._education_inserted:
+                                continue
 
                             # 1.5) EDUCATION heading inside table (check if heading OR placeholder exists)
                             if not self._education_inserted:
@@ -1719,8 +2125,8 @@ class WordFormatter:
                                 heading_text = para_text.upper()
                                 
                                 # Check if this cell contains EDUCATION heading or placeholder
-                                has_heading = any(h in heading_text for h in ['EDUCATION', 'ACADEMIC BACKGROUND', 'EDUCATIONAL BACKGROUND', 'ACADEMIC QUALIFICATIONS', 'QUALIFICATIONS', 'EDUCATION BACKGROUND', 'ACADEMICS', 'CERTIFICATES', 'CERTIFICATIONS', 'CREDENTIALS', 'EDUCATION/CERTIFICATES', 'EDUCATION / CERTIFICATES'])
-                                has_placeholder = bool(re.search(r"<[^>]*list[^>]*candidate['']?s?[^>]*education[^>]*background[^>]*>", para_text, re.IGNORECASE))
+                                has_heading = _EDU_HEADING_RE.search(heading_text) is not None
+                                has_placeholder = '<' in para_text and _EDU_PLACEHOLDER_PATTERNS[0].search(para_text) is not None
                                 
                                 if has_heading or has_placeholder:
                                     print(f"  🎓 Found EDUCATION in TABLE cell (heading={has_heading}, placeholder={has_placeholder})")
@@ -1737,14 +2143,8 @@ class WordFormatter:
                                     
                                     if education_data:
                                         print(f"     → Will insert {len(education_data)} education entries")
-                                        # Clear the entire paragraph text (heading + placeholder)
-                                        for run in paragraph.runs:
-                                            run.text = ''
-                                        # Rewrite just the heading
-                                        if paragraph.runs:
-                                            paragraph.runs[0].text = 'EDUCATION'
-                                            paragraph.runs[0].bold = True
-                                            paragraph.runs[0].font.size = Pt(11)
+                                        # Clear the entire paragraph text (heading + placeholder), rewrite just the heading
+                                        _rewrite_heading_runs(paragraph, 'EDUCATION', Pt(11))
                                         
                                         # Clear any following raw content within the cell
                                         self._delete_following_bullets(paragraph, max_scan=80)
@@ -1768,18 +2168,16 @@ class WordFormatter:
                                     else:
                                         print(f"     ⚠️  No education data available to insert")
                                         # Still clear the placeholder even if no data
-                                        for run in paragraph.runs:
-                                            run.text = ''
-                                        if paragraph.runs:
-                                            paragraph.runs[0].text = 'EDUCATION'
-                                            paragraph.runs[0].bold = True
+                                        _rewrite_heading_runs(paragraph, 'EDUCATION')
                                         self._education_inserted = True
 
+                            # 2)-4) Placeholder families all start with a literal "<": a plain substring
+                            # test rules out most cells before any regex runs
                             # 2) SUMMARY placeholder inside table
                             if not self._summary_inserted:
-                                summary_patterns = [r"<[^>]*summary[^>]*>", r"<[^>]*professional[^>]*summary[^>]*>", r"<[^>]*profile[^>]*>"]
-                                for sum_pat in summary_patterns:
-                                    if re.search(sum_pat, paragraph.text, re.IGNORECASE):
+                                scan_text = paragraph.text
+                                for sum_pat in (_SUMMARY_PLACEHOLDER_PATTERNS if '<' in scan_text and _SUMMARY_PLACEHOLDER_RE.search(scan_text) else ()):
+                                    if sum_pat.search(scan_text):
                                         summary_lines = self._find_matching_resume_section('summary', self.resume_data.get('sections', {}))
                                         summary_text = (self.resume_data.get('summary') or '').strip()
                                         if summary_lines or summary_text:
@@ -1798,9 +2196,9 @@ class WordFormatter:
 
                             # 3) SKILLS placeholder inside table
                             if not self._skills_inserted:
-                                skills_patterns = [r"<[^>]*skills[^>]*>", r"<[^>]*technical[^>]*skills[^>]*>", r"<[^>]*list[^>]*skills[^>]*>"]
-                                for skl_pat in skills_patterns:
-                                    if re.search(skl_pat, paragraph.text, re.IGNORECASE):
+                                scan_text = paragraph.text
+                                for skl_pat in (_SKILLS_PLACEHOLDER_PATTERNS if '<' in scan_text and _SKILLS_PLACEHOLDER_RE.search(scan_text) else ()):
+                                    if skl_pat.search(scan_text):
                                         skills_list = self.resume_data.get('skills', [])
                                         if skills_list:
                                             print(f"  🧰 Found skills placeholder in TABLE cell")
@@ -1814,19 +2212,9 @@ class WordFormatter:
 
                             # 4) EDUCATION placeholder inside table
                             if not self._education_inserted:
-                                edu_patterns = [
-                                    r"<[^>]*list[^>]*candidate['’]?s?[^>]*education[^>]*background[^>]*>",
-                                    r"<[^>]*education[^>]*background[^>]*>",
-                                    r"<[^>]*education[^>]*history[^>]*>",
-                                    r"<[^>]*candidate['’]?s?[^>]*education[^>]*>",
-                                    r"<[^>]*educational[^>]*background[^>]*>",
-                                    r"<[^>]*academic[^>]*background[^>]*>",
-                                    r"<[^>]*academic[^>]*qualifications[^>]*>",
-                                    r"<[^>]*qualifications[^>]*>",
-                                    r"<[^>]*(education|academic)[^>]*>",
-                                ]
-                                for edu_pat in edu_patterns:
-                                    if re.search(edu_pat, paragraph.text, re.IGNORECASE):
+                                scan_text = paragraph.text
+                                for edu_pat in (_EDU_PLACEHOLDER_PATTERNS[:-1] if '<' in scan_text and _EDU_TAG_PLACEHOLDER_RE.search(scan_text) else ()):
+                                    if edu_pat.search(scan_text):
                                         print(f"  🎓 Found education placeholder in TABLE cell")
                                         education_data = self.resume_data.get('education', [])
                                         if not education_data:
@@ -1857,19 +2245,15 @@ class WordFormatter:
         print(f"  • Other table entries: {other_table_replaced}")
         
         # Replace in headers/footers
+        # Sections linked to the previous one share its header/footer part: visit each paragraph once
         header_footer_replaced = 0
+        seen_hf_paras = set()
         for section in doc.sections:
-            # Header
-            for paragraph in section.header.paragraphs:
-                for key, value in replacements.items():
-                    if self._text_contains(paragraph.text, key):
-                        header_footer_replaced += self._replace_in_paragraph(paragraph, key, value)
-            
-            # Footer
-            for paragraph in section.footer.paragraphs:
-                for key, value in replacements.items():
-                    if self._text_contains(paragraph.text, key):
-                        header_footer_replaced += self._replace_in_paragraph(paragraph, key, value)
+            for paragraph in (*section.header.paragraphs, *section.footer.paragraphs):
+                if paragraph._p in seen_hf_paras:
+                    continue
+                seen_hf_paras.add(paragraph._p)
+                header_footer_replaced += self._replace_matched_placeholders(paragraph)
         
         if header_footer_replaced > 0:
             print(f"✓ Replaced {header_footer_replaced} placeholders in headers/footers")
@@ -1941,6 +2325,9 @@ class WordFormatter:
                 print(f"⚠️  WARNING: EDUCATION section was marked as inserted but not found in document!")
                 print(f"   This indicates the section was deleted during processing.")
         
+        if self.style_manager:
+            self.style_manager.flush_errors()
+        
         doc.save(output_docx)
         
         # DISABLED: COM post-processing was corrupting already-inserted content
@@ -1963,6 +2350,35 @@ class WordFormatter:
         return True
 
     # Helper: insert a new paragraph directly after a given paragraph
+    def _make_paragraph_proto(self, size, bold=None, left_indent=None, space_before=None, space_after=None,
+                              lead_run=False):
+        """Build a detached, justified single-run <w:p> to deepcopy for bulk inserts
+        (lead_run keeps the empty first run that _insert_paragraph_after(p, '') leaves)"""
+        proto = Paragraph(OxmlElement('w:p'), None)
+        if lead_run:
+            proto.add_run('')
+        run = proto.add_run()
+        run.font.size = size
+        if bold is not None:
+            run.bold = bold
+        fmt = proto.paragraph_format
+        fmt.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        if left_indent is not None:
+            fmt.left_indent = left_indent
+        if space_before is not None:
+            fmt.space_before = space_before
+        if space_after is not None:
+            fmt.space_after = space_after
+        return proto._p
+    
+    @cached_property
+    def _experience_bullet_proto(self):
+        return self._make_paragraph_proto(Pt(10), bold=False, left_indent=Inches(0.25), lead_run=True)
+
+    @cached_property
+    def _spaced_bullet_proto(self):
+        return self._make_paragraph_proto(Pt(10), left_indent=Inches(0.25), space_after=Pt(2), lead_run=True)
+
     def _insert_paragraph_after(self, paragraph, text):
         try:
             new_p = OxmlElement('w:p')
@@ -1988,14 +2404,12 @@ class WordFormatter:
         """Add a right-aligned tab stop to a paragraph at the given twips position (1 inch = 1440 twips)."""
         try:
             pPr = paragraph._p.get_or_add_pPr()
+            proto = _right_tab_proto(pos_twips)
             tabs = pPr.find(qn('w:tabs'))
             if tabs is None:
-                tabs = OxmlElement('w:tabs')
-                pPr.append(tabs)
-            tab = OxmlElement('w:tab')
-            tab.set(qn('w:val'), 'right')
-            tab.set(qn('w:pos'), str(pos_twips))
-            tabs.append(tab)
+                pPr.append(deepcopy(proto))
+            else:
+                tabs.append(deepcopy(proto[0]))
         except Exception:
             # If this fails, the text will still render; right text just won't align via tab stop
             pass
@@ -2017,26 +2431,22 @@ class WordFormatter:
         try:
             last = after_paragraph
             count = 0
+            # Same justified, indented 10pt bullet as the education details
+            proto = self._spaced_bullet_proto
+            last_p = after_paragraph._p
             # Insert ALL skills from candidate resume
             for skill in (skills_list or []):
                 name = skill if isinstance(skill, str) else (skill.get('name', '') if isinstance(skill, dict) else str(skill))
                 name = (name or '').strip()
                 if not name:
                     continue
-                p = self._insert_paragraph_after(last, '')
-                if p is None:
-                    break
-                p.paragraph_format.left_indent = Inches(0.25)
-                try:
-                    p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                except Exception:
-                    pass
-                run = p.add_run('• ' + name.lstrip('•–—-*● '))
-                run.font.size = Pt(10)
-                p.paragraph_format.space_after = Pt(2)
-                last = p
+                p = deepcopy(proto)
+                p.r_lst[-1].text = '• ' + name.lstrip(_BULLET_LEAD_CHARS)
+                last_p.addnext(p)
+                last_p = p
                 count += 1
             if count > 0:
+                last = Paragraph(last_p, after_paragraph._parent)
                 print(f"    ✓ Inserted {count} skill bullets")
             return last
         except Exception as e:
@@ -2050,6 +2460,8 @@ class WordFormatter:
         try:
             last = after_paragraph
             count = 0
+            proto = self._spaced_bullet_proto
+            last_p = after_paragraph._p
             for edu in (education_list or []):  # Insert ALL education entries
                 degree = (edu.get('degree') or '').strip()
                 year = self._clean_duration((edu.get('year') or '').strip())
@@ -2067,16 +2479,13 @@ class WordFormatter:
                 line = ' '.join(text_parts).strip()
                 if not line:
                     continue
-                p = self._insert_paragraph_after(last, '')
-                if p is None:
-                    break
-                p.paragraph_format.left_indent = Inches(0.25)
-                run = p.add_run('• ' + line)
-                run.font.size = Pt(10)
-                p.paragraph_format.space_after = Pt(2)
-                last = p
+                p = deepcopy(proto)
+                p.r_lst[-1].text = '• ' + line
+                last_p.addnext(p)
+                last_p = p
                 count += 1
             if count > 0:
+                last = Paragraph(last_p, after_paragraph._parent)
                 print(f"    ✓ Inserted {count} education bullets (simple mode)")
             return last
         except Exception as e:
@@ -2096,9 +2505,16 @@ class WordFormatter:
         path = self._cai_store_path()
         stored = {}
         try:
-            if os.path.exists(path):
+            # Unchanged file: reuse the last parse, so the common case is a single stat
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _CAI_CONTACT_CACHE.get(path)
+            if cached and cached[0] == stamp:
+                stored = cached[1].copy()
+            else:
                 with open(path, 'r', encoding='utf-8') as f:
                     stored = json.load(f) or {}
+                _CAI_CONTACT_CACHE[path] = (stamp, stored.copy())
         except Exception:
             stored = {}
 
@@ -2109,8 +2525,13 @@ class WordFormatter:
                 "email": (proposed.get("email") or stored.get("email") or ""),
             }
             try:
-                with open(path, 'w', encoding='utf-8') as f:
+                # Write a sibling temp file and swap it in, so readers never see a partial store
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, path)
+                st = os.stat(path)
+                _CAI_CONTACT_CACHE[path] = ((st.st_mtime_ns, st.st_size), data.copy())
             except Exception:
                 pass
             return data
@@ -2126,7 +2547,7 @@ class WordFormatter:
             }
         return {"name": "", "phone": "", "email": ""}
 
-    def _ensure_cai_contact(self, doc):
+    def _ensure_cai_contact(self, doc, upper_texts=None):
         """
         Ensure the CAI CONTACT section exists and is filled from persistent storage.
         SMART REPLACEMENT: Preserves template formatting, spacing, and "or" separators
@@ -2145,29 +2566,29 @@ class WordFormatter:
             print("  ⏭️  No CAI contacts provided; skipping CAI contact insertion")
             return
 
-        # Find existing CAI CONTACT heading
-        heading_idx = None
-        for idx, p in enumerate(doc.paragraphs):
-            if 'CAI CONTACT' in (p.text or '').strip().upper():
-                heading_idx = idx
-                break
+        # Find existing CAI CONTACT heading; the paragraph snapshot is shared with the
+        # structure analysis and the replacement, which only remove paragraphs after the heading
+        paragraphs = doc.paragraphs
+        if upper_texts is None:
+            upper_texts = _upper_paragraph_texts(paragraphs)
+        heading_idx = next((idx for idx, t in enumerate(upper_texts) if 'CAI CONTACT' in t), None)
 
         if heading_idx is None:
             print("  ⏭️  No 'CAI CONTACT' heading in template; skipping CAI contact insertion")
             return
         
         # CAI CONTACT heading exists - analyze template structure
-        heading = doc.paragraphs[heading_idx]
+        heading = paragraphs[heading_idx]
         print(f"  📋 Found CAI CONTACT at paragraph {heading_idx}")
         
         # Analyze template structure
-        template_structure = self._analyze_cai_template_structure(doc, heading_idx)
+        template_structure = self._analyze_cai_template_structure(doc, heading_idx, paragraphs)
         
         # Replace contact info while preserving template formatting
         # Pass all contacts (list)
-        self._replace_cai_contact_smart(doc, heading_idx, cai_contacts, template_structure)
+        self._replace_cai_contact_smart(doc, heading_idx, cai_contacts, template_structure, paragraphs)
 
-    def _analyze_cai_template_structure(self, doc, heading_idx):
+    def _analyze_cai_template_structure(self, doc, heading_idx, paragraphs=None):
         """
         Analyze CAI CONTACT template structure
         Returns dict with: has_or_separator, num_contacts, paragraph_indices
@@ -2180,12 +2601,15 @@ class WordFormatter:
         }
         
         # Scan paragraphs after CAI CONTACT heading
+        if paragraphs is None:
+            paragraphs = doc.paragraphs
+        texts = {}
         for j in range(1, 20):
             k = heading_idx + j
-            if k >= len(doc.paragraphs):
+            if k >= len(paragraphs):
                 break
             
-            para = doc.paragraphs[k]
+            para = paragraphs[k]
             txt = (para.text or '').strip()
             txt_upper = txt.upper()
             
@@ -2194,7 +2618,7 @@ class WordFormatter:
                 break
             
             # Stop at next section
-            if any(kw in txt_upper for kw in ['EMPLOYMENT', 'EDUCATION', 'SUMMARY', 'SKILLS']) and len(txt) < 50:
+            if len(txt) < 50 and _CAI_SECTION_HEADINGS_RE.search(txt_upper):
                 break
             
             # Check for "or" separator
@@ -2206,6 +2630,7 @@ class WordFormatter:
             # Track all CAI CONTACT paragraphs
             if txt:  # Non-empty paragraph
                 structure['paragraph_indices'].append(k)
+                texts[k] = txt
         
         # Estimate number of contacts in template
         if structure['has_or_separator']:
@@ -2214,8 +2639,8 @@ class WordFormatter:
             # Heuristic: count name-like paragraphs (bold, short, no colons)
             name_count = 0
             for idx in structure['paragraph_indices']:
-                para = doc.paragraphs[idx]
-                txt = para.text.strip()
+                para = paragraphs[idx]
+                txt = texts[idx]
                 # Name is usually bold, short, and doesn't have "Phone:" or "Email:"
                 if txt and len(txt) < 50 and ':' not in txt:
                     if para.runs and any(r.bold for r in para.runs):
@@ -2225,7 +2650,7 @@ class WordFormatter:
         print(f"    📊 Template structure: {structure['num_template_contacts']} contact(s), 'or' separator: {structure['has_or_separator']}")
         return structure
     
-    def _replace_cai_contact_smart(self, doc, heading_idx, cai_contacts, structure):
+    def _replace_cai_contact_smart(self, doc, heading_idx, cai_contacts, structure, paragraphs=None):
         """
         Smart replacement of CAI CONTACT preserving template formatting
         Supports multiple contacts with "or" separator
@@ -2242,12 +2667,14 @@ class WordFormatter:
         
         # First, identify and DELETE all existing content after CAI CONTACT heading
         paragraphs_to_delete = []
+        if paragraphs is None:
+            paragraphs = doc.paragraphs
         for j in range(1, 30):
             k = heading_idx + j
-            if k >= len(doc.paragraphs):
+            if k >= len(paragraphs):
                 break
             
-            para = doc.paragraphs[k]
+            para = paragraphs[k]
             txt = (para.text or '').strip()
             txt_upper = txt.upper()
             
@@ -2256,7 +2683,7 @@ class WordFormatter:
                 break
             
             # Stop at next section
-            if any(kw in txt_upper for kw in ['EMPLOYMENT', 'EDUCATION', 'SUMMARY', 'SKILLS', 'EXPERIENCE']) and len(txt) < 50:
+            if len(txt) < 50 and _CAI_SECTION_HEADINGS_WITH_EXP_RE.search(txt_upper):
                 break
             
             # Mark for deletion
@@ -2273,8 +2700,8 @@ class WordFormatter:
         
         print(f"      🗑️  Deleted {len(paragraphs_to_delete)} template paragraphs")
         
-        # Now insert all selected CAI contacts
-        last_para = doc.paragraphs[heading_idx]
+        # Now insert all selected CAI contacts (only paragraphs after the heading were removed)
+        last_para = paragraphs[heading_idx]
         
         for contact_idx, contact in enumerate(cai_contacts):
             name = (contact.get('name') or '').strip()
@@ -2495,21 +2922,20 @@ class WordFormatter:
 
             # Add details as individual bullet paragraphs
             if details:
-                # Don't limit bullets - include ALL details from resume
+                # Don't limit bullets - include ALL details from resume.
+                # Each bullet is a deep copy of one prototype (run explicitly not bold
+                # to prevent inheritance), chained on with a single lxml addnext
+                proto = self._experience_bullet_proto
+                last_p = last_para._p
                 for detail in details:
                     txt = (detail or '').strip()
                     if not txt:
                         continue
-                    p = self._insert_paragraph_after(last_para, '')
-                    p.paragraph_format.left_indent = Inches(0.25)
-                    try:
-                        p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                    except Exception:
-                        pass
-                    run = p.add_run('• ' + txt.lstrip('•–—-*● '))
-                    run.bold = False  # CRITICAL: Explicitly set to not bold to prevent inheritance
-                    run.font.size = Pt(10)
-                    last_para = p
+                    p = deepcopy(proto)
+                    p.r_lst[-1].text = '• ' + txt.lstrip(_BULLET_LEAD_CHARS)
+                    last_p.addnext(p)
+                    last_p = p
+                last_para = Paragraph(last_p, last_para._parent)
             
             return last_para
             
@@ -2529,7 +2955,8 @@ class WordFormatter:
             details = edu_data.get('details', [])
             
             # DEBUG: Show what we received
-            print(f"      📚 Education data: degree='{degree[:50] if degree else 'EMPTY'}', institution='{institution[:30] if institution else 'EMPTY'}', year='{year or 'EMPTY'}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📚 Education data: degree='{degree[:50] if degree else 'EMPTY'}', institution='{institution[:30] if institution else 'EMPTY'}', year='{year or 'EMPTY'}'")
             
             # CRITICAL: If we have neither degree nor institution, skip this entry
             if not degree and not institution:
@@ -2540,7 +2967,8 @@ class WordFormatter:
             if not institution:
                 institution = self._extract_institution(degree, details)
                 if institution:
-                    print(f"      ✓ Extracted institution from degree: '{institution[:30]}'")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"✓ Extracted institution from degree: '{institution[:30]}'")
             
             # Clean up year format
             year_clean = self._clean_duration(year)
@@ -2572,7 +3000,8 @@ class WordFormatter:
                 parts = degree.split(':', 1)
                 degree_type = parts[0].strip()  # "Master of Science"
                 field = parts[1].strip() if len(parts) > 1 else ''  # "Leadership"
-                print(f"      ✂️  Split at colon: LEFT='{degree_type}' | Field='{field}'")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"✂️  Split at colon: LEFT='{degree_type}' | Field='{field}'")
             
             elif ' in ' in degree.lower():
                 # Format: "Master of Science in Data Science"
@@ -2582,10 +3011,12 @@ class WordFormatter:
                 if in_pos > 0:
                     degree_type = degree[:in_pos].strip()  # "Master of Science"
                     field = degree[in_pos + 4:].strip()     # "Data Science"
-                    print(f"      ✂️  Split at 'in': LEFT='{degree_type}' | Field='{field}'")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"✂️  Split at 'in': LEFT='{degree_type}' | Field='{field}'")
             
             else:
-                print(f"      ℹ️  No split: Using full degree as LEFT='{degree_type}'")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"ℹ️  No split: Using full degree as LEFT='{degree_type}'")
             
             # Combine field with institution
             if field and institution:
@@ -2593,15 +3024,17 @@ class WordFormatter:
             elif field:
                 field_and_institution = field
             
-            print(f"      📐 Format: LEFT='{degree_type or '(no degree)'}' | RIGHT='{year_clean}'")
-            print(f"      📐 Second line: '{field_and_institution or '(none)'}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📐 Format: LEFT='{degree_type or '(no degree)'}' | RIGHT='{year_clean}'")
+                logger.debug(f"📐 Second line: '{field_and_institution or '(none)'}'")
             
             # CRITICAL FIX: Truncate degree_type if too long to prevent date wrapping
             # Max ~70 chars to ensure tab stop works properly (leaves room for date on right)
             display_degree = degree_type or institution or 'Education'
             if len(display_degree) > 70:
                 display_degree = display_degree[:67] + '...'
-                print(f"      ✂️  Truncated degree to: '{display_degree}'")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"✂️  Truncated degree to: '{display_degree}'")
             
             # Degree type on the left (bold), year on the right
             deg_run = header_para.add_run(display_degree)
@@ -2629,31 +3062,29 @@ class WordFormatter:
                     except Exception:
                         pass
                     last_para = fi_para
-                    print(f"      ✅ Inserted field/institution line")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("      ✅ Inserted field/institution line")
                 else:
                     print(f"      ⚠️  Failed to insert field/institution paragraph")
 
             # Add details as bullet paragraphs - include ALL details from resume
             if details:
                 detail_count = 0
+                proto = self._spaced_bullet_proto
+                last_p = last_para._p
                 for detail in details:  # Don't limit or optimize - preserve ALL content
                     txt = (detail or '').strip()
                     if not txt or txt.lower() == (institution or '').lower():
                         continue
-                    p = self._insert_paragraph_after(last_para, '')
-                    if p is not None:
-                        p.paragraph_format.left_indent = Inches(0.25)
-                        try:
-                            p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                        except Exception:
-                            pass
-                        run = p.add_run('• ' + txt.lstrip('•–—-*● '))
-                        run.font.size = Pt(10)
-                        p.paragraph_format.space_after = Pt(2)
-                        last_para = p
-                        detail_count += 1
+                    p = deepcopy(proto)
+                    p.r_lst[-1].text = '• ' + txt.lstrip(_BULLET_LEAD_CHARS)
+                    last_p.addnext(p)
+                    last_p = p
+                    detail_count += 1
                 if detail_count > 0:
-                    print(f"      ✅ Inserted {detail_count} detail bullets")
+                    last_para = Paragraph(last_p, last_para._parent)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"      ✅ Inserted {detail_count} detail bullets")
             
             # Add a blank line after each education entry for spacing
             
@@ -2667,7 +3098,8 @@ class WordFormatter:
                     pass
                 last_para = blank
             
-            print(f"      ✅ Education block inserted successfully")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("      ✅ Education block inserted successfully")
             return last_para
             
         except Exception as e:
@@ -2846,8 +3278,9 @@ class WordFormatter:
                               'PROFESSIONAL EXPERIENCE', 'CAREER HISTORY', 'QUALIFICATIONS',
                               'ACHIEVEMENTS', 'AWARDS', 'LANGUAGES']
             
-            for idx in range(heading_idx + 1, len(doc.paragraphs)):
-                para = doc.paragraphs[idx]
+            paragraphs = doc.paragraphs
+            for idx in range(heading_idx + 1, len(paragraphs)):
+                para = paragraphs[idx]
                 text = para.text.strip().upper()
                 
                 # Stop at next section
@@ -2964,7 +3397,7 @@ class WordFormatter:
                     norm = txt.upper()
                     if any(k in norm for k in ['EDUCATION', 'SKILLS', 'SUMMARY', 'PROJECT', 'CERTIFICATION', 'EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY']):
                         break
-                    if txt.startswith(('•', '-', '–', '—', '*', '●')) or re.match(r'^\d+[\).\-\s]', txt):
+                    if txt.startswith(('•', '-', '–', '—', '*', '●')) or _NUMBERED_ITEM_RE.match(txt):
                         bullets.append(txt.lstrip(' •–—-*●'))
                     else:
                         break
@@ -2990,17 +3423,6 @@ class WordFormatter:
         except Exception as e:
             print(f"    ⚠️  Error deleting tables: {e}")
     
-    def _paragraph_in_table(self, paragraph):
-        try:
-            node = paragraph._element
-            while node is not None:
-                if str(getattr(node, 'tag', '')).endswith('tbl'):
-                    return True
-                node = node.getparent()
-        except Exception:
-            pass
-        return False
-    
     def _remove_instructional_until_table(self, paragraph, max_scan=40):
         try:
             node = paragraph._element.getnext()
@@ -3013,10 +3435,9 @@ class WordFormatter:
                     tnodes = node.xpath('.//w:t', namespaces=node.nsmap) if hasattr(node, 'xpath') else []
                     txt = ''.join([t.text for t in tnodes if t is not None and t.text is not None]).strip()
                     upper = txt.upper()
-                    if any(h in upper for h in ['EMPLOYMENT', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'CAREER HISTORY', 'EDUCATION', 'SUMMARY', 'CERTIFICATIONS', 'PROJECTS']) and len(txt) < 50:
+                    if len(txt) < 50 and _SKILLS_STOP_HEADINGS_RE.search(upper):
                         break
-                    is_instr = bool(re.search(r'\bplease\b', txt, re.IGNORECASE)) or \
-                              bool(re.search(r'(use this table|add or delete rows|respond with the years|list the candidate|required/desired)', txt, re.IGNORECASE))
+                    is_instr = _INSTRUCTION_TEXT_RE.search(txt) is not None
                     if is_instr or not txt:
                         parent = node.getparent()
                         parent.remove(node)
@@ -3068,10 +3489,8 @@ class WordFormatter:
                     paragraphs_to_clear.append(p)
             
             # Clear the paragraphs
-            for p in paragraphs_to_clear:
-                for r in p.runs:
-                    r.text = ''
-                removed_count += 1
+            _clear_paragraph_runs(paragraphs_to_clear)
+            removed_count += len(paragraphs_to_clear)
             
             if removed_count > 0:
                 print(f"  ✓ Removed {removed_count} instructional text paragraphs")
@@ -3168,16 +3587,8 @@ class WordFormatter:
             # Remove leading bullet chars
             t = t.lstrip('•–—-*● \t-').strip()
             # Normalize common wording
-            repl = [
-                (r'\bas well as\b', 'and'),
-                (r'\bin order to\b', 'to'),
-                (r'\bkey performance indicators\s*\(([^\)]+)\)', r'\1'),
-                (r'\bkey performance indicators\b', 'KPIs'),
-                (r'\bquickbooks\b', 'QuickBooks'),
-                (r'\bums?\s*worldship\b', 'UPS WorldShip'),
-            ]
-            for pattern, repl_to in repl:
-                t = re.sub(pattern, repl_to, t, flags=re.IGNORECASE)
+            for pattern, repl_to in _WORDING_NORMALIZATIONS:
+                t = pattern.sub(repl_to, t)
 
             t = self._shorten_text(t, max_words=max_words, max_chars=max_chars)
             t = self._normalize_acronyms(t)
@@ -3221,8 +3632,9 @@ class WordFormatter:
             t = t + '.'
         return t
     
-    def _create_replacement_map(self):
-        """Create comprehensive replacement map"""
+    @cached_property
+    def _replacement_map(self):
+        """Comprehensive placeholder replacement map (built on first use)"""
         replacements = {}
         
         # Personal information - Multiple formats
@@ -3276,8 +3688,70 @@ class WordFormatter:
             replacements['[Date of Birth]'] = self.resume_data['dob']
             replacements['<DOB>'] = self.resume_data['dob']
         
+        print(f"\n📝 Created {len(replacements)} replacement mappings")
         return replacements
     
+    @cached_property
+    def _placeholder_matcher(self):
+        """Placeholder matcher over the replacement map keys (built on first use)"""
+        return self._build_placeholder_matcher(self._replacement_map)
+    
+    def _build_placeholder_matcher(self, replacements):
+        """
+        Return a function mapping lowercased paragraph text to the set of replacement
+        keys it contains. Uses one Aho-Corasick pass when pyahocorasick is installed.
+        """
+        keys_by_lower = {}
+        for key in replacements:
+            keys_by_lower.setdefault(key.lower(), []).append(key)
+        
+        if HAS_AHOCORASICK and keys_by_lower:
+            automaton = ahocorasick.Automaton()
+            for key_lower, keys in keys_by_lower.items():
+                automaton.add_word(key_lower, keys)
+            automaton.make_automaton()
+            
+            def find(text_lower):
+                found = set()
+                for _, keys in automaton.iter(text_lower):
+                    found.update(keys)
+                return found
+            return find
+        
+        # Without the automaton, one alternation scan (longest keys first) rules out
+        # key-free text before the per-key substring checks
+        any_key = re.compile('|'.join(
+            re.escape(k) for k in sorted(keys_by_lower, key=len, reverse=True)
+        )) if keys_by_lower else None
+        
+        def find(text_lower):
+            found = set()
+            if any_key is None or not any_key.search(text_lower):
+                return found
+            for key_lower, keys in keys_by_lower.items():
+                if key_lower in text_lower:
+                    found.update(keys)
+            return found
+        return find
+    
+    def _replace_matched_placeholders(self, paragraph):
+        """Apply every replacement whose key occurs in paragraph; returns the replaced-run count"""
+        replaced = 0
+        text = paragraph.text
+        if not text.strip():
+            return replaced
+        matched_keys = self._placeholder_matcher(text.lower())
+        if not matched_keys:
+            # Most cell and header/footer paragraphs contain no key at all
+            return replaced
+        replacements = self._replacement_map
+        for key, value in replacements.items():
+            if key in matched_keys and self._text_contains(paragraph.text, key):
+                # Text changed, so later keys are checked against the new text
+                matched_keys = replacements
+                replaced += self._replace_in_paragraph(paragraph, key, value)
+        return replaced
+    
     def _text_contains(self, text, search_term):
         """Case-insensitive text search"""
         return search_term.lower() in text.lower()
@@ -3293,8 +3767,7 @@ class WordFormatter:
         for run in paragraph.runs:
             if self._text_contains(run.text, search_term):
                 # Case-insensitive replacement
-                pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-                run.text = pattern.sub(replacement, run.text)
+                run.text = _replace_literal_ci(run.text, search_term, replacement)
                 # Remove highlighting
                 try:
                     run.font.highlight_color = None
@@ -3307,13 +3780,11 @@ class WordFormatter:
         if replaced == 0 and self._text_contains(paragraph.text, search_term):
             # Text is split across runs - need to handle differently
             full_text = paragraph.text
-            pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-            new_text = pattern.sub(replacement, full_text)
+            new_text = _replace_literal_ci(full_text, search_term, replacement)
             
             if new_text != full_text:
                 # Clear all runs and add new text
-                for run in paragraph.runs:
-                    run.text = ''
+                _clear_paragraph_runs([paragraph])
                 
                 # Add replacement text to first run
                 if paragraph.runs:
@@ -3363,17 +3834,20 @@ class WordFormatter:
         return True
     
     def _regex_replace_paragraph(self, paragraph, pattern, replacement):
-        """Regex-based replacement across runs: rebuilds paragraph text, removes highlighting, preserves alignment."""
+        """Regex-based replacement across runs: rebuilds paragraph text, removes highlighting, preserves alignment.
+        pattern may be a string (matched case-insensitively) or a precompiled re/RE2 pattern."""
         try:
             # PRESERVE ALIGNMENT: Store original alignment before modification
             original_alignment = paragraph.alignment
             
             full_text = paragraph.text or ''
-            new_text = re.sub(pattern, replacement, full_text, flags=re.IGNORECASE)
+            if isinstance(pattern, str):
+                new_text = re.sub(pattern, replacement, full_text, flags=re.IGNORECASE)
+            else:
+                new_text = pattern.sub(replacement, full_text)
             if new_text != full_text:
                 # clear runs and set new_text
-                for run in paragraph.runs:
-                    run.text = ''
+                _clear_paragraph_runs([paragraph])
                 if paragraph.runs:
                     paragraph.runs[0].text = new_text
                     # CRITICAL: Remove yellow highlighting from name
@@ -3407,6 +3881,8 @@ class WordFormatter:
         print(f"\n🔍 Scanning document for sections (SUMMARY, EXPERIENCE, EDUCATION, SKILLS)...")
         print(f"  📊 Section status: Summary={self._summary_inserted}, Experience={self._experience_inserted}, Education={self._education_inserted}")
         
+        table_paras = set(doc.element.body.xpath('.//w:tbl//w:p'))
+
         # SINGLE PASS: Look for headings only (ignore placeholders to avoid duplication)
         for para_idx, paragraph in enumerate(doc.paragraphs):
             para_text = paragraph.text.upper().strip()
@@ -3432,12 +3908,7 @@ class WordFormatter:
                     print(f"  ✓ Found SUMMARY at paragraph {para_idx}: '{paragraph.text[:50]}'")
                     
                     # Clear the heading paragraph (keep only the heading text)
-                    for run in paragraph.runs:
-                        run.text = ''
-                    if paragraph.runs:
-                        paragraph.runs[0].text = 'SUMMARY'
-                        paragraph.runs[0].bold = True
-                        paragraph.runs[0].font.size = Pt(12)
+                    _rewrite_heading_runs(paragraph, 'SUMMARY', Pt(12))
                     
                     # Delete any following content before inserting new
                     self._delete_following_bullets(paragraph, max_scan=20)
@@ -3452,7 +3923,7 @@ class WordFormatter:
                             bullet_para = self._insert_paragraph_after(last_para, '')
                             if bullet_para:
                                 # No left indent for summary bullets
-                                run = bullet_para.add_run('• ' + txt.lstrip('•–—-*● '))
+                                run = bullet_para.add_run('• ' + txt.lstrip(_BULLET_LEAD_CHARS))
                                 run.font.size = Pt(10)
                                 bullet_para.paragraph_format.space_after = Pt(2)
                                 last_para = bullet_para
@@ -3473,7 +3944,7 @@ class WordFormatter:
             if (not self._experience_inserted \
                 and any(marker in para_text for marker in ['EMPLOYMENT HISTORY', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'EXPERIENCE', 'WORK HISTORY', 'CAREER HISTORY']) \
                 and len(paragraph.text.strip()) < 50 \
-                and not self._paragraph_in_table(paragraph)):
+                and paragraph._p not in table_paras):
                 experiences = self.resume_data.get('experience', [])
                 # Fallback: build structured experiences from the raw bullets beneath the heading
                 if not experiences:
@@ -3486,12 +3957,7 @@ class WordFormatter:
                     
                     # STEP 1: Clear the heading paragraph (keep only the heading text)
                     original_heading = paragraph.text.strip()
-                    for run in paragraph.runs:
-                        run.text = ''
-                    if paragraph.runs:
-                        paragraph.runs[0].text = 'EMPLOYMENT HISTORY'
-                        paragraph.runs[0].bold = True
-                        paragraph.runs[0].font.size = Pt(12)
+                    _rewrite_heading_runs(paragraph, 'EMPLOYMENT HISTORY', Pt(12))
                     
                     # STEP 2: Delete old template content only if experiences were built from fallback
                     # (Don't delete if we have structured experience from resume parser)
@@ -3720,17 +4186,18 @@ class WordFormatter:
                             break
                 
                 # Find insertion point after employment content
+                paragraphs = doc.paragraphs
                 if employment_idx is not None:
                     # Scan forward to find end of employment section
                     insertion_idx = employment_idx + 20  # Default
-                    for j in range(employment_idx + 1, min(employment_idx + 100, len(doc.paragraphs))):
-                        next_text = doc.paragraphs[j].text.strip().upper()
-                        if any(kw in next_text for kw in ['SKILLS', 'SUMMARY', 'PROJECTS', 'CERTIFICATIONS']) and len(next_text) < 50:
+                    for j in range(employment_idx + 1, min(employment_idx + 100, len(paragraphs))):
+                        next_text = paragraphs[j].text.strip().upper()
+                        if len(next_text) < 50 and _EMP_END_HEADINGS_RE.search(next_text):
                             insertion_idx = j
                             print(f"   📍 Will insert EDUCATION at paragraph {j}")
                             break
                     
-                    anchor_para = doc.paragraphs[insertion_idx] if insertion_idx < len(doc.paragraphs) else doc.paragraphs[-1]
+                    anchor_para = paragraphs[insertion_idx] if insertion_idx < len(paragraphs) else paragraphs[-1]
                 else:
                     # No employment found, use end of document
                     anchor_para = doc.paragraphs[-1]
@@ -3783,15 +4250,16 @@ class WordFormatter:
         anchor_idx = None
         
         # Try to find Education section end
-        for idx, p in enumerate(doc.paragraphs):
+        paragraphs = doc.paragraphs
+        for idx, p in enumerate(paragraphs):
             if 'EDUCATION' in (p.text or '').upper() and len(p.text.strip()) < 50:
                 # Found education heading, scan forward to find end of section
-                for j in range(idx + 1, min(idx + 50, len(doc.paragraphs))):
-                    next_p = doc.paragraphs[j]
+                for j in range(idx + 1, min(idx + 50, len(paragraphs))):
+                    next_p = paragraphs[j]
                     next_text = (next_p.text or '').strip().upper()
                     # Stop at next major section
-                    if any(h in next_text for h in ['SKILLS', 'CERTIFICATES', 'PROJECTS', 'LANGUAGES', 'REFERENCES']) and len(next_text) < 50:
-                        anchor_para = doc.paragraphs[j - 1]
+                    if len(next_text) < 50 and _EDU_END_HEADINGS_RE.search(next_text):
+                        anchor_para = paragraphs[j - 1]
                         anchor_idx = j - 1
                         break
                 if anchor_para:
@@ -3870,7 +4338,7 @@ class WordFormatter:
                 for cert in certificates:
                     bullet_para = self._insert_paragraph_after(last_para, '')
                     if bullet_para:
-                        run = bullet_para.add_run('• ' + cert.lstrip('•–—-*● '))
+                        run = bullet_para.add_run('• ' + cert.lstrip(_BULLET_LEAD_CHARS))
                         run.font.size = Pt(10)
                         bullet_para.paragraph_format.space_after = Pt(2)
                         bullet_para.paragraph_format.left_indent = Inches(0.25)
@@ -3907,7 +4375,7 @@ class WordFormatter:
                 for proj in projects:
                     bullet_para = self._insert_paragraph_after(last_para, '')
                     if bullet_para:
-                        run = bullet_para.add_run('• ' + proj.lstrip('•–—-*● '))
+                        run = bullet_para.add_run('• ' + proj.lstrip(_BULLET_LEAD_CHARS))
                         run.font.size = Pt(10)
                         bullet_para.paragraph_format.space_after = Pt(2)
                         bullet_para.paragraph_format.left_indent = Inches(0.25)
@@ -4183,10 +4651,11 @@ class WordFormatter:
         # Join all potential headers
         all_headers = ' '.join(header_texts)
         
-        print(f"       🔍 Table has {len(table.rows)} rows, {len(table.columns)} columns")
-        print(f"       🔍 First row cells: {[cell.text.strip() for cell in table.rows[0].cells]}")
-        print(f"       🔍 All header candidates: {header_texts[:6]}")  # Show first 6
-        print(f"       🔍 Combined text: '{all_headers[:100]}'")  # First 100 chars
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Table has {len(table.rows)} rows, {len(table.columns)} columns")
+            logger.debug(f"🔍 First row cells: {[cell.text.strip() for cell in table.rows[0].cells]}")
+            logger.debug(f"🔍 All header candidates: {header_texts[:6]}")  # Show first 6
+            logger.debug(f"🔍 Combined text: '{all_headers[:100]}'")  # First 100 chars
         
         # Check for skills table indicators - VERY FLEXIBLE
         skills_keywords = ['skill', 'skills', 'technology', 'technologies', 'competency', 'competencies', 
@@ -4202,11 +4671,12 @@ class WordFormatter:
         # Also check if table has exactly 3 columns (Skill, Years, Last Used pattern)
         has_three_cols = len(table.columns) == 3
         
-        print(f"       📊 Detection results:")
-        print(f"          - Has 3 columns: {has_three_cols} (actual: {len(table.columns)})")
-        print(f"          - Has skill column: {has_skill_col}")
-        print(f"          - Has years column: {has_years_col}")
-        print(f"          - Has last_used column: {has_last_used_col}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📊 Detection results:")
+            logger.debug(f"- Has 3 columns: {has_three_cols} (actual: {len(table.columns)})")
+            logger.debug(f"- Has skill column: {has_skill_col}")
+            logger.debug(f"- Has years column: {has_years_col}")
+            logger.debug(f"- Has last_used column: {has_last_used_col}")
         
         # It's a skills table if:
         # 1. Has skill keyword AND (years OR last_used keyword)
@@ -4422,7 +4892,8 @@ class WordFormatter:
             
             filled_count += 1
             if filled_count <= 3:
-                print(f"        ✓ Added: {skill_name}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"✓ Added: {skill_name}")
         
         print(f"     ✅ Successfully filled {filled_count} skill rows")
         return filled_count
@@ -4482,7 +4953,7 @@ class WordFormatter:
                 parts = re.split(r',\s*(?:and\s+)?', cleaned_text)
                 for part in parts:
                     # Clean each part
-                    part = part.strip().lstrip('•–—-*● ')
+                    part = part.strip().lstrip(_BULLET_LEAD_CHARS)
                     # Remove action verbs at start
                     part = re.sub(r'^(using|creating|updating|managing|implementing|configuring|analyzing|monitoring|troubleshooting)\s+', '', part, flags=re.IGNORECASE)
                     # Remove trailing descriptive phrases
@@ -5708,16 +6179,18 @@ class WordFormatter:
         if self._primary_anchors.get('EDUCATION'):
             edu_idx = self._primary_anchors['EDUCATION']
             # Find end of education section
-            for i in range(edu_idx + 1, len(doc.paragraphs)):
-                para_text = doc.paragraphs[i].text.strip().upper()
+            paragraphs = doc.paragraphs
+            for i in range(edu_idx + 1, len(paragraphs)):
+                para_text = paragraphs[i].text.strip().upper()
                 if len(para_text) < 50 and any(h in para_text for h in ['CERTIFICATIONS', 'PROJECTS', 'AWARDS', 'REFERENCES']):
                     insertion_point = i
                     break
         elif self._primary_anchors.get('EMPLOYMENT'):
             emp_idx = self._primary_anchors['EMPLOYMENT']
             # Find end of employment section
-            for i in range(emp_idx + 1, len(doc.paragraphs)):
-                para_text = doc.paragraphs[i].text.strip().upper()
+            paragraphs = doc.paragraphs
+            for i in range(emp_idx + 1, len(paragraphs)):
+                para_text = paragraphs[i].text.strip().upper()
                 if len(para_text) < 50 and any(h in para_text for h in ['EDUCATION', 'SKILLS', 'CERTIFICATIONS']):
                     insertion_point = i
                     break
@@ -5839,10 +6312,11 @@ class WordFormatter:
         if 'EDUCATION' not in existing_sections and 'EMPLOYMENT' in existing_sections:
             employment_idx = existing_sections['EMPLOYMENT']
             # Check 5 paragraphs after EMPLOYMENT for EDUCATION heading
+            paragraphs = doc.paragraphs
             for offset in range(1, 6):
                 check_idx = employment_idx + offset
-                if check_idx < len(doc.paragraphs):
-                    check_text = doc.paragraphs[check_idx].text.strip().upper()
+                if check_idx < len(paragraphs):
+                    check_text = paragraphs[check_idx].text.strip().upper()
                     if 'EDUCATION' in check_text and len(check_text) < 300:  # Allow longer text for templates
                         existing_sections['EDUCATION'] = check_idx
                         print(f"    🔍 Found EDUCATION section at paragraph {check_idx}: '{check_text[:50]}' (detected after EMPLOYMENT)")
@@ -5993,13 +6467,14 @@ class WordFormatter:
         """Find the best place to insert missing sections - AFTER Employment History"""
         # PRIORITY 1: Find EMPLOYMENT HISTORY section and insert after it
         employment_end = None
-        for para_idx, para in enumerate(doc.paragraphs):
+        paragraphs = doc.paragraphs
+        for para_idx, para in enumerate(paragraphs):
             text = para.text.strip().upper()
             if any(keyword in text for keyword in ['EMPLOYMENT HISTORY', 'WORK HISTORY', 'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT']):
                 if len(text) < 50:  # Likely a heading
                     # Scan forward to find the end of employment section
-                    for j in range(para_idx + 1, min(para_idx + 100, len(doc.paragraphs))):
-                        next_text = doc.paragraphs[j].text.strip().upper()
+                    for j in range(para_idx + 1, min(para_idx + 100, len(paragraphs))):
+                        next_text = paragraphs[j].text.strip().upper()
                         # Stop at next major section
                         if any(kw in next_text for kw in ['EDUCATION', 'SKILLS', 'SUMMARY', 'PROJECTS', 'CERTIFICATIONS']) and len(next_text) < 50:
                             employment_end = j
@@ -6245,12 +6720,13 @@ class WordFormatter:
         insertion_point = len(doc.paragraphs) - 1
         
         # Look for better insertion point (after education or skills if they exist)
+        paragraphs = doc.paragraphs
         for section_name in ['EDUCATION', 'SKILLS', 'EMPLOYMENT']:
             section_idx = self._primary_anchors.get(section_name)
             if section_idx is not None:
                 # Find end of this section's content
-                for i in range(section_idx + 1, len(doc.paragraphs)):
-                    para_text = doc.paragraphs[i].text.strip().upper()
+                for i in range(section_idx + 1, len(paragraphs)):
+                    para_text = paragraphs[i].text.strip().upper()
                     if len(para_text) < 50 and any(h in para_text for h in ['CERTIFICATIONS', 'PROJECTS', 'AWARDS']):
                         insertion_point = i
                         break
@@ -6480,8 +6956,9 @@ class WordFormatter:
         last_content_idx = len(doc.paragraphs) - 1
         
         # Scan backwards to find last paragraph with actual content
-        for idx in range(len(doc.paragraphs) - 1, -1, -1):
-            para = doc.paragraphs[idx]
+        paragraphs = doc.paragraphs
+        for idx in range(len(paragraphs) - 1, -1, -1):
+            para = paragraphs[idx]
             text = para.text.strip()
             
             # Skip empty paragraphs
@@ -6528,27 +7005,28 @@ class WordFormatter:
             protected_indices = set()
             
             # Protect sections by name
+            paragraphs = doc.paragraphs
             if hasattr(self, '_protected_sections'):
-                for idx, para in enumerate(doc.paragraphs):
+                for idx, para in enumerate(paragraphs):
                     text = (para.text or '').strip().upper()
                     for section in self._protected_sections:
                         if section.upper() in text and len(text) < 50:
                             # Protect this paragraph and next 10
-                            for j in range(idx, min(idx + 10, len(doc.paragraphs))):
+                            for j in range(idx, min(idx + 10, len(paragraphs))):
                                 protected_indices.add(j)
                             break
             
             # Protect specific ranges
             if hasattr(self, '_protected_ranges'):
                 for start, end in self._protected_ranges:
-                    for j in range(start, min(end, len(doc.paragraphs))):
+                    for j in range(start, min(end, len(paragraphs))):
                         protected_indices.add(j)
             
             paragraphs_to_remove = []
             prev_was_empty = False
             prev_was_section = False
             
-            for idx, para in enumerate(doc.paragraphs):
+            for idx, para in enumerate(paragraphs):
                 # Skip protected paragraphs
                 if idx in protected_indices:
                     prev_was_empty = False
@@ -6610,18 +7088,19 @@ class WordFormatter:
         print(f"    Original resume content lines: {original_lines}")
         print(f"    Content preservation verification complete")
     
-    def _convert_to_pdf(self, docx_path, pdf_path):
+    @classmethod
+    def _convert_to_pdf(cls, docx_path, pdf_path):
         """Convert DOCX to PDF"""
         try:
             if HAS_WIN32:
                 # Use Word COM to convert
-                word = win32com.client.Dispatch("Word.Application")
-                word.Visible = False
-                
-                doc = word.Documents.Open(os.path.abspath(docx_path))
-                doc.SaveAs2(os.path.abspath(pdf_path), FileFormat=17)  # 17 = PDF format
-                doc.Close()
-                word.Quit()
+                word = cls._acquire_word()
+                try:
+                    doc = word.Documents.Open(os.path.abspath(docx_path))
+                    doc.SaveAs2(os.path.abspath(pdf_path), FileFormat=17)  # 17 = PDF format
+                    doc.Close()
+                finally:
+                    cls._release_word()
                 
                 return True
             else:
@@ -6637,3 +7116,14 @@ def format_word_document(resume_data, template_analysis, output_path):
     """Main function for Word document formatting"""
     formatter = WordFormatter(resume_data, template_analysis, output_path)
     return formatter.format()
+
+
+def format_word_documents(jobs, max_workers=None):
+    """Batch Word document formatting; jobs are (resume_data, template_analysis, output_path)"""
+    return WordFormatter.format_many(jobs, max_workers=max_workers)
+
+
+def _format_docx_job(resume_data, template_analysis, docx_path):
+    """Process-pool worker for format_many: python-docx phase only, writes a .docx.
+    Built without the ML section detector, so no worker cold-loads the sentence-embedding model"""
+    return WordFormatter(resume_data, template_analysis, docx_path, use_ml=False).format()